@@ -13,6 +13,7 @@ from piso.intervalarray import (
     symmetric_difference,
     union,
 )
+from piso.intervalset import IntervalSet, MutableIntervalSet
 from piso.ndframe import join, lookup
 
 
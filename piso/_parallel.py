@@ -0,0 +1,128 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from piso import _sweep
+from piso.util import _n_workers
+
+
+def _share(array):
+    # copies array into a new block of shared memory
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _cuts(points, n_partitions):
+    # positions (into points) of values which divide points into partitions with similar numbers of endpoints
+    ks = len(points) * np.arange(1, n_partitions) // n_partitions
+    ks = ks[(ks > 0) & (ks < len(points))]
+    if len(ks) == 0:
+        return ks
+    cuts = np.argpartition(points, ks)[ks]
+    _, first = np.unique(points[cuts], return_index=True)
+    return cuts[first]
+
+
+def _partition_segments(
+    specs, lower, upper, n_operands, normalized, operation, min_overlaps
+):
+    # the result of the set operation restricted to the partition between lower and upper, each of which is
+    # None (unbounded) or the position, and value, of an endpoint.  Intervals which straddle the bounds are clipped.
+    # Positions are returned as per _sweep._segments, into the endpoints of all intervals.
+    blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in specs]
+    try:
+        lefts, rights, operands = (
+            np.ndarray(shape, dtype=dtype, buffer=block.buf)
+            for block, (_, shape, dtype) in zip(blocks, specs)
+        )
+        n = len(lefts)
+        in_partition = np.ones(n, dtype=bool)
+        if lower is not None:
+            in_partition &= rights > lower[1]
+        if upper is not None:
+            in_partition &= lefts < upper[1]
+        index = np.flatnonzero(in_partition)
+        partition_lefts, partition_rights = lefts[index], rights[index]
+        left_positions, right_positions = index, index + n
+        if lower is not None:
+            clipped = partition_lefts < lower[1]
+            partition_lefts[clipped] = lower[1]
+            left_positions = np.where(clipped, lower[0], left_positions)
+        if upper is not None:
+            clipped = partition_rights > upper[1]
+            partition_rights[clipped] = upper[1]
+            right_positions = np.where(clipped, upper[0], right_positions)
+        sizes = np.bincount(operands[index], minlength=n_operands)
+        del lefts, rights, operands
+    finally:
+        for block in blocks:
+            block.close()
+    starts, ends = _sweep._segments(
+        partition_lefts,
+        partition_rights,
+        sizes,
+        normalized,
+        operation,
+        min_overlaps,
+    )
+    positions = np.concatenate([left_positions, right_positions])
+    return positions[starts], positions[ends]
+
+
+def _segments(lefts, rights, sizes, normalized, operation, min_overlaps, n_jobs):
+    # as per _sweep._segments, but with the domain divided into partitions, with similar numbers of endpoints, whose
+    # results are computed in a pool of n_jobs processes.  Results which meet at a cut between partitions are joined.
+    n_jobs = _n_workers(n_jobs)
+    lefts, rights = _sweep._sortable(lefts), _sweep._sortable(rights)
+    points = np.concatenate([lefts, rights])
+    cuts = _cuts(points, n_jobs)
+    if len(cuts) == 0:
+        return _sweep._segments(
+            lefts, rights, sizes, normalized, operation, min_overlaps, n_jobs
+        )
+    positions = None
+    if operation != "union" and len(sizes) > 1:
+        # operands are normalized up front, in a pool of threads, so partitions only merge sorted runs.
+        # Clipping a sorted, disjoint operand to a partition leaves it sorted and disjoint.
+        positions, operands = _sweep._runs(lefts, rights, sizes, normalized, n_jobs)
+        positions = positions.reshape(-1, 2)
+        lefts, rights = points[positions[:, 0]], points[positions[:, 1]]
+        sizes = np.bincount(operands[::2], minlength=len(sizes))
+        normalized = [True] * len(sizes)
+        positions = positions.T.ravel()
+        points = np.concatenate([lefts, rights])
+        cuts = _cuts(points, n_jobs)
+    bounds = [None] + [(cut, points[cut]) for cut in cuts] + [None]
+    operands = np.repeat(np.arange(len(sizes)), sizes)
+    shared = [_share(array) for array in (lefts, rights, operands)]
+    try:
+        specs = [spec for _, spec in shared]
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [
+                executor.submit(
+                    _partition_segments,
+                    specs,
+                    lower,
+                    upper,
+                    len(sizes),
+                    normalized,
+                    operation,
+                    min_overlaps,
+                )
+                for lower, upper in zip(bounds[:-1], bounds[1:])
+            ]
+            results = [future.result() for future in futures]
+    finally:
+        for shm, _ in shared:
+            shm.close()
+            shm.unlink()
+    starts, ends = (np.concatenate(result) for result in zip(*results))
+    if len(starts) > 0:
+        joined = points[ends[:-1]] == points[starts[1:]]
+        starts, ends = starts[np.append(True, ~joined)], ends[np.append(~joined, True)]
+    if positions is not None:
+        # map positions into the normalized operands back to positions into the original endpoints
+        starts, ends = positions[starts], positions[ends]
+    return starts, ends
@@ -0,0 +1,495 @@
+import numpy as np
+import pandas as pd
+
+from piso.util import _thread_map
+
+
+def _sortable(values):
+    # datetime64 and timedelta64 are sorted much faster when viewed as integers
+    values = np.asarray(values)
+    if values.dtype.kind in "mM":
+        return values.view("i8")
+    return values
+
+
+def _from_sortable(values, dtype):
+    # inverse of _sortable, for an Index of the given dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return (
+            pd.DatetimeIndex(values.view(f"M8[{dtype.unit}]"))
+            .tz_localize("UTC")
+            .tz_convert(dtype.tz)
+        )
+    return pd.Index(values.view(dtype))
+
+
+def _to_sortable(values, dtype):
+    return _sortable(pd.Index(values).astype(dtype).values)
+
+
+def _common_dtype(*dtypes):
+    # the dtype to which endpoints of all the given dtypes can be cast without loss, as per Index.append
+    dtype = (
+        pd.Index([], dtype=dtypes[0])
+        .append([pd.Index([], dtype=other) for other in dtypes[1:]])
+        .dtype
+    )
+    if dtype.kind not in "iufMm":
+        raise ValueError(
+            f"Endpoints must be numeric, datetime or timedelta.  Found {', '.join(map(str, dtypes))}."
+        )
+    return dtype
+
+
+def _union(lefts, rights, groups=None):
+    # lefts and rights are 1D arrays of interval endpoints, and need not be sorted
+    # returns positions of the union's left endpoints (into lefts) and right endpoints (into rights)
+    # if the k-th smallest right endpoint is less than the (k+1)-th smallest left endpoint then
+    # exactly k+1 intervals have started and finished before the gap between them.  If groups, an array
+    # of integer labels, is given then the union of each group is taken, and the results ordered by group.
+    if len(lefts) == 0:
+        return np.array([], dtype=int), np.array([], dtype=int)
+    lefts, rights = _sortable(lefts), _sortable(rights)
+    if groups is None:
+        left_order = np.argsort(lefts)
+        right_order = np.argsort(rights)
+        gaps = rights[right_order[:-1]] < lefts[left_order[1:]]
+    else:
+        left_order = np.lexsort((lefts, groups))
+        right_order = np.lexsort((rights, groups))
+        gaps = (rights[right_order[:-1]] < lefts[left_order[1:]]) | (
+            groups[left_order[1:]] != groups[left_order[:-1]]
+        )
+    starts = left_order[np.append(True, gaps)]
+    ends = right_order[np.append(gaps, True)]
+    return starts, ends
+
+
+def _bridge(lefts, rights, thresholds, groups=None):
+    # merges the intervals of the union (of each group) which are separated by a gap no larger than the threshold.
+    # thresholds is a scalar, or an array with a threshold for each group.  Positions are returned as per _union.
+    starts, ends = _union(lefts, rights, groups)
+    if len(starts) == 0:
+        return starts, ends
+    lefts, rights = _sortable(lefts), _sortable(rights)
+    gaps = lefts[starts[1:]] - rights[ends[:-1]]
+    if groups is not None:
+        start_groups = groups[starts]
+        if np.ndim(thresholds):
+            thresholds = thresholds[start_groups[1:]]
+        breaks = (gaps > thresholds) | (start_groups[1:] != start_groups[:-1])
+    else:
+        breaks = gaps > thresholds
+    return starts[np.append(True, breaks)], ends[np.append(breaks, True)]
+
+
+def _is_sorted_and_disjoint(lefts, rights, strict=False):
+    # if strict then adjacent intervals are not considered disjoint
+    compare = np.less if strict else np.less_equal
+    return bool(np.all(compare(rights[:-1], lefts[1:])))
+
+
+def _disjoint(lefts, rights, normalized=False):
+    # positions of sorted, disjoint intervals whose union is equal to the union of the input
+    if normalized or _is_sorted_and_disjoint(lefts, rights):
+        positions = np.arange(len(lefts))
+        return positions, positions
+    return _union(lefts, rights)
+
+
+def _is_disjoint(lefts, rights, strict=False):
+    # whether the intervals are pairwise disjoint.  Sorting is skipped, and the cost is O(n), if the intervals
+    # are already sorted by left endpoint.
+    lefts, rights = _sortable(lefts), _sortable(rights)
+    if np.any(lefts[1:] < lefts[:-1]):
+        order = np.argsort(lefts, kind="stable")
+        lefts, rights = lefts[order], rights[order]
+    return _is_sorted_and_disjoint(lefts, rights, strict)
+
+
+def _operands_disjoint(lefts, rights, sizes, normalized, block_size=2**16):
+    # whether the operands (stored as per _runs) are mutually disjoint, ie no point is covered by two of them.
+    # Each operand is reduced to sorted, disjoint intervals and the domain is then swept in blocks, with
+    # boundaries taken from the largest operand.  The intervals from each operand which overlap a block are
+    # found with a binary search and merged, and the sweep stops at the first block containing an overlap.
+    # Only the merge stops early: operands which are not known to be normalized are sorted in full first,
+    # as an overlap cannot be ruled out anywhere without sorting them.
+    lefts, rights = _sortable(lefts), _sortable(rights)
+    offsets = np.cumsum(sizes) - sizes
+    operand_lefts, operand_rights = [], []
+    for offset, size, is_normalized in zip(offsets, sizes, normalized):
+        operand_slice = slice(offset, offset + size)
+        starts, ends = _disjoint(
+            lefts[operand_slice], rights[operand_slice], is_normalized
+        )
+        operand_lefts.append(lefts[operand_slice][starts])
+        operand_rights.append(rights[operand_slice][ends])
+    largest = max(range(len(sizes)), key=lambda i: len(operand_lefts[i]))
+    boundaries = [None, *operand_lefts[largest][block_size::block_size], None]
+    for block_start, block_end in zip(boundaries[:-1], boundaries[1:]):
+        block_lefts, block_rights = [], []
+        for operand_left, operand_right in zip(operand_lefts, operand_rights):
+            lo = (
+                0
+                if block_start is None
+                else np.searchsorted(operand_right, block_start, side="right")
+            )
+            hi = (
+                len(operand_left)
+                if block_end is None
+                else np.searchsorted(operand_left, block_end, side="left")
+            )
+            block_lefts.append(operand_left[lo:hi])
+            block_rights.append(operand_right[lo:hi])
+        if not _is_disjoint(np.concatenate(block_lefts), np.concatenate(block_rights)):
+            return False
+    return True
+
+
+def _in_any(lefts, rights, other_lefts, other_rights):
+    # lefts and rights are sorted, disjoint and non-adjacent intervals.  For each of the other intervals,
+    # whether it is contained in one of them - the last interval starting no later than it.
+    if len(lefts) == 0:
+        return np.zeros(len(other_lefts), dtype=bool)
+    candidates = np.searchsorted(lefts, other_lefts, side="right") - 1
+    return (candidates >= 0) & (rights[np.maximum(candidates, 0)] >= other_rights)
+
+
+def _count_within(lefts, rights, other_lefts, other_rights):
+    # lefts and rights are sorted, disjoint intervals.  For each of the other intervals, the number of
+    # intervals it contains.
+    counts = np.searchsorted(rights, other_rights, side="right") - np.searchsorted(
+        lefts, other_lefts, side="left"
+    )
+    return np.maximum(counts, 0)
+
+
+def _covered_lengths(lefts, rights, other_lefts, other_rights):
+    # lefts and rights are sorted, disjoint intervals.  For each of the other intervals, the length of it which
+    # they cover.  The covered length up to a point is the prefix sum of the lengths of the intervals starting
+    # before it, found with a binary search, plus the part of the last such interval which precedes the point.
+    if len(lefts) == 0:
+        return np.zeros(len(other_lefts), dtype=np.result_type(lefts, other_lefts))
+    lengths = rights - lefts
+    cumulative = np.cumsum(lengths) - lengths
+
+    def covered_before(x):
+        last = np.maximum(np.searchsorted(lefts, x, side="right") - 1, 0)
+        return cumulative[last] + np.clip(x - lefts[last], 0, lengths[last])
+
+    return covered_before(other_rights) - covered_before(other_lefts)
+
+
+def _runs(lefts, rights, sizes, normalized, n_jobs=None):
+    # lefts and rights hold the endpoints of several operands, stored consecutively with lengths given by sizes
+    # each operand is reduced to sorted, disjoint intervals (if it is not already) whose interleaved endpoints
+    # form a sorted run.  Returns the runs, concatenated, as positions into the concatenation of lefts and rights
+    # together with the index of the operand each position belongs to.  The normalized parameter is a list of
+    # booleans indicating which operands are already known to be sorted and disjoint.  Operands are independent,
+    # so are reduced in a pool of n_jobs threads, if n_jobs is specified.
+    lefts, rights = _sortable(lefts), _sortable(rights)
+    offsets = np.cumsum(sizes) - sizes
+
+    def run(offset, size, is_normalized):
+        starts, ends = _disjoint(
+            lefts[offset : offset + size],
+            rights[offset : offset + size],
+            is_normalized,
+        )
+        return np.column_stack([starts + offset, ends + offset + len(lefts)])
+
+    runs = _thread_map(run, offsets, sizes, normalized, n_jobs=n_jobs)
+    operands = np.repeat(np.arange(len(runs)), [2 * len(r) for r in runs])
+    return np.concatenate(runs).ravel(), operands
+
+
+def _depth(points, deltas, runs=False, groups=None):
+    # points are interval endpoints, and deltas +1 for left endpoints and -1 for right endpoints
+    # (deltas may be 2D, with one column per counter).  Returns the positions (into points) of the distinct
+    # breakpoints in sorted order, and the number of intervals overlapping the region immediately to the right.
+    # If points is a concatenation of sorted runs then a stable sort (timsort) merges them in O(N log k).
+    # If groups, an array of integer labels, is given then breakpoints are ordered by group, then value.  The
+    # deltas of each group sum to zero, so a single cumulative sum gives the depth within every group.
+    points = _sortable(points)
+    if groups is None:
+        order = np.argsort(points, kind="stable" if runs else None)
+    else:
+        order = np.lexsort((points, groups))
+    sorted_points = points[order]
+    last_of_group = np.ones(len(points), dtype=bool)
+    last_of_group[:-1] = sorted_points[1:] != sorted_points[:-1]
+    if groups is not None:
+        sorted_groups = groups[order]
+        last_of_group[:-1] |= sorted_groups[1:] != sorted_groups[:-1]
+    depth = np.cumsum(deltas[order], axis=0)
+    return order[last_of_group], depth[last_of_group]
+
+
+def _mask_to_segments(positions, mask):
+    # mask indicates, for each breakpoint, whether the region to its right belongs to the result
+    changes = np.diff(mask.astype(np.int8), prepend=np.int8(0))
+    return positions[changes == 1], positions[changes == -1]
+
+
+def _segments(
+    lefts, rights, sizes, normalized, operation, min_overlaps=None, n_jobs=None
+):
+    # the result of a set operation on several operands, whose endpoints are stored as per _runs.  Returns positions
+    # (into the concatenation of lefts and rights) of the starts and ends of the result's intervals.  This is the
+    # sweep line analogue of summing step functions, with the depth split into two columns for a difference:
+    # the first operand, and the remainder.
+    if operation == "union":
+        starts, ends = _union(lefts, rights)
+        return starts, ends + len(lefts)
+    points = np.concatenate([_sortable(lefts), _sortable(rights)])
+    if len(sizes) == 1:
+        positions = np.arange(len(points))
+        operands = np.zeros(len(points), dtype=int)
+    else:
+        positions, operands = _runs(lefts, rights, sizes, normalized, n_jobs)
+    deltas = np.where(positions < len(lefts), 1, -1)
+    if operation == "difference":
+        deltas = np.column_stack([deltas * (operands == 0), deltas * (operands != 0)])
+    breakpoints, depth = _depth(points[positions], deltas, runs=len(sizes) > 1)
+    if operation == "intersection":
+        mask = depth >= min_overlaps
+    elif operation == "difference":
+        mask = (depth[:, 0] > 0) & (depth[:, 1] == 0)
+    elif min_overlaps == 2:  # symmetric difference
+        mask = depth == 1
+    else:
+        mask = (depth >= 1) & (depth <= min_overlaps - 1)
+    return _mask_to_segments(positions[breakpoints], mask)
+
+
+def _grouped_intersection(lefts, rights, groups, min_overlaps):
+    # the regions, in each group, overlapped by at least min_overlaps intervals of the group.  min_overlaps is a
+    # scalar, or an array with a value for each group.  Positions are returned as per _segments, ordered by group.
+    # If groups is None then all intervals belong to a single group.
+    points = np.concatenate([_sortable(lefts), _sortable(rights)])
+    deltas = np.repeat([1, -1], len(lefts))
+    point_groups = None if groups is None else np.concatenate([groups, groups])
+    breakpoints, depth = _depth(points, deltas, groups=point_groups)
+    if np.ndim(min_overlaps):
+        min_overlaps = min_overlaps[point_groups[breakpoints]]
+    return _mask_to_segments(breakpoints, depth >= min_overlaps)
+
+
+def _grouped_domain_depth(
+    lefts, rights, groups, domain_lefts, domain_rights, domain_groups
+):
+    # intervals, and the domains they lie in, are both partitioned into groups.  Returns the sortable values of all
+    # endpoints (lefts, rights, domain_lefts then domain_rights), the positions of the breakpoints into them, ordered
+    # by group then value, the group of each breakpoint, and the depth of the intervals (first column) and of the
+    # domains (second column) immediately to its right.  If groups and domain_groups are None then there is a
+    # single group, and breakpoint groups are not returned.
+    n, m = len(lefts), len(domain_lefts)
+    points = np.concatenate(
+        [_sortable(values) for values in (lefts, rights, domain_lefts, domain_rights)]
+    )
+    deltas = np.zeros((2 * (n + m), 2), dtype=int)
+    deltas[:n, 0], deltas[n : 2 * n, 0] = 1, -1
+    deltas[2 * n : 2 * n + m, 1], deltas[2 * n + m :, 1] = 1, -1
+    if groups is None:
+        breakpoints, depth = _depth(points, deltas)
+        return points, breakpoints, None, depth
+    point_groups = np.concatenate([groups, groups, domain_groups, domain_groups])
+    breakpoints, depth = _depth(points, deltas, groups=point_groups)
+    return points, breakpoints, point_groups[breakpoints], depth
+
+
+def _grouped_complement(*args):
+    # the regions of each group's domain not covered by the group's intervals.  Arguments are as per
+    # _grouped_domain_depth, and positions are returned into the concatenation of all endpoints.
+    _, breakpoints, _, depth = _grouped_domain_depth(*args)
+    return _mask_to_segments(breakpoints, (depth[:, 1] > 0) & (depth[:, 0] == 0))
+
+
+def _grouped_coverage(*args):
+    # the length of each group's domain, and the length of it covered by the group's intervals, as arrays indexed
+    # by group.  Arguments are as per _grouped_domain_depth, and every group must contain an interval or domain.
+    points, breakpoints, breakpoint_groups, depth = _grouped_domain_depth(*args)
+    if len(breakpoints) == 0:
+        return np.array([], dtype=points.dtype), np.array([], dtype=points.dtype)
+    # the depth after the last breakpoint of a group is zero, so the region which follows it is never counted
+    lengths = np.append(np.diff(points[breakpoints]), 0)
+    in_domain = depth[:, 1] > 0
+    if breakpoint_groups is None:
+        first_of_group = np.array([0])
+    else:
+        first_of_group = np.flatnonzero(
+            np.append(True, breakpoint_groups[1:] != breakpoint_groups[:-1])
+        )
+    covered = np.add.reduceat(lengths * (in_domain & (depth[:, 0] > 0)), first_of_group)
+    return covered, np.add.reduceat(lengths * in_domain, first_of_group)
+
+
+def _count_containing(starts, ends, x, closed):
+    # for each point in x, the number of intervals which contain it
+    nonempty = (starts != ends) | (closed == "both")
+    n_started = np.searchsorted(
+        np.sort(starts[nonempty]),
+        x,
+        side="right" if closed in ("left", "both") else "left",
+    )
+    n_ended = np.searchsorted(
+        np.sort(ends[nonempty]),
+        x,
+        side="left" if closed in ("right", "both") else "right",
+    )
+    return n_started - n_ended
+
+
+def _contained_ranges(starts, ends, sorted_x, closed):
+    # for each interval, the range of positions in sorted_x of the points it contains
+    # (the range is empty when the first value is not smaller than the second)
+    lo = np.searchsorted(
+        sorted_x, starts, side="left" if closed in ("left", "both") else "right"
+    )
+    hi = np.searchsorted(
+        sorted_x, ends, side="right" if closed in ("right", "both") else "left"
+    )
+    return lo, hi
+
+
+def _count_contained(starts, ends, x, closed):
+    # for each interval, the number of points in x which it contains (negative values imply zero)
+    lo, hi = _contained_ranges(starts, ends, np.sort(x), closed)
+    return hi - lo
+
+
+def _expand_ranges(lo, hi):
+    # concatenates the ranges lo[i], ..., hi[i] - 1, returning the range each value belongs to and the values
+    counts = np.maximum(hi - lo, 0)
+    groups = np.repeat(np.arange(len(lo)), counts)
+    offsets = np.repeat(np.cumsum(counts) - counts - lo, counts)
+    return groups, np.arange(len(groups)) - offsets
+
+
+def _contained_pairs(starts, ends, x, closed):
+    # the (interval position, point position) pairs for which the interval contains the point
+    # pairs are ordered by interval, and by value of the point.  Cost is O((n + m) log m + number of pairs)
+    x_order = np.argsort(x, kind="stable")
+    lo, hi = _contained_ranges(starts, ends, x[x_order], closed)
+    interval_positions, sorted_x_positions = _expand_ranges(lo, hi)
+    return interval_positions, x_order[sorted_x_positions]
+
+
+def _intersecting_pairs(lefts, rights, closed):
+    # pairs of positions (i, j), i != j, for which the intervals intersect - in both orders, sorted by i then j
+    # candidates are found by sorting on left endpoints: an interval can only intersect those intervals that
+    # follow it in this order whose left endpoint does not exceed its right endpoint.  Cost is O(n log n + E).
+    lefts, rights = _sortable(lefts), _sortable(rights)
+    order = np.argsort(lefts, kind="stable")
+    hi = np.searchsorted(
+        lefts[order], rights[order], side="right" if closed == "both" else "left"
+    )
+    first, second = _expand_ranges(np.arange(1, len(order) + 1), hi)
+    first, second = order[first], order[second]
+    # exact test, as candidates may include degenerate intervals which share a left endpoint
+    keep = (rights[first] > lefts[second]) & (lefts[first] < rights[second])
+    if closed == "both":
+        keep |= (rights[first] == lefts[second]) | (lefts[first] == rights[second])
+    first, second = first[keep], second[keep]
+    rows = np.concatenate([first, second])
+    cols = np.concatenate([second, first])
+    edge_order = np.lexsort((cols, rows))
+    return rows[edge_order], cols[edge_order]
+
+
+def _set_adjacency(lefts, rights, set_ids, n_sets, closed, chunk_size=2**14):
+    # for each pair of sets, whether an interval of one intersects an interval of the other, with the same
+    # semantics as the pairwise test in piso.graph.  Every intersecting pair of intervals has one which starts
+    # within the other, so the left endpoints are sorted once, and each interval claims the range of sorted
+    # positions of the intervals starting within it.  Unless closed is "both", degenerate intervals are sorted
+    # before other intervals with the same left endpoint, so that they only start within intervals strictly
+    # containing them.  The ranges of each set are merged, and the positions are then swept in chunks, keeping
+    # the sets whose ranges cover the current position as a bitmask which is toggled at the ends of ranges.
+    # The bitmasks at the positions of each set are accumulated, so memory is O(n + k**2) for k sets.
+    lefts, rights = _sortable(lefts), _sortable(rights)
+    n_words = -(-n_sets // 64)
+    covers = np.zeros((n_sets, n_words), dtype=np.uint64)
+    if len(lefts) > 0:
+        if closed == "both":
+            order = np.argsort(lefts)
+            sorted_lefts = lefts[order]
+            starts = np.searchsorted(sorted_lefts, lefts, side="left")
+            ends = np.searchsorted(sorted_lefts, rights, side="right")
+        else:
+            degenerate = lefts == rights
+            order = np.lexsort((~degenerate, lefts))
+            sorted_lefts = lefts[order]
+            points = np.sort(lefts[degenerate])
+            starts = np.searchsorted(sorted_lefts, lefts, side="left")
+            starts += np.searchsorted(points, lefts, side="right")
+            starts -= np.searchsorted(points, lefts, side="left")
+            ends = np.searchsorted(sorted_lefts, rights, side="left")
+        claims = ends > starts
+        range_sets = set_ids[claims]
+        merged_starts, merged_ends = _union(starts[claims], ends[claims], range_sets)
+        toggle_positions = np.concatenate(
+            [starts[claims][merged_starts], ends[claims][merged_ends]]
+        )
+        toggle_sets = np.concatenate(
+            [range_sets[merged_starts], range_sets[merged_ends]]
+        )
+        toggle_order = np.argsort(toggle_positions, kind="stable")
+        toggle_positions = toggle_positions[toggle_order]
+        toggle_sets = toggle_sets[toggle_order]
+        toggle_words = toggle_sets // 64
+        toggle_bits = np.left_shift(np.uint64(1), (toggle_sets % 64).astype(np.uint64))
+        sorted_set_ids = set_ids[order]
+        mask = np.zeros(n_words, dtype=np.uint64)
+        for chunk_start in range(0, len(lefts), chunk_size):
+            chunk_end = min(chunk_start + chunk_size, len(lefts))
+            lo, hi = np.searchsorted(toggle_positions, [chunk_start, chunk_end])
+            toggles = np.zeros((chunk_end - chunk_start, n_words), dtype=np.uint64)
+            toggles[0] = mask
+            np.bitwise_xor.at(
+                toggles,
+                (toggle_positions[lo:hi] - chunk_start, toggle_words[lo:hi]),
+                toggle_bits[lo:hi],
+            )
+            masks = np.bitwise_xor.accumulate(toggles, axis=0)
+            mask = masks[-1]
+            np.bitwise_or.at(covers, sorted_set_ids[chunk_start:chunk_end], masks)
+    # covers[b] has the bit for set a if a range of set a covers the position of an interval of set b
+    bits = np.unpackbits(
+        covers.astype("<u8").view(np.uint8), axis=1, bitorder="little"
+    )[:, :n_sets].astype(bool)
+    return bits | bits.T
+
+
+def _locate(lefts, rights, x, closed):
+    # lefts and rights are sorted, disjoint intervals.  For each point in x, the position of the interval which
+    # contains it, or -1.  The only candidate is the last interval whose left endpoint precedes the point.
+    if len(lefts) == 0:
+        return np.full(len(x), -1)
+    lefts, rights, x = _sortable(lefts), _sortable(rights), _sortable(x)
+    positions = (
+        np.searchsorted(
+            lefts, x, side="right" if closed in ("left", "both") else "left"
+        )
+        - 1
+    )
+    candidates = rights[np.maximum(positions, 0)]
+    if closed in ("right", "both"):
+        found = x <= candidates
+    else:
+        found = x < candidates
+    return np.where(found & (positions >= 0), positions, -1)
+
+
+def _split(starts, ends, x):
+    # x must be sorted and unique.  Each interval is split at the points of x strictly inside it.  Returns the
+    # positions of the left and right endpoints of the pieces in the concatenation of starts, ends and x.
+    n = len(starts)
+    lo, hi = _contained_ranges(starts, ends, x, "neither")
+    counts = np.maximum(hi - lo, 0)
+    intervals, pieces = _expand_ranges(np.zeros(n, dtype=int), counts + 1)
+    split_positions = 2 * n + lo[intervals] + pieces
+    left_positions = np.where(pieces == 0, intervals, split_positions - 1)
+    right_positions = np.where(
+        pieces == counts[intervals], n + intervals, split_positions
+    )
+    return left_positions, right_positions
@@ -77,17 +77,32 @@ class ArrayAccessor:
         self._interval_array = _interval_array
 
     @Appender(docstrings.union_docstring, join="\n", indents=1)
-    def union(self, *interval_arrays, squeeze=False, return_type="infer"):
+    def union(
+        self,
+        *interval_arrays,
+        squeeze=False,
+        return_type="infer",
+        n_jobs=None,
+        groups=None,
+    ):
         return intervalarray.union(
             self._interval_array,
             *interval_arrays,
             squeeze=squeeze,
             return_type=return_type,
+            n_jobs=n_jobs,
+            groups=groups,
         )
 
     @Appender(docstrings.intersection_docstring, join="\n", indents=1)
     def intersection(
-        self, *interval_arrays, min_overlaps="all", squeeze=False, return_type="infer"
+        self,
+        *interval_arrays,
+        min_overlaps="all",
+        squeeze=False,
+        return_type="infer",
+        n_jobs=None,
+        groups=None,
     ):
         return intervalarray.intersection(
             self._interval_array,
@@ -95,20 +110,30 @@ class ArrayAccessor:
             min_overlaps=min_overlaps,
             squeeze=squeeze,
             return_type=return_type,
+            n_jobs=n_jobs,
+            groups=groups,
         )
 
     @Appender(docstrings.difference_docstring, join="\n", indents=1)
-    def difference(self, *interval_arrays, squeeze=False, return_type="infer"):
+    def difference(
+        self, *interval_arrays, squeeze=False, return_type="infer", n_jobs=None
+    ):
         return intervalarray.difference(
             self._interval_array,
             *interval_arrays,
             squeeze=squeeze,
             return_type=return_type,
+            n_jobs=n_jobs,
         )
 
     @Appender(docstrings.symmetric_difference_docstring, join="\n", indents=1)
     def symmetric_difference(
-        self, *interval_arrays, min_overlaps=2, squeeze=False, return_type="infer"
+        self,
+        *interval_arrays,
+        min_overlaps=2,
+        squeeze=False,
+        return_type="infer",
+        n_jobs=None,
     ):
         return intervalarray.symmetric_difference(
             self._interval_array,
@@ -116,6 +141,7 @@ class ArrayAccessor:
             min_overlaps=min_overlaps,
             squeeze=squeeze,
             return_type=return_type,
+            n_jobs=n_jobs,
         )
 
     @Appender(docstrings.isdisjoint_docstring, join="\n", indents=1)
@@ -126,35 +152,42 @@ class ArrayAccessor:
         )
 
     @Appender(docstrings.issuperset_docstring, join="\n", indents=1)
-    def issuperset(self, *interval_arrays, squeeze=False):
+    def issuperset(self, *interval_arrays, squeeze=False, groups=None):
         return intervalarray.issuperset(
             self._interval_array,
             *interval_arrays,
             squeeze=squeeze,
+            groups=groups,
         )
 
     @Appender(docstrings.issubset_docstring, join="\n", indents=1)
-    def issubset(self, *interval_arrays, squeeze=False):
+    def issubset(self, *interval_arrays, squeeze=False, groups=None):
         return intervalarray.issubset(
             self._interval_array,
             *interval_arrays,
             squeeze=squeeze,
+            groups=groups,
         )
 
     @Appender(docstrings.coverage_docstring, join="\n", indents=1)
-    def coverage(self, domain=None, bins=False, how="fraction"):
+    def coverage(
+        self, domain=None, bins=False, how="fraction", n_jobs=None, groups=None
+    ):
         return intervalarray.coverage(
             self._interval_array,
             domain,
             bins,
             how,
+            n_jobs,
+            groups,
         )
 
     @Appender(docstrings.complement_docstring, join="\n", indents=1)
-    def complement(self, domain=None):
+    def complement(self, domain=None, groups=None):
         return intervalarray.complement(
             self._interval_array,
             domain,
+            groups,
         )
 
     @Appender(docstrings.contains_docstring, join="\n", indents=1)
@@ -175,19 +208,23 @@ class ArrayAccessor:
         )
 
     @Appender(docstrings.adjacency_matrix_docstring, join="\n", indents=1)
-    def adjacency_matrix(self, *interval_arrays, edges="intersect", include_index=True):
+    def adjacency_matrix(
+        self, *interval_arrays, edges="intersect", include_index=True, result="matrix"
+    ):
         return graph.adjacency_matrix(
             self._interval_array,
             *interval_arrays,
             edges=edges,
             include_index=include_index,
+            result=result,
         )
 
     @Appender(docstrings.bridge_docstring, join="\n", indents=1)
-    def bridge(self, threshold):
+    def bridge(self, threshold, groups=None):
         return intervalarray.bridge(
             self._interval_array,
             threshold,
+            groups=groups,
         )
 
 
@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+
+import piso.docstrings.columns as docstrings
+from piso import _sweep
+from piso._decorators import Appender
+from piso._exceptions import DegenerateIntervalError
+from piso.intervalarray import _get_domain_tuple
+
+
+def _get_endpoints(left, right, data):
+    # left and right are array-like, or the names of columns in data
+    if data is not None:
+        left, right = data[left], data[right]
+    left, right = pd.Index(left), pd.Index(right)
+    if len(left) != len(right):
+        raise ValueError("The left and right endpoints must have the same length.")
+    # endpoints are compared in the dtype (and unit) of their concatenation
+    values = left.append(right).values
+    lefts, rights = _sweep._sortable(values[: len(left)]), _sweep._sortable(
+        values[len(left) :]
+    )
+    degenerate = lefts == rights
+    if degenerate.any():
+        i = np.argmax(degenerate)
+        raise DegenerateIntervalError(pd.Interval(left[i], right[i]))
+    if (lefts > rights).any():
+        raise ValueError("The left endpoints must be less than the right endpoints.")
+    return left, right
+
+
+def _factorize_groups(left, right, groups, data):
+    # integer ids, and sorted labels, of the groups.  Intervals with a missing label are removed.
+    if groups is None:
+        return left, right, None, None
+    if data is not None:
+        groups = data[groups]
+    if len(groups) != len(left):
+        raise ValueError("The length of groups must match the number of intervals.")
+    group_ids, labels = pd.factorize(pd.Index(groups), sort=True)
+    if (group_ids < 0).any():
+        left, right = left[group_ids >= 0], right[group_ids >= 0]
+        group_ids = group_ids[group_ids >= 0]
+    return left, right, group_ids, labels
+
+
+def _to_array(index):
+    # a numpy array, unless the values have an extension dtype, such as timezone aware datetimes
+    if isinstance(index.dtype, pd.api.extensions.ExtensionDtype):
+        return index.array
+    return index.to_numpy()
+
+
+def _result(endpoints, starts, ends, point_groups, labels):
+    # starts and ends are positions into endpoints, and point_groups the group ids of endpoints
+    result = (_to_array(endpoints.take(starts)), _to_array(endpoints.take(ends)))
+    if labels is None:
+        return result
+    return result + (_to_array(labels.take(point_groups[starts])),)
+
+
+def _concat_groups(*group_ids):
+    if group_ids[0] is None:
+        return None
+    return np.concatenate(group_ids)
+
+
+def _with_domains(left, right, group_ids, labels, domain):
+    # the endpoints of the intervals, followed by the endpoints of the domain of each group, and arguments for the
+    # grouped kernels in _sweep.  If domain is None then the domain of a group is the extremities of its intervals.
+    n_groups = 1 if labels is None else len(labels)
+    domain_groups = None if labels is None else np.arange(n_groups)
+    if domain is None and len(left) == 0:
+        domain_left, domain_right = left, right
+    elif domain is None:
+        lefts, rights = _sweep._sortable(left.values), _sweep._sortable(right.values)
+        if labels is None:
+            first, last = [np.argmin(lefts)], [np.argmax(rights)]
+        else:
+            first = pd.Series(lefts).groupby(group_ids).idxmin().values
+            last = pd.Series(rights).groupby(group_ids).idxmax().values
+        domain_left, domain_right = left.take(first), right.take(last)
+    else:
+        lower, upper = _get_domain_tuple(None, domain)
+        domain_left = pd.Index([lower]).repeat(n_groups)
+        domain_right = pd.Index([upper]).repeat(n_groups)
+    endpoints = left.append([right, domain_left, domain_right])
+    n, m = len(left), len(domain_left)
+    values = endpoints.values
+    args = (
+        values[:n],
+        values[n : 2 * n],
+        group_ids,
+        values[2 * n : 2 * n + m],
+        values[2 * n + m :],
+        domain_groups,
+    )
+    point_groups = _concat_groups(group_ids, group_ids, domain_groups, domain_groups)
+    return endpoints, args, point_groups
+
+
+@Appender(docstrings.union_docstring, join="\n", indents=1)
+def union(left, right, data=None, groups=None):
+    left, right = _get_endpoints(left, right, data)
+    left, right, group_ids, labels = _factorize_groups(left, right, groups, data)
+    endpoints = left.append(right)
+    values = endpoints.values
+    starts, ends = _sweep._union(values[: len(left)], values[len(left) :], group_ids)
+    point_groups = _concat_groups(group_ids, group_ids)
+    return _result(endpoints, starts, ends + len(left), point_groups, labels)
+
+
+@Appender(docstrings.intersection_docstring, join="\n", indents=1)
+def intersection(left, right, data=None, min_overlaps="all", groups=None):
+    left, right = _get_endpoints(left, right, data)
+    left, right, group_ids, labels = _factorize_groups(left, right, groups, data)
+    if min_overlaps == "all":
+        min_overlaps = (
+            len(left)
+            if labels is None
+            else np.bincount(group_ids, minlength=len(labels))
+        )
+    endpoints = left.append(right)
+    values = endpoints.values
+    starts, ends = _sweep._grouped_intersection(
+        values[: len(left)], values[len(left) :], group_ids, min_overlaps
+    )
+    point_groups = _concat_groups(group_ids, group_ids)
+    return _result(endpoints, starts, ends, point_groups, labels)
+
+
+@Appender(docstrings.complement_docstring, join="\n", indents=1)
+def complement(left, right, data=None, domain=None, groups=None):
+    left, right = _get_endpoints(left, right, data)
+    left, right, group_ids, labels = _factorize_groups(left, right, groups, data)
+    endpoints, args, point_groups = _with_domains(
+        left, right, group_ids, labels, domain
+    )
+    starts, ends = _sweep._grouped_complement(*args)
+    return _result(endpoints, starts, ends, point_groups, labels)
+
+
+@Appender(docstrings.coverage_docstring, join="\n", indents=1)
+def coverage(left, right, data=None, domain=None, how="fraction", groups=None):
+    assert how in ("fraction", "sum")
+    left, right = _get_endpoints(left, right, data)
+    left, right, group_ids, labels = _factorize_groups(left, right, groups, data)
+    endpoints, args, _ = _with_domains(left, right, group_ids, labels, domain)
+    covered, lengths = _sweep._grouped_coverage(*args)
+    if labels is None and len(covered) == 0:
+        # there are no intervals, and no domain
+        covered, lengths = np.zeros(1, dtype=int), np.ones(1, dtype=int)
+    if how == "fraction":
+        result = covered / lengths
+    elif endpoints.dtype.kind in "mM":
+        unit, _ = np.datetime_data(endpoints.values.dtype)
+        result = covered.astype(f"m8[{unit}]")
+    else:
+        result = covered.astype(float)
+    if labels is not None:
+        return pd.Series(result, index=labels)
+    if how == "sum" and result.dtype.kind == "m":
+        return pd.Timedelta(result[0])
+    return result[0]
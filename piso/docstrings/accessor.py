@@ -65,6 +65,19 @@ Length: 1, closed: right, dtype: interval[float64]
 
 >>> arr1.piso.union(arr2, arr3, squeeze=True)
 Interval(0.0, 12.0, closed='right')
+
+Examples with *groups*:
+
+>>> arr = pd.arrays.IntervalArray.from_tuples(
+...     [(0, 4), (2, 5), (3, 6), (7, 8), (8, 9), (10, 12)],
+... )
+
+>>> arr.piso.union(groups=["a", "a", "b", "b", "b", "b"])
+a      (0, 5]
+b      (3, 6]
+b      (7, 9]
+b    (10, 12]
+dtype: interval
 """
 
 intersection_examples = """
@@ -145,6 +158,17 @@ Length: 0, closed: right, dtype: interval[float64]
 <IntervalArray>
 [(3.0, 4.0], (10.0, 11.0]]
 Length: 2, closed: right, dtype: interval[float64]
+
+Examples with *groups*:
+
+>>> arr = pd.arrays.IntervalArray.from_tuples(
+...     [(0, 4), (2, 5), (3, 6), (7, 9), (8, 10)],
+... )
+
+>>> arr.piso.intersection(groups=["a", "a", "a", "b", "b"])
+a    (3, 4]
+b    (8, 9]
+dtype: interval
 """
 
 difference_examples = """
@@ -319,6 +343,14 @@ array([ True, True])
 
 >>> arr2.piso.issuperset(arr3)
 False
+
+>>> candidates = pd.arrays.IntervalArray.from_tuples(
+...     [(2, 5), (7, 8), (3, 4), (5, 7)],
+... )
+>>> arr1.piso.issuperset(candidates, groups=["a", "a", "b", "b"])
+a     True
+b    False
+dtype: bool
 """
 
 
@@ -351,11 +383,20 @@ array([ True, False])
 
 >>> arr1.piso.issubset(arr3)
 False
+
+>>> candidates = pd.arrays.IntervalArray.from_tuples(
+...     [(0, 6), (7, 8), (0, 4), (4, 8)],
+... )
+>>> arr1.piso.issubset(candidates, groups=["a", "a", "b", "b"])
+a    True
+b    True
+dtype: bool
 """
 
 
 def join_params(list_of_param_strings):
-    return "".join(list_of_param_strings).replace("\n\n", "\n")
+    # blank lines within a parameter description, such as before a versionadded directive, are kept
+    return "\n" + "\n".join(p.strip("\n") for p in list_of_param_strings) + "\n"
 
 
 param_optional_args = """
@@ -376,6 +417,31 @@ min_overlaps : int or "all", default "all"
     If supplied, must be done so as a keyword argument.
 """
 
+param_groups = """
+groups : array-like, optional
+    Labels, one for each interval in the single element of *interval_arrays*, which split it into multiple
+    interval arrays.  The {operation} comparison is applied to each of these, and the result returned as a
+    :class:`pandas.Series` indexed by the (sorted) labels.  Intervals with a missing label are ignored.
+    If supplied, must be done so as a keyword argument.
+
+    .. versionadded:: 1.2.0
+"""
+
+
+param_groups_set_operation = """
+groups : array-like, optional
+    Labels, one for each interval in the interval array the accessor belongs to, which split it into multiple
+    interval arrays.  The {operation} of the intervals in each is calculated in a single pass, and the result returned
+    as a :class:`pandas.Series` of intervals indexed by the (sorted) labels.  This is equivalent to applying the
+    operation to each group in turn.
+    Intervals with a missing label are ignored.  Cannot be used with *interval_arrays* or *n_jobs*, and *squeeze*
+    and *return_type* are ignored.
+    If supplied, must be done so as a keyword argument.
+
+    .. versionadded:: 1.2.0
+"""
+
+
 param_squeeze = """
 squeeze : boolean, default {default}
     If True, will try to coerce the return value to a single pandas.Interval.
@@ -383,11 +449,22 @@ squeeze : boolean, default {default}
 """
 
 param_return_type = """
-return_type : {"infer", :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray`}, default "infer"
+return_type : {"infer", :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray`, :class:`piso.IntervalSet`}, default "infer"
     If "infer" the return type will be the same as *interval_array*.
     If supplied, must be done so as a keyword argument.
 """
 
+param_n_jobs = """
+n_jobs : int, optional
+    If specified, and not 1, the domain is divided into *n_jobs* partitions, with similar numbers of endpoints,
+    and the operation is performed on each partition in a pool of *n_jobs* processes.  Intervals which straddle
+    partitions are divided between them, and the results joined.  Negative values count back from the number of
+    available processors, so -1 uses all of them, and -2 all but one.
+    If supplied, must be done so as a keyword argument.
+
+    .. versionadded:: 1.2.0
+"""
+
 template_doc = """
 What is considered a set is determined by the number of positional arguments used, that is, determined by the
 size of *interval_arrays*.
@@ -440,7 +517,7 @@ Parameters
 
 Returns
 -------
-:class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
+boolean, :class:`numpy.ndarray` of boolean, or :class:`pandas.Series` of boolean
 
 {examples}
 """
@@ -458,6 +535,9 @@ the interval array the accessor belongs to, and each array in *interval_arrays*.
 interval arrays, the return type will be a numpy array.  If it contains one interval array then the result can be coerced to
 a single boolean using the *squeeze* parameter.
 
+Alternatively, when *interval_arrays* contains a single interval array, *groups* can be used to split it into the arrays
+to be compared, which avoids constructing a large number of interval arrays.
+
 Parameters
 ----------
 {params}
@@ -478,6 +558,8 @@ union_params = join_params(
         param_optional_args,
         param_squeeze.format(default="False"),
         param_return_type,
+        param_n_jobs,
+        param_groups_set_operation.format(operation="union"),
     ]
 )
 union_docstring = operation_template_doc.format(
@@ -494,6 +576,8 @@ intersection_params = join_params(
         param_min_overlaps,
         param_squeeze.format(default="False"),
         param_return_type,
+        param_n_jobs,
+        param_groups_set_operation.format(operation="intersection"),
     ]
 )
 intersection_docstring = operation_template_doc.format(
@@ -509,6 +593,7 @@ difference_params = join_params(
         param_optional_args_min_one,
         param_squeeze.format(default="False"),
         param_return_type,
+        param_n_jobs,
     ]
 )
 difference_docstring = doc_difference_template.format(
@@ -526,6 +611,7 @@ symmetric_difference_params = join_params(
         param_min_overlaps,
         param_squeeze.format(default="False"),
         param_return_type,
+        param_n_jobs,
     ]
 )
 symmetric_difference_extra_desc = """
@@ -569,6 +655,7 @@ issuperset_params = join_params(
     [
         param_optional_args_min_one,
         param_squeeze.format(default="True"),
+        param_groups.format(operation="superset"),
     ]
 )
 issuperset_docstring = is_super_sub_set_template.format(
@@ -581,6 +668,7 @@ issubset_params = join_params(
     [
         param_optional_args_min_one,
         param_squeeze.format(default="True"),
+        param_groups.format(operation="subset"),
     ]
 )
 issubset_docstring = is_super_sub_set_template.format(
@@ -596,7 +684,7 @@ Calculates the size of a domain (or possibly multiple domains) covered by a coll
 The intervals are contained in the array object the accessor belongs to.
 The (possibly overlapping) intervals may not, or partially, or wholly cover the domain.
 
-Calculation over multiple domains is only possible when *bins* = True.
+Calculation over multiple domains is only possible when *bins* = True or *bins* = "overlapping".
 
 Parameters
 ----------
@@ -607,14 +695,30 @@ domain : :py:class:`tuple`, :class:`pandas.Interval`, :class:`pandas.IntervalInd
     :class:`pandas.Interval`.  If *domain* is a :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
     then the intervals it contains define a possibly disconnected domain.
     If *bins* = True then *domain* must be :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray` with disjoint intervals.
-bins : boolean, default False
+    If *bins* = "overlapping" then *domain* must be :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`.
+bins : boolean or "overlapping", default False
     If False, then the *domain* is interpreted as a single domain and returns one value.
     If True, then *domain* is interpreted as disjoint bins over which coverage is calculated for each.
+    If "overlapping", then *domain* is interpreted as bins which may overlap, such as sliding windows.
+
+    .. versionadded:: 1.2.0
 how : {"fraction", "sum"}, default "fraction"
     If *how* = "fraction" then the result is a fraction of the size of the domain.
     If *how* = "sum" then the result is the length of the domain covered.
 
     .. versionadded:: 0.8.0
+n_jobs : int, optional
+    If specified, and not 1, the union of the intervals is calculated with a pool of *n_jobs* processes,
+    as per :func:`piso.union`.
+
+    .. versionadded:: 1.2.0
+groups : array-like, optional
+    Labels, one for each interval, which partition the intervals into groups.  The coverage of each group is
+    calculated in a single pass, and returned as a :class:`pandas.Series` indexed by the (sorted) labels.  If *domain*
+    is `None` then the domain of each group is the extremities of its intervals, otherwise the domain is shared by
+    all groups.  Intervals with a missing label are ignored.  Cannot be used with *bins* or *n_jobs*.
+
+    .. versionadded:: 1.2.0
 
 Returns
 -------
@@ -658,6 +762,20 @@ dtype: float64
 (4, 6]     1.0
 (7, 10]    1.0
 dtype: float64
+
+>>> windows = pd.arrays.IntervalArray.from_tuples(
+...     [(0, 4), (2, 6), (4, 8)],
+... )
+>>> arr1.piso.coverage(windows, bins="overlapping")
+(0, 4]    1.00
+(2, 6]    0.75
+(4, 8]    0.50
+dtype: float64
+
+>>> arr1.piso.coverage((0, 10), groups=["a", "b", "b"])
+a    0.4
+b    0.3
+dtype: float64
 """
 
 complement_docstring = """
@@ -674,6 +792,13 @@ domain : :py:class:`tuple`, :class:`pandas.Interval`, :class:`pandas.IntervalInd
     that the accessor belongs to. If *domain* is a tuple then it should specify lower and upper bounds, and be equivalent to a
     :class:`pandas.Interval`.  If *domain* is a :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
     then the intervals it contains define a possibly disconnected domain.
+groups : array-like, optional
+    Labels, one for each interval, which partition the intervals into groups.  The complement of each group is
+    calculated in a single pass, and the result returned as a :class:`pandas.Series` of intervals indexed by the
+    (sorted) labels.  If *domain* is `None` then the domain of each group is the extremities of its intervals,
+    otherwise the domain is shared by all groups.  Intervals with a missing label are ignored.
+
+    .. versionadded:: 1.2.0
 
 Returns
 -------
@@ -713,6 +838,13 @@ Length: 2, closed: right, dtype: interval[int64]
 <IntervalArray>
 [(-5, -2], (8, 10]]
 Length: 2, closed: right, dtype: interval[int64]
+
+>>> arr1.piso.complement((0, 10), groups=["a", "b", "b"])
+a    (4, 10]
+b     (0, 3]
+b     (5, 7]
+b    (8, 10]
+dtype: interval
 """
 
 get_indexer_docstring = """
@@ -768,6 +900,9 @@ the i-th interval contains the j-th point.
 
 If *result = "points"* then the result is a 1-dimensional boolean mask of length *n*.
 If *result = "intervals"* then the result is a 1-dimensional boolean mask of length *m*.
+If *result = "sparse"* then the result contains the pairs of intervals and points for which the
+interval contains the point, ordered by interval.  It is equivalent to the True elements of *M*, but
+is calculated without evaluating *M*, in time and memory proportional to the number of pairs.
 
 Parameters
 ----------
@@ -779,9 +914,14 @@ x : scalar, or array-like of scalars
 include_index : boolean, default True
     Indicates whether to return a :class:`numpy.ndarray` or :class:`pandas.DataFrame` indexed
     by *interval_array* and column names equal to *x*
-result : {"cartesian", "points", "intervals"}, default "cartesian"
-    If *result* = "cartesian" then the result will be two dimensional, otherwise it will be
-    one dimensional.
+result : {"cartesian", "points", "intervals", "sparse"}, default "cartesian"
+    If *result* = "cartesian" then the result will be two dimensional.  If *result* = "sparse" then the
+    result will be a :class:`pandas.DataFrame` with columns "interval" and "point" if *include_index* is True,
+    otherwise a tuple of two integer :class:`numpy.ndarray` containing the positions of the intervals, and points.
+    Otherwise the result will be one dimensional.
+
+    .. versionadded:: 1.2.0
+        The "sparse" option.
 how : {"any", "all"}, default "any"
     Only relevant if *result* is not "cartesian".  This parameter indicates either:
     - a True value means any or all points are contained within an interval, or
@@ -790,8 +930,8 @@ how : {"any", "all"}, default "any"
 
 Returns
 -------
-:class:`numpy.ndarray`, :class:`pandas.DataFrame` or :class:`pandas.Series`
-    One, or two, dimensional and boolean valued.  Return type dependent on *include_index* and *result*.
+:class:`numpy.ndarray`, :class:`pandas.DataFrame`, :class:`pandas.Series` or tuple
+    One, or two, dimensional and boolean valued, unless *result* = "sparse".  Return type dependent on *include_index* and *result*.
 
 Examples
 --------
@@ -837,6 +977,17 @@ dtype: bool
 (2, 5]    True
 dtype: bool
 
+>>> arr.piso.contains([0, 1, 3, 4], result="sparse")
+  interval  point
+0   (0, 4]      1
+1   (0, 4]      3
+2   (0, 4]      4
+3   (2, 5]      3
+4   (2, 5]      4
+
+>>> arr.piso.contains([0, 1, 3, 4], result="sparse", include_index=False)
+(array([0, 0, 0, 1, 1]), array([1, 2, 3, 2, 3]))
+
 >>> pd.IntervalIndex.from_tuples([(0,2)]).piso.contains(1, include_index=False)
 array([[ True]])
 """
@@ -907,11 +1058,20 @@ edges : {"intersect", "disjoint"}, default "intersect"
 include_index : bool, default True
     If True then a :class:`pandas.DataFrame`, indexed by the intervals, is returned.
     If False then a :class:`numpy.ndarray` is returned.
+result : {"matrix", "edges"}, default "matrix"
+    If "matrix" then the adjacency matrix is returned.  If "edges" then an edge list, equivalent to
+    the positions of the True values in the adjacency matrix, is returned.  If *include_index* is True
+    the edge list is a :class:`pandas.DataFrame` with columns "source" and "target", otherwise it is a
+    tuple of two integer :class:`numpy.ndarray`, in the same format as :func:`numpy.nonzero`.
+    When *edges* = "intersect" and *interval_arrays* is empty the edge list is calculated without
+    constructing the adjacency matrix, in O(n log n + E) time and O(n + E) memory for n intervals and E edges.
+
+    .. versionadded:: 1.2.0
 
 Returns
 -------
-:class:`pandas.DataFrame` or :class:`numpy.ndarray`
-    Boolean valued, symmetrical, with False along diagonal.
+:class:`pandas.DataFrame`, :class:`numpy.ndarray` or tuple
+    If *result* = "matrix" then boolean valued, symmetrical, with False along diagonal.
 
 Examples
 --------
@@ -940,6 +1100,15 @@ array([[False,  True, False, False, False],
        [False, False, False, False,  True],
        [False, False, False,  True, False]])
 
+>>> arr.piso.adjacency_matrix(result="edges")
+    source   target
+0   [0, 4]   [3, 6]
+1   [3, 6]   [0, 4]
+2   [3, 6]   [5, 7]
+3   [5, 7]   [3, 6]
+4   [8, 9]  [9, 10]
+5  [9, 10]   [8, 9]
+
 >>> arr.piso.adjacency_matrix(arr, edges="disjoint")
          [0, 4]  [3, 6]  [5, 7]  [8, 9]  [9, 10]
 [0, 4]    False   False    True    True     True
@@ -962,11 +1131,19 @@ Parameters
 threshold : scalar
     The value should belong to the domain that arises from a subtraction over the domain of the intervals.
     For instance, if intervals are timestamp data, then *threshold* should be timedelta.
+    If *groups* is specified then *threshold* may be a :py:class:`dict` or :class:`pandas.Series`, mapping each
+    group label to the threshold for that group.
+groups : array-like, optional
+    Labels, one for each interval, which partition the intervals into groups.  Intervals are only merged with
+    others in the same group, and the result is returned as a :class:`pandas.Series` of intervals indexed by
+    the group labels, in sorted order.  Intervals with a missing label are ignored.
+
+    .. versionadded:: 1.2.0
 
 Returns
 -------
 :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
-    Return type will be the same type as the object the accessor belongs to.
+    Return type will be the same type as the object the accessor belongs to, unless *groups* is specified.
 
 
 Examples
@@ -982,16 +1159,21 @@ Examples
 
 >>> arr.piso.bridge(threshold=1)
 <IntervalArray>
-[(0.0, 5.0], (7.0, 8.0], (11.0, 12.0]]
-Length: 3, closed: right, dtype: interval[float64]
+[(0, 5], (7, 8], (11, 12]]
+Length: 3, closed: right, dtype: interval[int64]
 
 >>> arr.piso.bridge(threshold=2)
 <IntervalArray>
-[(0.0, 8.0], (11.0, 12.0]]
-Length: 2, closed: right, dtype: interval[float64]
+[(0, 8], (11, 12]]
+Length: 2, closed: right, dtype: interval[int64]
 
 >>> arr.piso.bridge(threshold=3)
 <IntervalArray>
-[(0.0, 12.0]]
-Length: 1, closed: right, dtype: interval[float64]
+[(0, 12]]
+Length: 1, closed: right, dtype: interval[int64]
+
+>>> arr.piso.bridge(threshold={"a": 1, "b": 3}, groups=["a", "a", "b", "b"])
+a     (0, 5]
+b    (7, 12]
+dtype: interval
 """
@@ -0,0 +1,167 @@
+common_desc = """
+The intervals are given by arrays of left and right endpoints, or the names of the columns of *data* containing
+them, rather than an interval array.  The endpoints of the result are returned as arrays, so no
+:class:`pandas.arrays.IntervalArray` is constructed for either the argument or the result.  The intervals are
+assumed to be left-closed or right-closed, which does not affect the result.
+
+.. versionadded:: 1.2.0
+"""
+
+params_endpoints = """
+left : array-like or column label
+    The left endpoints of the intervals, or the name of the column of *data* containing them.
+right : array-like or column label
+    The right endpoints of the intervals, or the name of the column of *data* containing them.
+    Each must be greater than the corresponding left endpoint.
+data : :class:`pandas.DataFrame`, optional
+    If specified then *left*, *right* and *groups* are the names of columns in *data*."""
+
+param_domain = """
+domain : :py:class:`tuple` or :class:`pandas.Interval`, optional
+    Specifies the domain over which to calculate the "{operation}".  If *domain* is `None`,
+    then the domain is considered to be the extremities of the intervals (in each group, if *groups* is specified).
+    If *domain* is a tuple then it should specify lower and upper bounds, and be equivalent to a
+    :class:`pandas.Interval`."""
+
+param_groups = """
+groups : array-like or column label, optional
+    Labels, one for each interval, which partition the intervals into groups.  The {operation} of each group is
+    calculated in a single pass.  Intervals with a missing label are ignored."""
+
+intervals_return = """
+
+Returns
+-------
+tuple of arrays
+    The left and right endpoints of the result, together with the group label of each interval if *groups* is
+    specified.  Intervals are sorted (by group label first, if *groups* is specified).  Arrays are
+    :class:`numpy.ndarray`, unless the endpoints have an extension dtype, such as timezone aware datetimes.
+"""
+
+examples_setup = """
+Examples
+--------
+
+>>> import pandas as pd
+>>> import piso.columns
+
+>>> df = pd.DataFrame(
+...     {
+...         "start": [0, 2, 3, 7, 8],
+...         "end": [4, 5, 6, 8, 9],
+...         "asset": ["a", "a", "b", "b", "b"],
+...     }
+... )
+"""
+
+union_docstring = (
+    """
+Performs a union of intervals.
+
+The result is the same as that of :func:`piso.union`, with a single interval array.
+"""
+    + common_desc
+    + """
+Parameters
+----------"""
+    + params_endpoints
+    + param_groups.format(operation="union")
+    + intervals_return
+    + examples_setup
+    + """
+>>> piso.columns.union("start", "end", data=df)
+(array([0, 7]), array([6, 9]))
+
+>>> piso.columns.union("start", "end", data=df, groups="asset")
+(array([0, 3, 7]), array([5, 6, 9]), array(['a', 'b', 'b'], dtype=object))
+"""
+)
+
+intersection_docstring = (
+    """
+Performs an intersection of intervals.
+
+The result is the same as that of :func:`piso.intersection`, with a single interval array.
+"""
+    + common_desc
+    + """
+Parameters
+----------"""
+    + params_endpoints
+    + """
+min_overlaps : int or "all", default "all"
+    The minimum number of intervals that must overlap for a region to be included in the intersection.
+    If "all" then the number of intervals (in each group, if *groups* is specified)."""
+    + param_groups.format(operation="intersection")
+    + intervals_return
+    + examples_setup
+    + """
+>>> piso.columns.intersection("start", "end", data=df, min_overlaps=2)
+(array([2]), array([5]))
+
+>>> piso.columns.intersection("start", "end", data=df, groups="asset")
+(array([2]), array([4]), array(['a'], dtype=object))
+"""
+)
+
+complement_docstring = (
+    """
+Calculates the complement of intervals, over some domain.
+
+The result is the same as that of :func:`piso.complement`.
+"""
+    + common_desc
+    + """
+Parameters
+----------"""
+    + params_endpoints
+    + param_domain.format(operation="complement")
+    + param_groups.format(operation="complement")
+    + intervals_return
+    + examples_setup
+    + """
+>>> piso.columns.complement("start", "end", data=df, domain=(0, 10))
+(array([6, 9]), array([ 7, 10]))
+
+>>> piso.columns.complement("start", "end", data=df, groups="asset")
+(array([6]), array([7]), array(['b'], dtype=object))
+"""
+)
+
+coverage_docstring = (
+    """
+Calculates the fraction of a domain covered by intervals.
+
+The result is the same as that of :func:`piso.coverage`.
+"""
+    + common_desc
+    + """
+Parameters
+----------"""
+    + params_endpoints
+    + param_domain.format(operation="coverage")
+    + """
+how : {"fraction", "sum"}, default "fraction"
+    If "fraction" then the result is the fraction of the domain covered, otherwise the total length covered."""
+    + param_groups.format(operation="coverage")
+    + """
+
+Returns
+-------
+float, :class:`pandas.Timedelta` or :class:`pandas.Series`
+    A :class:`pandas.Series`, indexed by the sorted labels, is returned if *groups* is specified.
+"""
+    + examples_setup
+    + """
+>>> piso.columns.coverage("start", "end", data=df)
+0.8888888888888888
+
+>>> piso.columns.coverage("start", "end", data=df, domain=(0, 10), how="sum")
+8.0
+
+>>> piso.columns.coverage("start", "end", data=df, groups="asset")
+a    1.000000
+b    0.833333
+dtype: float64
+"""
+)
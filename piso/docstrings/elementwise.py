@@ -0,0 +1,88 @@
+template_doc = """
+Performs the {operation} of each pair of intervals from two interval arrays of the same length.
+
+The result for each pair is the same as that of :func:`piso.interval.{name}`, however the calculation is
+vectorized over all pairs.  As the result for a pair may contain zero, one or two intervals, the results
+are returned as a single interval array, together with an array of the positions of the pairs to which each
+interval belongs.
+
+.. versionadded:: 1.2.0
+
+Parameters
+----------
+interval_array1 : :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+    The first operand of each pair.  Intervals must be non-degenerate, and either left-closed or right-closed.
+interval_array2 : :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+    The second operand of each pair.  Must have the same length, and *closed* value, as *interval_array1*.
+
+Returns
+-------
+tuple of :class:`pandas.arrays.IntervalArray` and :class:`numpy.ndarray` of integers
+    The intervals resulting from all pairs, ordered by pair, and the position of the pair for each interval.
+
+Examples
+--------
+
+>>> import pandas as pd
+>>> import piso.elementwise
+
+>>> arr1 = pd.arrays.IntervalArray.from_tuples([(0, 3), (0, 2), (2, 4), (0, 4)])
+>>> arr2 = pd.arrays.IntervalArray.from_tuples([(2, 4), (3, 5), (0, 3), (1, 2)])
+
+{examples}
+"""
+
+union_examples = """
+>>> intervals, rows = piso.elementwise.union(arr1, arr2)
+>>> intervals
+<IntervalArray>
+[(0, 4], (0, 2], (3, 5], (0, 4], (0, 4]]
+Length: 5, dtype: interval[int64, right]
+>>> rows
+array([0, 1, 1, 2, 3])
+"""
+
+intersection_examples = """
+>>> intervals, rows = piso.elementwise.intersection(arr1, arr2)
+>>> intervals
+<IntervalArray>
+[(2, 3], (2, 3], (1, 2]]
+Length: 3, dtype: interval[int64, right]
+>>> rows
+array([0, 2, 3])
+"""
+
+difference_examples = """
+>>> intervals, rows = piso.elementwise.difference(arr1, arr2)
+>>> intervals
+<IntervalArray>
+[(0, 2], (0, 2], (3, 4], (0, 1], (2, 4]]
+Length: 5, dtype: interval[int64, right]
+>>> rows
+array([0, 1, 2, 3, 3])
+"""
+
+symmetric_difference_examples = """
+>>> intervals, rows = piso.elementwise.symmetric_difference(arr1, arr2)
+>>> intervals
+<IntervalArray>
+[(0, 2], (3, 4], (0, 2], (3, 5], (0, 2], (3, 4], (0, 1], (2, 4]]
+Length: 8, dtype: interval[int64, right]
+>>> rows
+array([0, 0, 1, 1, 2, 2, 3, 3])
+"""
+
+union_docstring = template_doc.format(
+    operation="union", name="union", examples=union_examples
+)
+intersection_docstring = template_doc.format(
+    operation="intersection", name="intersection", examples=intersection_examples
+)
+difference_docstring = template_doc.format(
+    operation="set difference", name="difference", examples=difference_examples
+)
+symmetric_difference_docstring = template_doc.format(
+    operation="symmetric difference",
+    name="symmetric_difference",
+    examples=symmetric_difference_examples,
+)
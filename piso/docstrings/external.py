@@ -0,0 +1,197 @@
+common_desc = """
+The intervals are read in chunks from *sources*, which may be CSV, Parquet or NPY files, too large to be held in
+memory.  The endpoints of each chunk are sorted and written to temporary memory mapped .npy files, which are then
+merged, and swept, in blocks.  The memory required is approximately *memory*, regardless of the number of intervals,
+however the result must fit in memory.
+
+.. versionadded:: 1.2.0
+"""
+
+param_sources = """
+*sources : argument list of str, path-like, or iterables of :class:`pandas.DataFrame` or :class:`pandas.arrays.IntervalArray`
+    Paths of files containing intervals.  The file type is determined by the extension, which must be
+    .csv, .parquet, or .npy.  A .npy file must contain either a structured array, with fields named by
+    *start* and *end*, or a two dimensional array whose first two columns are the start and end.
+    Reading Parquet files requires pyarrow.  Alternatively a source may be an iterable of chunks,
+    each of which is a dataframe, or interval array."""
+
+param_source = param_sources.replace("*sources : argument list of", "source :")
+
+params_reading = """
+start : str, default "start"
+    The name of the column (or field) containing the left endpoints of the intervals.
+end : str, default "end"
+    The name of the column (or field) containing the right endpoints of the intervals."""
+
+param_closed = """
+closed : {"left", "right"}, default "right"
+    Whether the intervals are closed on the left-side or right-side."""
+
+params_resources = """
+memory : int, default 2**28
+    The approximate number of bytes of memory to be used.  Determines the number of rows
+    in each chunk read, and the size of blocks in which sorted endpoints are merged and swept.
+temp_dir : str or path-like, optional
+    The directory in which temporary files are created.  If not specified the default
+    location for temporary files is used.  The files are removed when the function returns.
+read_kwargs : dict, optional
+    Keyword arguments passed to :func:`pandas.read_csv`, :class:`pyarrow.parquet.ParquetFile`
+    or :func:`numpy.load`, for example to parse dates."""
+
+param_domain = """
+domain : :py:class:`tuple` or :class:`pandas.Interval`, optional
+    Specifies the domain over which to calculate the "{operation}".  If *domain* is `None`,
+    then the domain is considered to be the extremities of the intervals contained in *source*.
+    If *domain* is a tuple then it should specify lower and upper bounds, and be equivalent to a
+    :class:`pandas.Interval`."""
+
+examples_setup = """
+Examples
+--------
+
+>>> import os
+>>> import tempfile
+>>> import pandas as pd
+>>> import piso.external
+
+>>> directory = tempfile.TemporaryDirectory()
+>>> path = os.path.join(directory.name, "intervals.csv")
+>>> pd.DataFrame(
+...     {"start": [0, 2, 3, 7], "end": [4, 5, 6, 9]},
+... ).to_csv(path, index=False)
+"""
+
+examples_cleanup = """
+>>> directory.cleanup()
+"""
+
+union_docstring = (
+    """
+Performs a union of intervals stored in files.
+
+The result is the same as that of :func:`piso.union`, applied to all intervals in *sources*.
+"""
+    + common_desc
+    + """
+Parameters
+----------"""
+    + param_sources
+    + params_reading
+    + param_closed
+    + params_resources
+    + """
+
+Returns
+-------
+:class:`pandas.arrays.IntervalArray`
+"""
+    + examples_setup
+    + """
+>>> piso.external.union(path)
+<IntervalArray>
+[(0, 6], (7, 9]]
+Length: 2, dtype: interval[int64, right]
+"""
+    + examples_cleanup
+)
+
+intersection_docstring = (
+    """
+Performs an intersection of intervals stored in files.
+
+If more than one source is given then each source defines a set, by the union of its intervals, and
+the result is the intersection of these sets.  If only one source is given then the result is the
+intersection of the intervals it contains.  The result is the same as that of :func:`piso.intersection`.
+"""
+    + common_desc
+    + """
+Parameters
+----------"""
+    + param_sources
+    + params_reading
+    + param_closed
+    + """
+min_overlaps : int or "all", default "all"
+    The minimum number of sets (or intervals if there is a single source) that must overlap for a
+    region to be included in the intersection.  If "all" then the number of sets (or intervals)."""
+    + params_resources
+    + """
+
+Returns
+-------
+:class:`pandas.arrays.IntervalArray`
+"""
+    + examples_setup
+    + """
+>>> piso.external.intersection(path, min_overlaps=2)
+<IntervalArray>
+[(2, 5]]
+Length: 1, dtype: interval[int64, right]
+"""
+    + examples_cleanup
+)
+
+complement_docstring = (
+    """
+Calculates the complement of intervals stored in a file, over some domain.
+
+The result is the same as that of :func:`piso.complement`.
+"""
+    + common_desc
+    + """
+Parameters
+----------"""
+    + param_source
+    + param_domain.format(operation="complement")
+    + params_reading
+    + param_closed
+    + params_resources
+    + """
+
+Returns
+-------
+:class:`pandas.arrays.IntervalArray`
+"""
+    + examples_setup
+    + """
+>>> piso.external.complement(path, domain=(-1, 10))
+<IntervalArray>
+[(-1, 0], (6, 7], (9, 10]]
+Length: 3, dtype: interval[int64, right]
+"""
+    + examples_cleanup
+)
+
+coverage_docstring = (
+    """
+Calculates the fraction of a domain covered by intervals stored in a file.
+
+The result is the same as that of :func:`piso.coverage`.
+"""
+    + common_desc
+    + """
+Parameters
+----------"""
+    + param_source
+    + param_domain.format(operation="coverage")
+    + """
+how : {"fraction", "sum"}, default "fraction"
+    If "fraction" then the result is the fraction of the domain covered, otherwise the total length covered."""
+    + params_reading
+    + params_resources
+    + """
+
+Returns
+-------
+float or :class:`pandas.Timedelta`
+"""
+    + examples_setup
+    + """
+>>> piso.external.coverage(path)
+0.8888888888888888
+
+>>> piso.external.coverage(path, domain=(0, 10), how="sum")
+8.0
+"""
+    + examples_cleanup
+)
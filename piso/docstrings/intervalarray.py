@@ -62,6 +62,19 @@ Length: 1, closed: right, dtype: interval[float64]
 
 >>> piso.union(arr1, arr2, arr3, squeeze=True)
 Interval(0.0, 12.0, closed='right')
+
+Examples with *groups*:
+
+>>> arr = pd.arrays.IntervalArray.from_tuples(
+...     [(0, 4), (2, 5), (3, 6), (7, 8), (8, 9), (10, 12)],
+... )
+
+>>> piso.union(arr, groups=["a", "a", "b", "b", "b", "b"])
+a      (0, 5]
+b      (3, 6]
+b      (7, 9]
+b    (10, 12]
+dtype: interval
 """
 
 intersection_examples = """
@@ -131,6 +144,17 @@ Length: 0, closed: right, dtype: interval[float64]
 <IntervalArray>
 [(3.0, 4.0], (10.0, 11.0]]
 Length: 2, closed: right, dtype: interval[float64]
+
+Examples with *groups*:
+
+>>> arr = pd.arrays.IntervalArray.from_tuples(
+...     [(0, 4), (2, 5), (3, 6), (7, 9), (8, 10)],
+... )
+
+>>> piso.intersection(arr, groups=["a", "a", "a", "b", "b"])
+a    (3, 4]
+b    (8, 9]
+dtype: interval
 """
 
 difference_examples = """
@@ -300,6 +324,14 @@ array([ True, True])
 
 >>> piso.issuperset(arr2, arr3)
 False
+
+>>> candidates = pd.arrays.IntervalArray.from_tuples(
+...     [(2, 5), (7, 8), (3, 4), (5, 7)],
+... )
+>>> piso.issuperset(arr1, candidates, groups=["a", "a", "b", "b"])
+a     True
+b    False
+dtype: bool
 """
 
 
@@ -331,20 +363,29 @@ array([ True, False])
 
 >>> piso.issubset(arr1, arr3)
 False
+
+>>> candidates = pd.arrays.IntervalArray.from_tuples(
+...     [(0, 6), (7, 8), (0, 4), (4, 8)],
+... )
+>>> piso.issubset(arr1, candidates, groups=["a", "a", "b", "b"])
+a    True
+b    True
+dtype: bool
 """
 
 
 def join_params(list_of_param_strings):
-    return "".join(list_of_param_strings).replace("\n\n", "\n")
+    # blank lines within a parameter description, such as before a versionadded directive, are kept
+    return "\n" + "\n".join(p.strip("\n") for p in list_of_param_strings) + "\n"
 
 
 param_interval_array = """
-interval_array : :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
+interval_array : :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray` or :class:`piso.IntervalSet`
     The first (and possibly only) operand to the {operation} operation.
 """
 
 param_interval_array_non_optional = """
-interval_array : :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
+interval_array : :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray` or :class:`piso.IntervalSet`
     The first operand to the {operation} operation.
 """
 
@@ -354,12 +395,12 @@ interval_array : :class:`pandas.IntervalIndex` or :class:`pandas.arrays.Interval
 """
 
 param_optional_args = """
-*interval_arrays : argument list of :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
+*interval_arrays : argument list of :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray` or :class:`piso.IntervalSet`
     May contain zero or more arguments.
 """
 
 param_optional_args_min_one = """
-*interval_arrays : argument list of :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
+*interval_arrays : argument list of :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray` or :class:`piso.IntervalSet`
     Must contain at least one argument.
 """
 
@@ -371,6 +412,30 @@ min_overlaps : int or "all", default "all"
     If supplied, must be done so as a keyword argument.
 """
 
+param_groups = """
+groups : array-like, optional
+    Labels, one for each interval in the single element of *interval_arrays*, which split it into multiple
+    interval arrays.  The {operation} comparison is applied to each of these, and the result returned as a
+    :class:`pandas.Series` indexed by the (sorted) labels.  Intervals with a missing label are ignored.
+    If supplied, must be done so as a keyword argument.
+
+    .. versionadded:: 1.2.0
+"""
+
+
+param_groups_set_operation = """
+groups : array-like, optional
+    Labels, one for each interval in *interval_array*, which split it into multiple interval arrays.  The {operation}
+    of the intervals in each is calculated in a single pass, and the result returned as a :class:`pandas.Series`
+    of intervals indexed by the (sorted) labels.  This is equivalent to applying the operation to each group in turn.
+    Intervals with a missing label are ignored.  Cannot be used with *interval_arrays* or *n_jobs*, and *squeeze*
+    and *return_type* are ignored.
+    If supplied, must be done so as a keyword argument.
+
+    .. versionadded:: 1.2.0
+"""
+
+
 param_squeeze = """
 squeeze : boolean, default {default}
     If True, will try to coerce the return value to a single pandas.Interval.
@@ -378,11 +443,22 @@ squeeze : boolean, default {default}
 """
 
 param_return_type = """
-return_type : {"infer", :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray`}, default "infer"
+return_type : {"infer", :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray`, :class:`piso.IntervalSet`}, default "infer"
     If "infer" the return type will be the same as *interval_array*.
     If supplied, must be done so as a keyword argument.
 """
 
+param_n_jobs = """
+n_jobs : int, optional
+    If specified, and not 1, the domain is divided into *n_jobs* partitions, with similar numbers of endpoints,
+    and the operation is performed on each partition in a pool of *n_jobs* processes.  Intervals which straddle
+    partitions are divided between them, and the results joined.  Negative values count back from the number of
+    available processors, so -1 uses all of them, and -2 all but one.
+    If supplied, must be done so as a keyword argument.
+
+    .. versionadded:: 1.2.0
+"""
+
 
 template_doc = """
 What is considered a set is determined by the number of positional arguments used, that is, determined by the
@@ -451,6 +527,9 @@ The list *interval_arrays* must contain at least one element.  The {operation} c
 type will be a numpy array.  If it contains one interval array then the result can be coerced to a single boolean using the
 *squeeze* parameter.
 
+Alternatively, when *interval_arrays* contains a single interval array, *groups* can be used to split it into the arrays
+to be compared, which avoids constructing a large number of interval arrays.
+
 {extra_desc}
 Parameters
 ----------
@@ -458,7 +537,7 @@ Parameters
 
 Returns
 -------
-boolean, or :class:`numpy.ndarray` of boolean
+boolean, :class:`numpy.ndarray` of boolean, or :class:`pandas.Series` of boolean
 
 {examples}
 """
@@ -474,6 +553,8 @@ union_params = join_params(
         param_optional_args,
         param_squeeze.format(default="False"),
         param_return_type,
+        param_n_jobs,
+        param_groups_set_operation.format(operation="union"),
     ]
 )
 union_docstring = operation_template_doc.format(
@@ -491,6 +572,8 @@ intersection_params = join_params(
         param_min_overlaps,
         param_squeeze.format(default="False"),
         param_return_type,
+        param_n_jobs,
+        param_groups_set_operation.format(operation="intersection"),
     ]
 )
 intersection_docstring = operation_template_doc.format(
@@ -507,6 +590,7 @@ difference_params = join_params(
         param_optional_args_min_one,
         param_squeeze.format(default="False"),
         param_return_type,
+        param_n_jobs,
     ]
 )
 difference_docstring = doc_difference_template.format(
@@ -525,6 +609,7 @@ symmetric_difference_params = join_params(
         param_min_overlaps,
         param_squeeze.format(default="False"),
         param_return_type,
+        param_n_jobs,
     ]
 )
 symmetric_difference_extra_desc = """
@@ -570,6 +655,7 @@ issuperset_params = join_params(
         param_interval_sub_super_set,
         param_optional_args_min_one,
         param_squeeze.format(default="True"),
+        param_groups.format(operation="superset"),
     ]
 )
 issuperset_docstring = doc_is_sub_super_set_template.format(
@@ -585,6 +671,7 @@ issubset_params = join_params(
         param_interval_sub_super_set,
         param_optional_args_min_one,
         param_squeeze.format(default="True"),
+        param_groups.format(operation="subset"),
     ]
 )
 issubset_docstring = doc_is_sub_super_set_template.format(
@@ -598,7 +685,7 @@ issubset_docstring = doc_is_sub_super_set_template.format(
 coverage_docstring = """
 Calculates the fraction of a domain (or possibly multiple domains) covered by a collection of intervals.
 
-Calculation over multiple domains is only possible when *bins* = True.
+Calculation over multiple domains is only possible when *bins* = True or *bins* = "overlapping".
 
 Parameters
 ----------
@@ -612,14 +699,30 @@ domain : :py:class:`tuple`, :class:`pandas.Interval`, :class:`pandas.IntervalInd
     :class:`pandas.Interval`.  If *domain* is a :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
     then the intervals it contains define a possibly disconnected domain.
     If *bins* = True then *domain* must be :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray` with disjoint intervals.
-bins : boolean, default False
+    If *bins* = "overlapping" then *domain* must be :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`.
+bins : boolean or "overlapping", default False
     If False, then the *domain* is interpreted as a single domain and returns one value.
     If True, then *domain* is interpreted as disjoint bins over which coverage is calculated for each.
+    If "overlapping", then *domain* is interpreted as bins which may overlap, such as sliding windows.
+
+    .. versionadded:: 1.2.0
 how : {"fraction", "sum"}, default "fraction"
     If *how* = "fraction" then the result is a fraction of the size of the domain.
     If *how* = "sum" then the result is the length of the domain covered.
 
     .. versionadded:: 0.8.0
+n_jobs : int, optional
+    If specified, and not 1, the union of the intervals is calculated with a pool of *n_jobs* processes,
+    as per :func:`piso.union`.
+
+    .. versionadded:: 1.2.0
+groups : array-like, optional
+    Labels, one for each interval, which partition the intervals into groups.  The coverage of each group is
+    calculated in a single pass, and returned as a :class:`pandas.Series` indexed by the (sorted) labels.  If *domain*
+    is `None` then the domain of each group is the extremities of its intervals, otherwise the domain is shared by
+    all groups.  Intervals with a missing label are ignored.  Cannot be used with *bins* or *n_jobs*.
+
+    .. versionadded:: 1.2.0
 
 Returns
 -------
@@ -662,6 +765,20 @@ dtype: float64
 (4, 6]     1.0
 (7, 10]    1.0
 dtype: float64
+
+>>> windows = pd.arrays.IntervalArray.from_tuples(
+...     [(0, 4), (2, 6), (4, 8)],
+... )
+>>> piso.coverage(arr1, windows, bins="overlapping")
+(0, 4]    1.00
+(2, 6]    0.75
+(4, 8]    0.50
+dtype: float64
+
+>>> piso.coverage(arr1, (0, 10), groups=["a", "b", "b"])
+a    0.4
+b    0.3
+dtype: float64
 """
 
 
@@ -680,6 +797,13 @@ domain : :py:class:`tuple`, :class:`pandas.Interval`, :class:`pandas.IntervalInd
     If *domain* is a tuple then it should specify lower and upper bounds, and be equivalent to a
     :class:`pandas.Interval`.  If *domain* is a :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
     then the intervals it contains define a possibly disconnected domain.
+groups : array-like, optional
+    Labels, one for each interval, which partition the intervals into groups.  The complement of each group is
+    calculated in a single pass, and the result returned as a :class:`pandas.Series` of intervals indexed by the
+    (sorted) labels.  If *domain* is `None` then the domain of each group is the extremities of its intervals,
+    otherwise the domain is shared by all groups.  Intervals with a missing label are ignored.
+
+    .. versionadded:: 1.2.0
 
 Returns
 -------
@@ -719,6 +843,13 @@ Length: 2, closed: right, dtype: interval[int64]
 <IntervalArray>
 [(-5, -2], (8, 10]]
 Length: 2, closed: right, dtype: interval[int64]
+
+>>> piso.complement(arr1, (0, 10), groups=["a", "b", "b"])
+a    (4, 10]
+b     (0, 3]
+b     (5, 7]
+b    (8, 10]
+dtype: interval
 """
 
 
@@ -775,6 +906,9 @@ the i-th interval contains the j-th point.
 
 If *result = "points"* then the result is a 1-dimensional boolean mask of length *n*.
 If *result = "intervals"* then the result is a 1-dimensional boolean mask of length *m*.
+If *result = "sparse"* then the result contains the pairs of intervals and points for which the
+interval contains the point, ordered by interval.  It is equivalent to the True elements of *M*, but
+is calculated without evaluating *M*, in time and memory proportional to the number of pairs.
 
 Parameters
 ----------
@@ -785,9 +919,14 @@ x : scalar, or array-like of scalars
 include_index : boolean, default True
     Indicates whether to return a :class:`numpy.ndarray` or :class:`pandas.DataFrame` indexed
     by *interval_array* and column names equal to *x*
-result : {"cartesian", "points", "intervals"}, default "cartesian"
-    If *result* = "cartesian" then the result will be two dimensional, otherwise it will be
-    one dimensional.
+result : {"cartesian", "points", "intervals", "sparse"}, default "cartesian"
+    If *result* = "cartesian" then the result will be two dimensional.  If *result* = "sparse" then the
+    result will be a :class:`pandas.DataFrame` with columns "interval" and "point" if *include_index* is True,
+    otherwise a tuple of two integer :class:`numpy.ndarray` containing the positions of the intervals, and points.
+    Otherwise the result will be one dimensional.
+
+    .. versionadded:: 1.2.0
+        The "sparse" option.
 how : {"any", "all"}, default "any"
     Only relevant if *result* is not "cartesian".  This parameter indicates either:
     - a True value means any or all points are contained within an interval, or
@@ -797,8 +936,8 @@ how : {"any", "all"}, default "any"
 
 Returns
 -------
-:class:`numpy.ndarray`, :class:`pandas.DataFrame` or :class:`pandas.Series`
-    One, or two, dimensional and boolean valued.  Return type dependent on *include_index* and *result*.
+:class:`numpy.ndarray`, :class:`pandas.DataFrame`, :class:`pandas.Series` or tuple
+    One, or two, dimensional and boolean valued, unless *result* = "sparse".  Return type dependent on *include_index* and *result*.
 
 Examples
 --------
@@ -843,6 +982,17 @@ dtype: bool
 (2, 5]    True
 dtype: bool
 
+>>> piso.contains(arr, [0, 1, 3, 4], result="sparse")
+  interval  point
+0   (0, 4]      1
+1   (0, 4]      3
+2   (0, 4]      4
+3   (2, 5]      3
+4   (2, 5]      4
+
+>>> piso.contains(arr, [0, 1, 3, 4], result="sparse", include_index=False)
+(array([0, 0, 0, 1, 1]), array([1, 2, 3, 2, 3]))
+
 >>> piso.contains(pd.IntervalIndex.from_tuples([(0,2)]), 1, include_index=False)
 array([[ True]])
 """
@@ -909,11 +1059,19 @@ interval_array : :class:`pandas.IntervalIndex` or :class:`pandas.arrays.Interval
 threshold : scalar
     The value should belong to the domain that arises from a subtraction over the domain of the intervals.
     For instance, if intervals are timestamp data, then *threshold* should be timedelta.
+    If *groups* is specified then *threshold* may be a :py:class:`dict` or :class:`pandas.Series`, mapping each
+    group label to the threshold for that group.
+groups : array-like, optional
+    Labels, one for each interval, which partition the intervals into groups.  Intervals are only merged with
+    others in the same group, and the result is returned as a :class:`pandas.Series` of intervals indexed by
+    the group labels, in sorted order.  Intervals with a missing label are ignored.
+
+    .. versionadded:: 1.2.0
 
 Returns
 -------
 :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
-    Return type will be the same type as the object the accessor belongs to.
+    Return type will be the same type as the object the accessor belongs to, unless *groups* is specified.
 
 
 Examples
@@ -928,16 +1086,21 @@ Examples
 
 >>> piso.bridge(arr, threshold=1)
 <IntervalArray>
-[(0.0, 5.0], (7.0, 8.0], (11.0, 12.0]]
-Length: 3, closed: right, dtype: interval[float64]
+[(0, 5], (7, 8], (11, 12]]
+Length: 3, closed: right, dtype: interval[int64]
 
 >>> piso.bridge(arr, threshold=2)
 <IntervalArray>
-[(0.0, 8.0], (11.0, 12.0]]
-Length: 2, closed: right, dtype: interval[float64]
+[(0, 8], (11, 12]]
+Length: 2, closed: right, dtype: interval[int64]
 
 >>> piso.bridge(arr, threshold=3)
 <IntervalArray>
-[(0.0, 12.0]]
-Length: 1, closed: right, dtype: interval[float64]
+[(0, 12]]
+Length: 1, closed: right, dtype: interval[int64]
+
+>>> piso.bridge(arr, threshold={"a": 1, "b": 3}, groups=["a", "a", "b", "b"])
+a     (0, 5]
+b    (7, 12]
+dtype: interval
 """
@@ -75,6 +75,11 @@ suffixes : list of str or None, default None
     Suffixes to use for overlapping columns.  If used then should be same length as *frames_or_series*.
 sort : bool, default False
     Order result DataFrame lexicographically by the join key. If False, the order of the join key depends on the join type.
+n_jobs : int, optional
+    If specified, and not 1, the interval indexes are searched in a pool of *n_jobs* threads.
+    Negative values count back from the number of available processors, so -1 uses all of them, and -2 all but one.
+
+    .. versionadded:: 1.2.0
 
 Returns
 -------
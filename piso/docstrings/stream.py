@@ -0,0 +1,126 @@
+join_docstring = """
+Joins multiple streams of dataframes or series by their :class:`pandas.IntervalIndex`.
+
+The streaming counterpart to :func:`piso.join`, for data which does not fit in memory.  Each argument is an iterable
+of chunks - dataframes or series indexed by a :class:`pandas.IntervalIndex` - where the intervals across all chunks
+are disjoint and ordered by their left endpoint.  Chunks are consumed from each iterable only as needed, and once
+every iterable has advanced past a point (the watermark) the join of all intervals before it is yielded.  Only the
+chunks which have not been joined are held in memory.
+
+The join types, and treatment of overlapping columns, are as per :func:`piso.join`.  The rows of each yielded
+dataframe are sorted, and concatenating the yielded dataframes gives the result of :func:`piso.join` with *sort* = True.
+
+.. versionadded:: 1.2.0
+
+Parameters
+----------
+*iterables : argument list of iterables of :class:`pandas.DataFrame` or :class:`pandas.Series`
+    May contain two or more arguments.  Every chunk must be indexed by a :class:`pandas.IntervalIndex`,
+    with a *closed* value of "left" or "right".  Every :class:`pandas.Series` must have a name.
+how : {"left", "right", "inner", "outer"}, default "left"
+    What sort of join to perform.
+suffixes : list of str or None, default None
+    Suffixes to use for overlapping columns.  If used then should be same length as *iterables*.
+
+Yields
+------
+:class:`pandas.DataFrame`
+    A dataframe containing columns from elements of *iterables*
+
+Examples
+--------
+
+>>> import pandas as pd
+>>> import piso.stream
+
+>>> df = pd.DataFrame(
+...     {"A":[4,3,2,1], "B":["w","x","y","z"]},
+...     index=pd.IntervalIndex.from_tuples([(1,3), (5,7), (8,9), (10,12)]),
+... )
+>>> s = pd.Series(
+...     [True, False, True],
+...     index=pd.IntervalIndex.from_tuples([(2,4), (5,6), (11,13)]),
+...     name="C",
+... )
+
+>>> chunks = piso.stream.join(
+...     (df.iloc[i:i+2] for i in range(0, len(df), 2)),
+...     (s.iloc[i:i+2] for i in range(0, len(s), 2)),
+... )
+>>> for chunk in chunks:
+...     print(chunk)
+        A  B     C
+(1, 2]  4  w   NaN
+(2, 3]  4  w  True
+        A  B      C
+(5, 6]  3  x  False
+(6, 7]  3  x    NaN
+(8, 9]  2  y    NaN
+          A  B    C
+(10, 11]  1  z  NaN
+          A  B     C
+(11, 12]  1  z  True
+
+>>> pd.concat(piso.stream.join([df], [s], how="outer"))
+            A    B      C
+(1, 2]    4.0    w    NaN
+(2, 3]    4.0    w   True
+(3, 4]    NaN  NaN   True
+(5, 6]    3.0    x  False
+(6, 7]    3.0    x    NaN
+(8, 9]    2.0    y    NaN
+(10, 11]  1.0    z    NaN
+(11, 12]  1.0    z   True
+(12, 13]  NaN  NaN   True
+"""
+
+union_docstring = """
+Performs the union of a stream of interval arrays.
+
+The streaming counterpart to :func:`piso.union`, for unbounded, or very large, collections of intervals.
+The chunks of *iterable* must be ordered by interval start, in the sense that no left endpoint in a chunk may
+be less than the largest left endpoint of a previous chunk.  The intervals within a chunk may be in any order.
+
+Once a chunk has been consumed, intervals of the union which end before its largest left endpoint (the watermark)
+can no longer be extended by later chunks, and are yielded.  Only the intervals of the union which are still open
+are held in memory.  Concatenating the yielded interval arrays gives the result of :func:`piso.union` applied to
+the concatenation of the chunks.
+
+.. versionadded:: 1.2.0
+
+Parameters
+----------
+iterable : iterable of :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray` or :class:`piso.IntervalSet`
+    Chunks of intervals, ordered by interval start.  Every chunk must have the same *closed* value,
+    which must be either "left" or "right".
+
+Yields
+------
+:class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray` or :class:`piso.IntervalSet`
+    Sorted, disjoint intervals of the union.  The type is the same as the first non-empty chunk.
+
+Examples
+--------
+
+>>> import pandas as pd
+>>> import piso.stream
+
+>>> chunks = [
+...     pd.arrays.IntervalArray.from_tuples([(0, 3), (1, 2)]),
+...     pd.arrays.IntervalArray.from_tuples([(2, 4), (5, 6)]),
+...     pd.arrays.IntervalArray.from_tuples([(6, 8), (7, 9)]),
+...     pd.arrays.IntervalArray.from_tuples([(12, 13)]),
+... ]
+
+>>> for intervals in piso.stream.union(chunks):
+...     print(intervals)
+<IntervalArray>
+[(0, 4]]
+Length: 1, dtype: interval[int64, right]
+<IntervalArray>
+[(5, 9]]
+Length: 1, dtype: interval[int64, right]
+<IntervalArray>
+[(12, 13]]
+Length: 1, dtype: interval[int64, right]
+"""
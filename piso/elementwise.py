@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+
+import piso.docstrings.elementwise as docstrings
+from piso import _sweep
+from piso._decorators import Appender
+from piso._exceptions import ClosedMismatchError
+from piso.util import _interval_x_to_endpoints, _validate_intervals
+
+# Each kernel receives the sortable values of all endpoints, and the positions of the endpoints of
+# each pair of intervals within them.  It returns the pieces of the result for each pair, as a list of
+# (starts, ends, valid) arrays, in ascending order.
+
+
+def _union(values, l1, r1, l2, r2):
+    separate = (values[r1] < values[l2]) | (values[r2] < values[l1])
+    first_is_1 = values[l1] <= values[l2]
+    last_end = np.where(values[r1] >= values[r2], r1, r2)
+    starts0 = np.where(first_is_1, l1, l2)
+    ends0 = np.where(separate, np.where(first_is_1, r1, r2), last_end)
+    starts1 = np.where(first_is_1, l2, l1)
+    ends1 = np.where(first_is_1, r2, r1)
+    return [
+        (starts0, ends0, np.ones(len(l1), dtype=bool)),
+        (starts1, ends1, separate),
+    ]
+
+
+def _intersection(values, l1, r1, l2, r2):
+    overlap = (values[r1] > values[l2]) & (values[r2] > values[l1])
+    starts = np.where(values[l1] >= values[l2], l1, l2)
+    ends = np.where(values[r1] <= values[r2], r1, r2)
+    return [(starts, ends, overlap)]
+
+
+def _difference(values, l1, r1, l2, r2):
+    overlap = (values[r1] > values[l2]) & (values[r2] > values[l1])
+    return [
+        (l1, np.where(overlap, l2, r1), ~overlap | (values[l1] < values[l2])),
+        (r2, r1, overlap & (values[r2] < values[r1])),
+    ]
+
+
+def _symmetric_difference(values, l1, r1, l2, r2):
+    # intervals which do not overlap have the same symmetric difference as union
+    overlap = (values[r1] > values[l2]) & (values[r2] > values[l1])
+    (starts0, ends0, _), (starts1, ends1, separate) = _union(values, l1, r1, l2, r2)
+    first_is_1 = values[l1] <= values[l2]
+    first_end_is_1 = values[r1] <= values[r2]
+    return [
+        (
+            starts0,
+            np.where(overlap, np.where(first_is_1, l2, l1), ends0),
+            ~overlap | (values[l1] != values[l2]),
+        ),
+        (
+            np.where(overlap, np.where(first_end_is_1, r1, r2), starts1),
+            np.where(overlap, np.where(first_end_is_1, r2, r1), ends1),
+            np.where(overlap, values[r1] != values[r2], separate),
+        ),
+    ]
+
+
+def _validate_args(interval_array1, interval_array2):
+    for interval_array in (interval_array1, interval_array2):
+        _validate_intervals(interval_array)
+    if interval_array1.closed != interval_array2.closed:
+        raise ClosedMismatchError
+    if len(interval_array1) != len(interval_array2):
+        raise ValueError("The interval arrays must have the same length.")
+
+
+def _make_elementwise(kernel, docstring):
+    @Appender(docstring, join="\n", indents=1)
+    def func(interval_array1, interval_array2):
+        interval_array1 = pd.arrays.IntervalArray(interval_array1)
+        interval_array2 = pd.arrays.IntervalArray(interval_array2)
+        _validate_args(interval_array1, interval_array2)
+
+        # positions of the endpoints of each pair, in the concatenation of all left, then right, endpoints
+        lefts, rights = _interval_x_to_endpoints(interval_array1, interval_array2)
+        endpoints = lefts.append(rights)
+        n = len(interval_array1)
+        l1 = np.arange(n)
+        l2, r1, r2 = l1 + n, l1 + 2 * n, l1 + 3 * n
+        pieces = kernel(_sweep._sortable(endpoints.values), l1, r1, l2, r2)
+
+        # pieces are interleaved, so the result is ordered by row, then position within the row
+        starts, ends, valid = (
+            np.stack([piece[i] for piece in pieces], axis=1) for i in range(3)
+        )
+        row_ids = np.repeat(l1, len(pieces))[valid.ravel()]
+        result = pd.arrays.IntervalArray.from_arrays(
+            endpoints.take(starts[valid]),
+            endpoints.take(ends[valid]),
+            closed=interval_array1.closed,
+        )
+        return result, row_ids
+
+    return func
+
+
+union = _make_elementwise(_union, docstrings.union_docstring)
+intersection = _make_elementwise(_intersection, docstrings.intersection_docstring)
+difference = _make_elementwise(_difference, docstrings.difference_docstring)
+symmetric_difference = _make_elementwise(
+    _symmetric_difference, docstrings.symmetric_difference_docstring
+)
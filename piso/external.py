@@ -0,0 +1,368 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+import piso.docstrings.external as docstrings
+from piso import _sweep
+from piso._decorators import Appender
+from piso._exceptions import DegenerateIntervalError
+
+# approximate number of bytes of memory required for each row of a chunk being read and sorted
+_ROW_BYTES = 64
+
+
+def _read_chunks(source, start, end, rows, read_kwargs):
+    # yields the left and right endpoints of the intervals in source, in chunks of (about) rows intervals
+    if isinstance(source, (str, os.PathLike)):
+        extension = os.path.splitext(source)[1].lower()
+        if extension == ".csv":
+            with pd.read_csv(
+                source, usecols=[start, end], chunksize=rows, **read_kwargs
+            ) as reader:
+                for frame in reader:
+                    yield frame[start], frame[end]
+        elif extension == ".parquet":
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ImportError("Reading Parquet files requires pyarrow.")
+            parquet_file = pq.ParquetFile(source, **read_kwargs)
+            for batch in parquet_file.iter_batches(
+                batch_size=rows, columns=[start, end]
+            ):
+                frame = batch.to_pandas()
+                yield frame[start], frame[end]
+        elif extension == ".npy":
+            array = np.load(source, mmap_mode="r", **read_kwargs)
+            for i in range(0, len(array), rows):
+                block = array[i : i + rows]
+                if array.dtype.names:
+                    yield block[start], block[end]
+                else:
+                    yield block[:, 0], block[:, 1]
+        else:
+            raise ValueError(
+                f"Unsupported file type: '{extension}'.  Files must be CSV, Parquet or NPY."
+            )
+    else:
+        for chunk in source:
+            if isinstance(chunk, pd.DataFrame):
+                yield chunk[start], chunk[end]
+            else:
+                yield chunk.left, chunk.right
+
+
+def _spill(values, directory):
+    # writes values to a temporary .npy file, returning a read-only memory map of it
+    with tempfile.NamedTemporaryFile(dir=directory, suffix=".npy", delete=False) as f:
+        np.save(f, values)
+    return np.load(f.name, mmap_mode="r")
+
+
+def _allocate(directory, dtype, size):
+    with tempfile.NamedTemporaryFile(dir=directory, suffix=".npy", delete=False) as f:
+        path = f.name
+    return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(size,))
+
+
+def _merge_runs(runs, directory, block_size):
+    # k-way merge of sorted arrays into a memory mapped array, holding about block_size values of each in memory.
+    # Each block is cut at the smallest of the last values in the next block of each run, so that every
+    # value not yet merged is no smaller than every value in the block.
+    if len(runs) == 1:
+        return runs[0]
+    result = _allocate(directory, runs[0].dtype, sum(len(run) for run in runs))
+    positions = [0] * len(runs)
+    written = 0
+    while written < len(result):
+        cutoff = min(
+            run[min(position + block_size, len(run)) - 1]
+            for run, position in zip(runs, positions)
+            if position < len(run)
+        )
+        parts = []
+        for i, (run, position) in enumerate(zip(runs, positions)):
+            stop = np.searchsorted(run, cutoff, side="right")
+            parts.append(run[position:stop])
+            positions[i] = stop
+        block = np.sort(np.concatenate(parts))
+        result[written : written + len(block)] = block
+        written += len(block)
+    result.flush()
+    return result
+
+
+def _promote(run, dtype, new_dtype, directory):
+    # casts a spilled run of sortable values to those of new_dtype
+    values = _sweep._to_sortable(
+        _sweep._from_sortable(np.asarray(run), dtype), new_dtype
+    )
+    return _spill(values, directory)
+
+
+def _sorted_endpoints(sources, start, end, memory, directory, read_kwargs):
+    # externally sorts the left endpoints, and the right endpoints, of all intervals in sources
+    # returns memory mapped arrays of sortable values, and the dtype of the endpoints.  The dtype is that
+    # common to the endpoints of all chunks, and runs already spilled are promoted when a chunk widens it.
+    rows = max(memory // _ROW_BYTES, 1)
+    left_runs, right_runs = [], []
+    dtype = None
+    for source in sources:
+        for lefts, rights in _read_chunks(source, start, end, rows, read_kwargs):
+            lefts, rights = pd.Index(lefts), pd.Index(rights)
+            chunk_dtype = _sweep._common_dtype(lefts.dtype, rights.dtype)
+            if dtype is None:
+                dtype = chunk_dtype
+            elif chunk_dtype != dtype:
+                new_dtype = _sweep._common_dtype(dtype, chunk_dtype)
+                if new_dtype != dtype:
+                    left_runs = [
+                        _promote(run, dtype, new_dtype, directory) for run in left_runs
+                    ]
+                    right_runs = [
+                        _promote(run, dtype, new_dtype, directory) for run in right_runs
+                    ]
+                    dtype = new_dtype
+            lefts, rights = lefts.astype(dtype), rights.astype(dtype)
+            if (lefts > rights).any():
+                raise ValueError("left side of interval must be <= right side")
+            if (lefts == rights).any():
+                degenerate = lefts == rights
+                raise DegenerateIntervalError(
+                    pd.IntervalIndex.from_arrays(lefts[degenerate], rights[degenerate])
+                )
+            left_runs.append(_spill(np.sort(_sweep._sortable(lefts.values)), directory))
+            right_runs.append(
+                _spill(np.sort(_sweep._sortable(rights.values)), directory)
+            )
+    if dtype is None:
+        raise ValueError("No intervals found.")
+    block_size = _block_size(memory, len(left_runs))
+    return (
+        _merge_runs(left_runs, directory, block_size),
+        _merge_runs(right_runs, directory, block_size),
+        dtype,
+    )
+
+
+def _regions(lefts, rights, min_depth, block_size):
+    # yields, in blocks, the starts and ends of the regions covered by at least min_depth intervals.
+    # lefts and rights are sorted, possibly memory mapped, arrays of endpoints.  Blocks are cut at
+    # endpoint values, so that all endpoints with the same value are in the same block.
+    i = j = 0
+    depth = 0
+    open_start = None
+    while i < len(lefts) or j < len(rights):
+        cutoff = min(
+            values[min(position + block_size, len(values)) - 1]
+            for values, position in ((lefts, i), (rights, j))
+            if position < len(values)
+        )
+        i_stop = np.searchsorted(lefts, cutoff, side="right")
+        j_stop = np.searchsorted(rights, cutoff, side="right")
+        values = np.concatenate([lefts[i:i_stop], rights[j:j_stop]])
+        deltas = np.repeat([1, -1], [i_stop - i, j_stop - j])
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        after = depth + np.cumsum(deltas[order])
+        # the depth is evaluated once all endpoints with the same value are accounted for
+        last = np.append(values[1:] != values[:-1], True)
+        values, after = values[last], after[last]
+        before = np.append(depth, after[:-1])
+        starts = values[(before < min_depth) & (after >= min_depth)]
+        ends = values[(before >= min_depth) & (after < min_depth)]
+        if open_start is not None:
+            starts = np.append(open_start, starts)
+        open_start = starts[-1] if len(starts) > len(ends) else None
+        starts = starts[: len(ends)]
+        depth = after[-1]
+        i, j = i_stop, j_stop
+        if len(starts) > 0:
+            yield starts, ends
+
+
+def _normalize(lefts, rights, directory, block_size):
+    # the union of the intervals, as memory mapped arrays of starts and ends
+    starts = _allocate(directory, lefts.dtype, len(lefts))
+    ends = _allocate(directory, rights.dtype, len(rights))
+    count = 0
+    for block_starts, block_ends in _regions(lefts, rights, 1, block_size):
+        starts[count : count + len(block_starts)] = block_starts
+        ends[count : count + len(block_ends)] = block_ends
+        count += len(block_starts)
+    starts.flush()
+    ends.flush()
+    return starts[:count], ends[:count]
+
+
+def _to_interval_array(blocks, dtype, closed):
+    if not blocks:
+        blocks = [(_sweep._to_sortable([], dtype), _sweep._to_sortable([], dtype))]
+    starts, ends = zip(*blocks)
+    return pd.arrays.IntervalArray.from_arrays(
+        _sweep._from_sortable(np.concatenate(starts), dtype),
+        _sweep._from_sortable(np.concatenate(ends), dtype),
+        closed=closed,
+    )
+
+
+def _get_domain(domain, lefts, rights, dtype):
+    if domain is None:
+        return lefts[0], rights[-1]
+    if isinstance(domain, pd.Interval):
+        domain = (domain.left, domain.right)
+    if not isinstance(domain, tuple) or len(domain) != 2:
+        raise ValueError(
+            "The domain parameter must be either a 2-tuple, pandas.Interval, or None."
+        )
+    return tuple(_sweep._to_sortable(list(domain), dtype))
+
+
+def _validate_closed(closed):
+    if closed not in ("left", "right"):
+        raise ValueError(
+            f"Only intervals with closed attribute of 'left' or 'right' supported.  Found '{closed}'."
+        )
+
+
+def _block_size(memory, runs=0):
+    return max(memory // (_ROW_BYTES * (runs + 1)), 1)
+
+
+def _clip(starts, ends, lower, upper):
+    starts, ends = np.maximum(starts, lower), np.minimum(ends, upper)
+    keep = starts < ends
+    return starts[keep], ends[keep]
+
+
+@Appender(docstrings.union_docstring, join="\n", indents=1)
+def union(
+    *sources,
+    start="start",
+    end="end",
+    closed="right",
+    memory=2**28,
+    temp_dir=None,
+    read_kwargs=None,
+):
+    _validate_closed(closed)
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        lefts, rights, dtype = _sorted_endpoints(
+            sources, start, end, memory, directory, read_kwargs or {}
+        )
+        blocks = list(_regions(lefts, rights, 1, _block_size(memory)))
+        del lefts, rights
+    return _to_interval_array(blocks, dtype, closed)
+
+
+@Appender(docstrings.intersection_docstring, join="\n", indents=1)
+def intersection(
+    *sources,
+    start="start",
+    end="end",
+    closed="right",
+    min_overlaps="all",
+    memory=2**28,
+    temp_dir=None,
+    read_kwargs=None,
+):
+    _validate_closed(closed)
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        if len(sources) == 1:
+            # as per piso.intersection, the intersection of the intervals in a single source
+            lefts, rights, dtype = _sorted_endpoints(
+                sources, start, end, memory, directory, read_kwargs or {}
+            )
+            operands = len(lefts)
+        else:
+            # each source defines a set, by the union of its intervals
+            starts, ends, dtypes = [], [], []
+            for source in sources:
+                lefts, rights, source_dtype = _sorted_endpoints(
+                    [source], start, end, memory, directory, read_kwargs or {}
+                )
+                source_starts, source_ends = _normalize(
+                    lefts, rights, directory, _block_size(memory)
+                )
+                starts.append(source_starts)
+                ends.append(source_ends)
+                dtypes.append(source_dtype)
+            dtype = _sweep._common_dtype(*dtypes)
+            for i, source_dtype in enumerate(dtypes):
+                if source_dtype != dtype:
+                    starts[i] = _promote(starts[i], source_dtype, dtype, directory)
+                    ends[i] = _promote(ends[i], source_dtype, dtype, directory)
+            block_size = _block_size(memory, len(sources))
+            lefts = _merge_runs(starts, directory, block_size)
+            rights = _merge_runs(ends, directory, block_size)
+            # memory mapped files cannot be removed, on some platforms, while they are mapped
+            del starts, ends, source_starts, source_ends
+            operands = len(sources)
+        min_depth = operands if min_overlaps == "all" else min_overlaps
+        blocks = list(_regions(lefts, rights, min_depth, _block_size(memory)))
+        del lefts, rights
+    return _to_interval_array(blocks, dtype, closed)
+
+
+@Appender(docstrings.complement_docstring, join="\n", indents=1)
+def complement(
+    source,
+    domain=None,
+    start="start",
+    end="end",
+    closed="right",
+    memory=2**28,
+    temp_dir=None,
+    read_kwargs=None,
+):
+    _validate_closed(closed)
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        lefts, rights, dtype = _sorted_endpoints(
+            [source], start, end, memory, directory, read_kwargs or {}
+        )
+        lower, upper = _get_domain(domain, lefts, rights, dtype)
+        blocks = []
+        previous_end = lower
+        for starts, ends in _regions(lefts, rights, 1, _block_size(memory)):
+            blocks.append(
+                _clip(np.append(previous_end, ends[:-1]), starts, lower, upper)
+            )
+            previous_end = ends[-1]
+        blocks.append(_clip(np.array([previous_end]), np.array([upper]), lower, upper))
+        del lefts, rights
+    return _to_interval_array(
+        [block for block in blocks if len(block[0]) > 0], dtype, closed
+    )
+
+
+@Appender(docstrings.coverage_docstring, join="\n", indents=1)
+def coverage(
+    source,
+    domain=None,
+    how="fraction",
+    start="start",
+    end="end",
+    memory=2**28,
+    temp_dir=None,
+    read_kwargs=None,
+):
+    assert how in ("fraction", "sum")
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        lefts, rights, dtype = _sorted_endpoints(
+            [source], start, end, memory, directory, read_kwargs or {}
+        )
+        lower, upper = _get_domain(domain, lefts, rights, dtype)
+        covered = 0
+        for starts, ends in _regions(lefts, rights, 1, _block_size(memory)):
+            starts, ends = _clip(starts, ends, lower, upper)
+            covered += (ends - starts).sum()
+        del lefts, rights
+    if how == "fraction":
+        return covered / (upper - lower)
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return pd.Timedelta(int(covered), unit=dtype.unit)
+    if dtype.kind in "Mm":
+        return pd.Timedelta(int(covered), unit=np.datetime_data(dtype)[0])
+    return float(covered)
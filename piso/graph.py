@@ -1,9 +1,10 @@
-import itertools
-
 import numpy as np
 import pandas as pd
 
+from piso import _sweep
 from piso.intervalarray import _validate_array_of_intervals_arrays
+from piso.intervalset import IntervalSet
+from piso.util import _interval_x_to_endpoints
 
 
 def _adj_mat_intersection(lefts, rights, closed, fill_diagonal=True):
@@ -15,13 +16,27 @@ def _adj_mat_intersection(lefts, rights, closed, fill_diagonal=True):
     return result
 
 
-def _adjacency_matrix_set_of_intervals(interval_array, edges, include_index):
-    if edges == "intersect":
-        result = _adj_mat_intersection(
+def _edges_to_frame(edge_list, nodes):
+    rows, cols = edge_list
+    if isinstance(nodes, IntervalSet):
+        nodes = nodes.array
+    return pd.DataFrame({"source": nodes.take(rows), "target": nodes.take(cols)})
+
+
+def _adjacency_matrix_set_of_intervals(interval_array, edges, include_index, result):
+    if edges == "intersect" and result == "edges":
+        matrix = None
+        edge_list = _sweep._intersecting_pairs(
+            interval_array.left.values,
+            interval_array.right.values,
+            interval_array.closed,
+        )
+    elif edges == "intersect":
+        matrix = _adj_mat_intersection(
             interval_array.left, interval_array.right, interval_array.closed
         )
     elif edges == "disjoint":
-        result = ~_adj_mat_intersection(
+        matrix = ~_adj_mat_intersection(
             interval_array.left,
             interval_array.right,
             interval_array.closed,
@@ -30,47 +45,57 @@ def _adjacency_matrix_set_of_intervals(interval_array, edges, include_index):
     else:
         raise ValueError(f"Invalid value for edges parameter: {edges}")
 
+    if result == "edges":
+        if matrix is not None:
+            edge_list = np.nonzero(matrix)
+        if include_index:
+            return _edges_to_frame(edge_list, interval_array)
+        return edge_list
+
     if include_index:
-        result = pd.DataFrame(result, index=interval_array, columns=interval_array)
+        matrix = pd.DataFrame(matrix, index=interval_array, columns=interval_array)
 
-    return result
+    return matrix
 
 
-def _adjacency_matrix_set_of_sets(*interval_arrays, edges, include_index):
+def _adjacency_matrix_set_of_sets(*interval_arrays, edges, include_index, result):
     _validate_array_of_intervals_arrays(*interval_arrays, validate_intervals=False)
-    lefts = list(itertools.chain.from_iterable([ia.left for ia in interval_arrays]))
-    rights = list(itertools.chain.from_iterable([ia.right for ia in interval_arrays]))
+    if edges not in ("intersect", "disjoint"):
+        raise ValueError(f"Invalid value for edges parameter: {edges}")
+    lefts, rights = _interval_x_to_endpoints(*interval_arrays)
+    lefts, rights = _sweep._sortable(lefts.values), _sweep._sortable(rights.values)
     closed = interval_arrays[0].closed
 
-    if edges == "intersect":
-        component_result = _adj_mat_intersection(lefts, rights, closed)
-        numpy_logical = np.logical_or
-    elif edges == "disjoint":
-        component_result = ~_adj_mat_intersection(
-            lefts, rights, closed, fill_diagonal=False
-        )
-        numpy_logical = np.logical_and
-    else:
-        raise ValueError(f"Invalid value for edges parameter: {edges}")
+    sizes = [len(ia) for ia in interval_arrays]
+    set_ids = np.repeat(np.arange(len(interval_arrays)), sizes)
+    matrix = _sweep._set_adjacency(lefts, rights, set_ids, len(interval_arrays), closed)
 
-    index = np.cumsum([0] + [len(ia) for ia in interval_arrays[:-1]])
-    result = numpy_logical.reduceat(
-        numpy_logical.reduceat(component_result, index, axis=0), index, axis=1
-    )
-    np.fill_diagonal(result, False)
+    if edges == "disjoint":
+        matrix = ~matrix
+    np.fill_diagonal(matrix, False)
+
+    if result == "edges":
+        edge_list = np.nonzero(matrix)
+        if include_index:
+            return _edges_to_frame(edge_list, pd.RangeIndex(len(interval_arrays)))
+        return edge_list
 
     if include_index:
-        result = pd.DataFrame(
-            result,
+        matrix = pd.DataFrame(
+            matrix,
             index=range(len(interval_arrays)),
             columns=range(len(interval_arrays)),
         )
 
-    return result
+    return matrix
 
 
 def adjacency_matrix(
-    interval_array, *interval_arrays, edges="intersect", include_index=True
+    interval_array,
+    *interval_arrays,
+    edges="intersect",
+    include_index=True,
+    result="matrix",
 ):
     """
     Returns a 2D array (or dataframe) of boolean values indicating edges between nodes in a graph.
@@ -100,11 +125,20 @@ def adjacency_matrix(
     include_index : bool, default True
         If True then a :class:`pandas.DataFrame`, indexed by the intervals, is returned.
         If False then a :class:`numpy.ndarray` is returned.
+    result : {"matrix", "edges"}, default "matrix"
+        If "matrix" then the adjacency matrix is returned.  If "edges" then an edge list, equivalent to
+        the positions of the True values in the adjacency matrix, is returned.  If *include_index* is True
+        the edge list is a :class:`pandas.DataFrame` with columns "source" and "target", otherwise it is a
+        tuple of two integer :class:`numpy.ndarray`, in the same format as :func:`numpy.nonzero`.
+        When *edges* = "intersect" and *interval_arrays* is empty the edge list is calculated without
+        constructing the adjacency matrix, in O(n log n + E) time and O(n + E) memory for n intervals and E edges.
+
+        .. versionadded:: 1.2.0
 
     Returns
     -------
-    :class:`pandas.DataFrame` or :class:`numpy.ndarray`
-        Boolean valued, symmetrical, with False along diagonal.
+    :class:`pandas.DataFrame`, :class:`numpy.ndarray` or tuple
+        If *result* = "matrix" then boolean valued, symmetrical, with False along diagonal.
 
     Examples
     --------
@@ -132,6 +166,18 @@ def adjacency_matrix(
            [False, False, False, False,  True],
            [False, False, False,  True, False]])
 
+    >>> piso.adjacency_matrix(arr, result="edges")
+        source   target
+    0   [0, 4]   [3, 6]
+    1   [3, 6]   [0, 4]
+    2   [3, 6]   [5, 7]
+    3   [5, 7]   [3, 6]
+    4   [8, 9]  [9, 10]
+    5  [9, 10]   [8, 9]
+
+    >>> piso.adjacency_matrix(arr, result="edges", include_index=False)
+    (array([0, 1, 1, 2, 3, 4]), array([1, 0, 2, 1, 4, 3]))
+
     >>> piso.adjacency_matrix(arr, edges="disjoint")
              [0, 4]  [3, 6]  [5, 7]  [8, 9]  [9, 10]
     [0, 4]    False   False    True    True     True
@@ -159,9 +205,17 @@ def adjacency_matrix(
            [ True,  True,  True, False]])
     """
 
+    if result not in ("matrix", "edges"):
+        raise ValueError(f"Invalid value for result parameter: {result}")
     if len(interval_arrays) == 0:
-        return _adjacency_matrix_set_of_intervals(interval_array, edges, include_index)
+        return _adjacency_matrix_set_of_intervals(
+            interval_array, edges, include_index, result
+        )
     else:
         return _adjacency_matrix_set_of_sets(
-            interval_array, *interval_arrays, edges=edges, include_index=include_index
+            interval_array,
+            *interval_arrays,
+            edges=edges,
+            include_index=include_index,
+            result=result,
         )
@@ -1,11 +1,14 @@
 import numpy as np
 import pandas as pd
-import staircase as sc
 
 import piso.docstrings.intervalarray as docstrings
+from piso import _parallel, _sweep
 from piso._decorators import Appender
+from piso.intervalset import IntervalSet, _normalize
 from piso.util import (
     _boolean_stairs_to_interval_array,
+    _endpoints_to_interval_array,
+    _interval_x_to_endpoints,
     _interval_x_to_stairs,
     _validate_intervals,
 )
@@ -22,30 +25,109 @@ def _validate_array_of_intervals_arrays(*interval_arrays, validate_intervals=Tru
     _check_matched_closed(interval_arrays)
     if validate_intervals:
         for arr in interval_arrays:
-            _validate_intervals(arr)
+            if not isinstance(arr, IntervalSet):
+                _validate_intervals(arr)
 
 
 def _get_return_type(interval_array, return_type):
-    assert return_type in ("infer", pd.IntervalIndex, pd.arrays.IntervalArray)
+    assert return_type in (
+        "infer",
+        pd.IntervalIndex,
+        pd.arrays.IntervalArray,
+        IntervalSet,
+    )
     return interval_array.__class__ if return_type == "infer" else return_type
 
 
-def _make_stairs(*interval_arrays):
-    if len(interval_arrays) == 1:
-        stairs = _interval_x_to_stairs(*interval_arrays)
-    else:
-        stairs = sc.sum(
-            [_interval_x_to_stairs(arr).make_boolean() for arr in interval_arrays]
+def _factorize_groups(interval_array, groups):
+    # integer ids, and sorted labels, of the groups.  Intervals with a missing label are removed.
+    if len(groups) != len(interval_array):
+        raise ValueError(
+            "The length of groups must match the length of the interval array."
+        )
+    group_ids, labels = pd.factorize(pd.Index(groups), sort=True)
+    if (group_ids < 0).any():
+        interval_array = interval_array[group_ids >= 0]
+        group_ids = group_ids[group_ids >= 0]
+    return interval_array, group_ids, labels
+
+
+def _validate_grouped_set_operation(interval_arrays, n_jobs):
+    if interval_arrays:
+        raise ValueError(
+            "Only one interval array may be supplied when groups is specified."
         )
-    return stairs
+    if n_jobs is not None and n_jobs != 1:
+        raise ValueError("The n_jobs parameter is not supported with groups.")
+
+
+def _grouped_result(lefts, rights, starts, ends, closed, group_ids, labels):
+    # a Series of the intervals in the result of a grouped operation, indexed by group label
+    result = _endpoints_to_interval_array(
+        lefts, rights, starts, ends, closed, pd.arrays.IntervalArray
+    )
+    return pd.Series(result, index=labels.take(group_ids[starts]))
+
+
+def _interval_set_to_return_type(interval_set, cls):
+    if cls is IntervalSet:
+        return interval_set
+    return cls(interval_set.array)
+
+
+def _set_operation(operation, interval_arrays, cls, min_overlaps=None, n_jobs=None):
+    # if n_jobs is specified then the operation is computed over partitions of the domain, in parallel
+    lefts, rights = _interval_x_to_endpoints(*interval_arrays)
+    args = (
+        lefts.values,
+        rights.values,
+        [len(arr) for arr in interval_arrays],
+        [isinstance(arr, IntervalSet) for arr in interval_arrays],
+        operation,
+        min_overlaps,
+    )
+    if n_jobs is None or n_jobs == 1:
+        starts, ends = _sweep._segments(*args)
+    else:
+        starts, ends = _parallel._segments(*args, n_jobs=n_jobs)
+    endpoints = lefts.append(rights)
+    return _endpoints_to_interval_array(
+        endpoints, endpoints, starts, ends, interval_arrays[0].closed, cls
+    )
 
 
 @Appender(docstrings.union_docstring, join="\n", indents=1)
-def union(interval_array, *interval_arrays, squeeze=False, return_type="infer"):
+def union(
+    interval_array,
+    *interval_arrays,
+    squeeze=False,
+    return_type="infer",
+    n_jobs=None,
+    groups=None,
+):
     _validate_array_of_intervals_arrays(interval_array, *interval_arrays)
     klass = _get_return_type(interval_array, return_type)
-    stairs = _make_stairs(interval_array, *interval_arrays)
-    result = _boolean_stairs_to_interval_array(stairs.make_boolean(), klass)
+    if groups is not None:
+        _validate_grouped_set_operation(interval_arrays, n_jobs)
+        interval_array, group_ids, labels = _factorize_groups(interval_array, groups)
+        starts, ends = _sweep._union(
+            interval_array.left.values, interval_array.right.values, group_ids
+        )
+        return _grouped_result(
+            interval_array.left,
+            interval_array.right,
+            starts,
+            ends,
+            interval_array.closed,
+            group_ids,
+            labels,
+        )
+    if isinstance(interval_array, IntervalSet) and not interval_arrays:
+        result = _interval_set_to_return_type(interval_array, klass)
+    else:
+        result = _set_operation(
+            "union", (interval_array, *interval_arrays), klass, n_jobs=n_jobs
+        )
     if squeeze and len(result) == 1:
         result = result[0]
     return result
@@ -58,29 +140,58 @@ def intersection(
     min_overlaps="all",
     squeeze=False,
     return_type="infer",
+    n_jobs=None,
+    groups=None,
 ):
     _validate_array_of_intervals_arrays(interval_array, *interval_arrays)
     klass = _get_return_type(interval_array, return_type)
+    if groups is not None:
+        _validate_grouped_set_operation(interval_arrays, n_jobs)
+        interval_array, group_ids, labels = _factorize_groups(interval_array, groups)
+        if min_overlaps == "all":
+            min_overlaps = np.bincount(group_ids, minlength=len(labels))
+        starts, ends = _sweep._grouped_intersection(
+            interval_array.left.values,
+            interval_array.right.values,
+            group_ids,
+            min_overlaps,
+        )
+        endpoints = interval_array.left.append(interval_array.right)
+        return _grouped_result(
+            endpoints,
+            endpoints,
+            starts,
+            ends,
+            interval_array.closed,
+            np.concatenate([group_ids, group_ids]),
+            labels,
+        )
     if min_overlaps == "all":
         min_overlaps = (
             len(interval_arrays) + 1 if interval_arrays else len(interval_array)
         )
-    stairs = _make_stairs(interval_array, *interval_arrays)
-    result = _boolean_stairs_to_interval_array(stairs >= min_overlaps, klass)
+    result = _set_operation(
+        "intersection",
+        (interval_array, *interval_arrays),
+        klass,
+        min_overlaps=min_overlaps,
+        n_jobs=n_jobs,
+    )
     if squeeze and len(result) == 1:
         result = result[0]
     return result
 
 
 @Appender(docstrings.difference_docstring, join="\n", indents=1)
-def difference(interval_array, *interval_arrays, squeeze=False, return_type="infer"):
+def difference(
+    interval_array, *interval_arrays, squeeze=False, return_type="infer", n_jobs=None
+):
     assert interval_arrays
     _validate_array_of_intervals_arrays(interval_array, *interval_arrays)
     klass = _get_return_type(interval_array, return_type)
-    stairs_operand1 = _interval_x_to_stairs(interval_array)
-    stairs_operand2 = _make_stairs(*interval_arrays)
-    stairs = stairs_operand1 & (~stairs_operand2)
-    result = _boolean_stairs_to_interval_array(stairs, klass)
+    result = _set_operation(
+        "difference", (interval_array, *interval_arrays), klass, n_jobs=n_jobs
+    )
     if squeeze and len(result) == 1:
         result = result[0]
     return result
@@ -88,7 +199,12 @@ def difference(interval_array, *interval_arrays, squeeze=False, return_type="inf
 
 @Appender(docstrings.symmetric_difference_docstring, join="\n", indents=1)
 def symmetric_difference(
-    interval_array, *interval_arrays, min_overlaps=2, squeeze=False, return_type="infer"
+    interval_array,
+    *interval_arrays,
+    min_overlaps=2,
+    squeeze=False,
+    return_type="infer",
+    n_jobs=None,
 ):
     _validate_array_of_intervals_arrays(interval_array, *interval_arrays)
     klass = _get_return_type(interval_array, return_type)
@@ -96,13 +212,13 @@ def symmetric_difference(
         min_overlaps = (
             len(interval_arrays) + 1 if interval_arrays else len(interval_array)
         )
-    stairs = _make_stairs(interval_array, *interval_arrays)
-
-    if min_overlaps == 2:
-        stairs = stairs == 1
-    else:
-        stairs = (stairs >= 1) & (stairs <= min_overlaps - 1)
-    result = _boolean_stairs_to_interval_array(stairs, klass)
+    result = _set_operation(
+        "symmetric_difference",
+        (interval_array, *interval_arrays),
+        klass,
+        min_overlaps=min_overlaps,
+        n_jobs=n_jobs,
+    )
     if squeeze and len(result) == 1:
         result = result[0]
     return result
@@ -114,41 +230,79 @@ def isdisjoint(interval_array, *interval_arrays):
         interval_array, *interval_arrays, validate_intervals=bool(interval_arrays)
     )
     if interval_arrays:
-        stairs = _make_stairs(interval_array, *interval_arrays)
-        result = stairs.max() <= 1
-    elif len(interval_array) == 0:
+        interval_arrays = (interval_array, *interval_arrays)
+        lefts, rights = _interval_x_to_endpoints(*interval_arrays)
+        result = _sweep._operands_disjoint(
+            lefts.values,
+            rights.values,
+            [len(arr) for arr in interval_arrays],
+            [isinstance(arr, IntervalSet) for arr in interval_arrays],
+        )
+    elif len(interval_array) == 0 or isinstance(interval_array, IntervalSet):
         result = True
     else:
-        arr = np.stack([interval_array.left.values, interval_array.right.values])
-        arr = arr[arr[:, 0].argsort()]
-        if interval_array.closed == "both":
-            result = np.all(arr[0, 1:] > arr[1, :-1])
-        else:
-            result = np.all(arr[0, 1:] >= arr[1, :-1])
+        result = _sweep._is_disjoint(
+            interval_array.left.values,
+            interval_array.right.values,
+            strict=interval_array.closed == "both",
+        )
     return result
 
 
 def _create_is_super_or_sub(which, docstring):
-
-    comparator_func = {"superset": sc.Stairs.ge, "subset": sc.Stairs.le}[which]
-
     @Appender(docstring, join="\n", indents=1)
-    def func(interval_array, *interval_arrays, squeeze=True):
+    def func(interval_array, *interval_arrays, squeeze=True, groups=None):
         _validate_array_of_intervals_arrays(interval_array, *interval_arrays)
         assert interval_arrays
-        stepfunction = _interval_x_to_stairs(interval_array).make_boolean()
-
-        def _comp(ia):
-            return bool(
-                comparator_func(
-                    stepfunction,
-                    _interval_x_to_stairs(ia).make_boolean(),
+        if groups is None:
+            sizes = [len(arr) for arr in interval_arrays]
+            group_ids = np.repeat(np.arange(len(interval_arrays)), sizes)
+            n_groups = len(interval_arrays)
+        else:
+            if len(interval_arrays) != 1:
+                raise ValueError(
+                    "Exactly one interval array must be compared when groups is specified."
                 )
-            )
+            if len(groups) != len(interval_arrays[0]):
+                raise ValueError(
+                    "The length of groups must match the length of the interval array."
+                )
+            group_ids, labels = pd.factorize(pd.Index(groups), sort=True)
+            n_groups = len(labels)
+
+        # all candidates are compared in a single pass, using binary searches on the reference's endpoints
+        lefts, rights = _interval_x_to_endpoints(interval_array, *interval_arrays)
+        lefts, rights = _sweep._sortable(lefts.values), _sweep._sortable(rights.values)
+        n = len(interval_array)
+        ref_lefts, ref_rights = lefts[:n], rights[:n]
+        if not isinstance(interval_array, IntervalSet):
+            starts, ends = _sweep._union(ref_lefts, ref_rights)
+            ref_lefts, ref_rights = ref_lefts[starts], ref_rights[ends]
+        lefts, rights = lefts[n:], rights[n:]
+        labelled = group_ids >= 0
+        lefts, rights, group_ids = (
+            lefts[labelled],
+            rights[labelled],
+            group_ids[labelled],
+        )
 
-        result = np.array([_comp(ia) for ia in interval_arrays])
+        if which == "superset":
+            # every interval of the candidate is contained in an interval of the reference
+            outside = ~_sweep._in_any(ref_lefts, ref_rights, lefts, rights)
+            result = np.bincount(group_ids[outside], minlength=n_groups) == 0
+        else:
+            # every interval of the reference is contained in an interval of the candidate's union
+            starts, ends = _sweep._union(lefts, rights, group_ids)
+            counts = _sweep._count_within(
+                ref_lefts, ref_rights, lefts[starts], rights[ends]
+            )
+            result = np.bincount(
+                group_ids[starts], weights=counts, minlength=n_groups
+            ) == len(ref_lefts)
 
-        if squeeze and len(result) == 1:
+        if groups is not None:
+            result = pd.Series(result, index=labels)
+        elif squeeze and len(result) == 1:
             result = result[0]
         return result
 
@@ -178,36 +332,140 @@ def _get_domain_tuple(interval_array, domain):
     return domain
 
 
+def _grouped_domains(interval_array, group_ids, n_groups, domain):
+    # left and right endpoints of the domain of each group, and the group each belongs to.  If domain is None then
+    # the domain of a group is the extremities of its intervals, otherwise every group shares the same domain.
+    if domain is None:
+        lefts = pd.Series(interval_array.left).groupby(group_ids).min()
+        rights = pd.Series(interval_array.right).groupby(group_ids).max()
+        return pd.Index(lefts), pd.Index(rights), lefts.index.values
+    if isinstance(domain, (pd.IntervalIndex, pd.arrays.IntervalArray)):
+        domain = pd.arrays.IntervalArray(domain)
+    else:
+        left, right = _get_domain_tuple(interval_array, domain)
+        domain = pd.arrays.IntervalArray.from_arrays([left], [right])
+    positions = np.tile(np.arange(len(domain)), n_groups)
+    return (
+        domain.left.take(positions),
+        domain.right.take(positions),
+        np.repeat(np.arange(n_groups), len(domain)),
+    )
+
+
+def _grouped_endpoints(interval_array, groups, domain):
+    # the endpoints of the intervals, followed by those of the domains, and arguments for _sweep's grouped kernels
+    interval_array, group_ids, labels = _factorize_groups(interval_array, groups)
+    domain_lefts, domain_rights, domain_groups = _grouped_domains(
+        interval_array, group_ids, len(labels), domain
+    )
+    endpoints = interval_array.left.append(
+        [interval_array.right, domain_lefts, domain_rights]
+    )
+    # the endpoints are split from their concatenation, which has a common dtype (and unit)
+    n, m = len(interval_array), len(domain_lefts)
+    values = endpoints.values
+    args = (
+        values[:n],
+        values[n : 2 * n],
+        group_ids,
+        values[2 * n : 2 * n + m],
+        values[2 * n + m :],
+        domain_groups,
+    )
+    point_groups = np.concatenate([group_ids, group_ids, domain_groups, domain_groups])
+    return endpoints, args, point_groups, labels
+
+
+def _coverage_lengths(interval_array, domain, how):
+    # for each interval in domain, the length of it covered by interval_array, and its length
+    # if how is "sum" then covered lengths are returned as floats, or timedeltas for datetime-like data
+    lefts, rights = _interval_x_to_endpoints(interval_array, domain)
+    values = lefts.values
+    lefts, rights = _sweep._sortable(values), _sweep._sortable(rights.values)
+    n = len(interval_array)
+    starts, ends = _sweep._disjoint(
+        lefts[:n], rights[:n], isinstance(interval_array, IntervalSet)
+    )
+    covered = _sweep._covered_lengths(
+        lefts[:n][starts], rights[:n][ends], lefts[n:], rights[n:]
+    )
+    lengths = rights[n:] - lefts[n:]
+    if how == "sum" and values.dtype.kind in "mM":
+        unit, _ = np.datetime_data(values.dtype)
+        covered = covered.astype(f"m8[{unit}]")
+    elif how == "sum":
+        covered = covered.astype(float)
+    return covered, lengths
+
+
 @Appender(docstrings.coverage_docstring, join="\n", indents=1)
-def coverage(interval_array, domain=None, bins=False, how="fraction"):
+def coverage(
+    interval_array, domain=None, bins=False, how="fraction", n_jobs=None, groups=None
+):
     assert how in ("fraction", "sum")
+    assert bins in (True, False, "overlapping")
+    if groups is not None:
+        if bins:
+            raise ValueError("The bins parameter is not supported with groups.")
+        _validate_grouped_set_operation((), n_jobs)
+        endpoints, args, _, labels = _grouped_endpoints(interval_array, groups, domain)
+        covered, lengths = _sweep._grouped_coverage(*args)
+        if how == "fraction":
+            return pd.Series(covered / lengths, index=labels)
+        values = endpoints.values
+        if values.dtype.kind in "mM":
+            unit, _ = np.datetime_data(values.dtype)
+            return pd.Series(covered.astype(f"m8[{unit}]"), index=labels)
+        return pd.Series(covered.astype(float), index=labels)
+    if n_jobs is not None and n_jobs != 1:
+        # the union, which is the bulk of the calculation, is computed in parallel
+        interval_array = union(interval_array, return_type=IntervalSet, n_jobs=n_jobs)
 
     def _validate_domain():
         if not isinstance(domain, (pd.IntervalIndex, pd.arrays.IntervalArray)):
             raise ValueError(
                 "If bins argument is true then domain parameter must be a pandas IntervalIndex or IntervalArray."
             )
-        if not isdisjoint(domain):
+        if bins != "overlapping" and not isdisjoint(domain):
             raise ValueError(
                 "If bins argument is true then domain parameter must represent disjoint intervals."
             )
 
-    stepfunction = _interval_x_to_stairs(interval_array).make_boolean()
     if bins:
         _validate_domain()
-        adjusted_domain = stepfunction.slice(pd.IntervalIndex(domain))
-    elif isinstance(domain, (pd.IntervalIndex, pd.arrays.IntervalArray)):
-        domain = _interval_x_to_stairs(domain)
-        adjusted_domain = stepfunction.where(domain)
+        covered, lengths = _coverage_lengths(interval_array, domain, how)
+        result = covered / lengths if how == "fraction" else covered
+        return pd.Series(result, index=pd.IntervalIndex(domain))
+    if isinstance(domain, (pd.IntervalIndex, pd.arrays.IntervalArray)):
+        domain = _normalize(pd.arrays.IntervalArray(domain))
     else:
-        domain = _get_domain_tuple(interval_array, domain)
-        adjusted_domain = stepfunction.clip(*domain)
-    return adjusted_domain.mean() if how == "fraction" else adjusted_domain.integral()
+        left, right = _get_domain_tuple(interval_array, domain)
+        domain = pd.arrays.IntervalArray.from_arrays([left], [right])
+    covered, lengths = _coverage_lengths(interval_array, domain, how)
+    covered = covered.sum()
+    if how == "sum":
+        return pd.Timedelta(covered) if covered.dtype.kind == "m" else covered
+    return covered / lengths.sum()
 
 
 @Appender(docstrings.complement_docstring, join="\n", indents=1)
-def complement(interval_array, domain=None):
-    _validate_intervals(interval_array)
+def complement(interval_array, domain=None, groups=None):
+    if not isinstance(interval_array, IntervalSet):
+        _validate_intervals(interval_array)
+    if groups is not None:
+        endpoints, args, point_groups, labels = _grouped_endpoints(
+            interval_array, groups, domain
+        )
+        starts, ends = _sweep._grouped_complement(*args)
+        return _grouped_result(
+            endpoints,
+            endpoints,
+            starts,
+            ends,
+            interval_array.closed,
+            point_groups,
+            labels,
+        )
     stepfunction = _interval_x_to_stairs(interval_array).invert()
     if isinstance(domain, (pd.IntervalIndex, pd.arrays.IntervalArray)):
         domain = _interval_x_to_stairs(domain)
@@ -220,25 +478,44 @@ def complement(interval_array, domain=None):
 
 @Appender(docstrings.contains_docstring, join="\n", indents=1)
 def contains(interval_array, x, include_index=True, result="cartesian", how="any"):
-    assert result in ("cartesian", "intervals", "points")
+    assert result in ("cartesian", "intervals", "points", "sparse")
     assert how in ("any", "all")
     starts = interval_array.left.values
     ends = interval_array.right.values
     x = pd.Series(x).values
-    right_compare = (
-        np.less_equal if interval_array.closed in ("right", "both") else np.less
-    )
-    left_compare = (
-        np.greater_equal if interval_array.closed in ("left", "both") else np.greater
-    )
-    calc = (right_compare.outer(x, ends) & left_compare.outer(x, starts)).transpose()
-    if result != "cartesian":
-        logical_method = np.logical_or if how == "any" else np.logical_and
-        axis = 0 if result == "points" else 1
-        calc = logical_method.reduce(calc, axis=axis)
+    if result == "points":
+        counts = _sweep._count_containing(starts, ends, x, interval_array.closed)
+        calc = counts > 0 if how == "any" else counts == len(starts)
+    elif result == "intervals":
+        counts = _sweep._count_contained(starts, ends, x, interval_array.closed)
+        calc = counts > 0 if how == "any" else counts == len(x)
+    elif result == "sparse":
+        calc = _sweep._contained_pairs(starts, ends, x, interval_array.closed)
+    else:
+        right_compare = (
+            np.less_equal if interval_array.closed in ("right", "both") else np.less
+        )
+        left_compare = (
+            np.greater_equal
+            if interval_array.closed in ("left", "both")
+            else np.greater
+        )
+        calc = (
+            right_compare.outer(x, ends) & left_compare.outer(x, starts)
+        ).transpose()
     if include_index:
         if result == "cartesian":
             calc = pd.DataFrame(calc, index=interval_array, columns=x)
+        elif result == "sparse":
+            interval_positions, point_positions = calc
+            if isinstance(interval_array, IntervalSet):
+                interval_array = interval_array.array
+            calc = pd.DataFrame(
+                {
+                    "interval": interval_array.take(interval_positions),
+                    "point": x[point_positions],
+                }
+            )
         else:
             index = x if result == "points" else interval_array
             calc = pd.Series(calc, index=index)
@@ -247,35 +524,59 @@ def contains(interval_array, x, include_index=True, result="cartesian", how="any
 
 @Appender(docstrings.split_docstring, join="\n", indents=1)
 def split(interval_array, x):
-    x = pd.Series(sorted(set(x))).values  # converting to numpy array will not work
-    contained = contains(interval_array.set_closed("neither"), x, include_index=False)
-
-    none = np.nan
-    if pd.api.types.is_datetime64_any_dtype(x) or pd.api.types.is_timedelta64_dtype(x):
-        none = pd.NaT
-
-    breakpoints = np.concatenate(
-        (
-            np.expand_dims(interval_array.left.values, 1),
-            pd.DataFrame(np.broadcast_to(x, contained.shape))
-            .where(contained, none)
-            .values,
-            np.expand_dims(interval_array.right.values, 1),
-        ),
-        axis=1,
+    if isinstance(interval_array, IntervalSet):
+        # the pieces would be merged again by normalization
+        interval_array = interval_array.array
+    x = pd.Index(pd.Series(x)).unique().sort_values()
+    left_positions, right_positions = _sweep._split(
+        interval_array.left.values, interval_array.right.values, x.values
     )
-    lefts = breakpoints[:, :-1]
-    rights = breakpoints[:, 1:]
+    endpoints = interval_array.left.append([interval_array.right, x])
     return interval_array.from_arrays(
-        lefts[~np.isnan(lefts)], rights[~np.isnan(rights)], closed=interval_array.closed
+        endpoints.take(left_positions),
+        endpoints.take(right_positions),
+        closed=interval_array.closed,
     )
 
 
+def _thresholds_to_sortable(threshold, values):
+    # threshold (a scalar or array) in the units of _sweep._sortable(values)
+    if values.dtype.kind not in "mM":
+        return threshold
+    unit, _ = np.datetime_data(values.dtype)
+    result = (
+        pd.TimedeltaIndex(np.atleast_1d(threshold))
+        .values.astype(f"m8[{unit}]")
+        .view("i8")
+    )
+    return result if np.ndim(threshold) else result[0]
+
+
 @Appender(docstrings.bridge_docstring, join="\n", indents=1)
-def bridge(interval_array, threshold):
-    # interval_array validation will occur in union and complement methods
-    complement_ = complement(union(interval_array))
-    return complement(
-        complement_[complement_.length > threshold],
-        (interval_array.left.min(), interval_array.right.max()),
+def bridge(interval_array, threshold, groups=None):
+    if not isinstance(interval_array, IntervalSet):
+        _validate_intervals(interval_array)
+    group_ids = None
+    if groups is not None:
+        interval_array, group_ids, labels = _factorize_groups(interval_array, groups)
+        if isinstance(threshold, (dict, pd.Series)):
+            threshold = pd.Series(threshold).reindex(labels)
+            if threshold.isna().any():
+                raise ValueError("A threshold must be specified for every group.")
+            threshold = threshold.values
+    starts, ends = _sweep._bridge(
+        interval_array.left.values,
+        interval_array.right.values,
+        _thresholds_to_sortable(threshold, interval_array.left.values),
+        group_ids,
+    )
+    args = (
+        interval_array.left,
+        interval_array.right,
+        starts,
+        ends,
+        interval_array.closed,
     )
+    if groups is not None:
+        return _grouped_result(*args, group_ids, labels)
+    return _endpoints_to_interval_array(*args, interval_array.__class__)
@@ -0,0 +1,494 @@
+import bisect
+
+import numpy as np
+import pandas as pd
+
+from piso import _sweep
+from piso._exceptions import ClosedMismatchError, DegenerateIntervalError
+from piso.util import _endpoints_to_interval_array, _validate_intervals
+
+# the number of intervals in each block of a MutableIntervalSet
+_BLOCK_SIZE = 1000
+
+
+def _normalize(interval_array):
+    lefts = _sweep._sortable(interval_array.left.values)
+    rights = _sweep._sortable(interval_array.right.values)
+    if _sweep._is_sorted_and_disjoint(lefts, rights, strict=True):
+        return interval_array
+    starts, ends = _sweep._union(lefts, rights)
+    return _endpoints_to_interval_array(
+        interval_array.left,
+        interval_array.right,
+        starts,
+        ends,
+        interval_array.closed,
+        pd.arrays.IntervalArray,
+    )
+
+
+def _split_blocks(values):
+    # splits values into blocks of about _BLOCK_SIZE, or none if values is empty
+    if len(values) <= 2 * _BLOCK_SIZE:
+        return [values] if len(values) else []
+    return np.array_split(values, -(-len(values) // _BLOCK_SIZE))
+
+
+class IntervalSet:
+    """
+    A set of intervals, stored in normalized form.
+
+    The intervals in an IntervalSet are sorted, disjoint (overlapping or adjacent intervals are merged),
+    non-degenerate, and either left-closed or right-closed.  These properties are established once, on
+    construction, and set operations in :mod:`piso` use them to skip validation, sorting and normalization
+    of IntervalSet operands.  When the first operand of a set operation is an IntervalSet the result will
+    also be an IntervalSet, unless a different *return_type* is specified.
+
+    Parameters
+    ----------
+    data : array-like of :class:`pandas.Interval`, :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray` or IntervalSet
+        The intervals contained in the set.  They may overlap, and need not be sorted.
+    closed : {"left", "right"}, optional
+        If not specified then inferred from *data*, as per :class:`pandas.arrays.IntervalArray`.
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import piso
+
+    >>> arr = pd.arrays.IntervalArray.from_tuples(
+    ...     [(0, 4), (2, 5), (7, 8), (8, 9)],
+    ... )
+
+    >>> piso.IntervalSet(arr)
+    <IntervalSet>
+    [(0, 5], (7, 9]]
+    Length: 2, dtype: interval[int64, right]
+
+    >>> piso.union(piso.IntervalSet(arr), pd.arrays.IntervalArray.from_tuples([(4, 7)]))
+    <IntervalSet>
+    [(0, 9]]
+    Length: 1, dtype: interval[int64, right]
+    """
+
+    def __init__(self, data=(), closed=None):
+        if isinstance(data, IntervalSet):
+            if closed not in (None, data.closed):
+                raise ValueError(
+                    "The closed parameter does not match the IntervalSet supplied."
+                )
+            self._array = data._array
+            return
+        array = pd.arrays.IntervalArray(data, closed=closed)
+        _validate_intervals(array)
+        self._array = _normalize(array)
+
+    @classmethod
+    def _from_normalized(cls, interval_array):
+        # trusts that interval_array is valid and normalized
+        obj = cls.__new__(cls)
+        obj._array = pd.arrays.IntervalArray(interval_array)
+        return obj
+
+    @classmethod
+    def from_arrays(cls, left, right, closed="right"):
+        """
+        Construct an IntervalSet from arrays of left and right endpoints.
+
+        Parameters
+        ----------
+        left : array-like
+            Left endpoints of the intervals.
+        right : array-like
+            Right endpoints of the intervals.
+        closed : {"left", "right"}, default "right"
+
+        Returns
+        -------
+        IntervalSet
+        """
+        return cls(pd.arrays.IntervalArray.from_arrays(left, right, closed=closed))
+
+    @property
+    def array(self):
+        """
+        The intervals as a :class:`pandas.arrays.IntervalArray`.
+        """
+        return self._array
+
+    @property
+    def left(self):
+        return self._array.left
+
+    @property
+    def right(self):
+        return self._array.right
+
+    @property
+    def closed(self):
+        return self._array.closed
+
+    @property
+    def length(self):
+        return self._array.length
+
+    @property
+    def dtype(self):
+        return self._array.dtype
+
+    def __len__(self):
+        return len(self._array)
+
+    def __iter__(self):
+        return iter(self._array)
+
+    def __getitem__(self, key):
+        result = self._array[key]
+        if isinstance(result, pd.Interval):
+            return result
+        if isinstance(key, slice) and key.step in (None, 1):
+            return IntervalSet._from_normalized(result)
+        return IntervalSet(result)
+
+    def __contains__(self, x):
+        # the only interval which may contain x is the first whose right endpoint is not exceeded by x
+        side = "left" if self.closed == "right" else "right"
+        i = self.right.searchsorted(x, side=side)
+        if i == len(self):
+            return False
+        left = self.left[i]
+        return bool(left < x if self.closed == "right" else left <= x)
+
+    def _validate_interval(self, interval):
+        if interval.closed != self.closed:
+            raise ClosedMismatchError
+        if interval.length == 0:
+            raise DegenerateIntervalError(interval)
+
+    def overlaps(self, interval):
+        """
+        Indicates whether any interval in the set overlaps *interval*.
+
+        Uses a binary search, so takes logarithmic time.
+
+        .. versionadded:: 1.2.0
+
+        Parameters
+        ----------
+        interval : :class:`pandas.Interval`
+            Must have the same *closed* value as the set.
+
+        Returns
+        -------
+        boolean
+        """
+        self._validate_interval(interval)
+        i = self.right.searchsorted(interval.left, side="right")
+        return bool(i < len(self) and self.left[i] < interval.right)
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return (
+            self.closed == other.closed
+            and self.left.equals(other.left)
+            and self.right.equals(other.right)
+        )
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self._array).replace("<IntervalArray>", "<IntervalSet>", 1)
+
+
+class MutableIntervalSet(IntervalSet):
+    """
+    A set of intervals, stored in normalized form, which can be modified in place.
+
+    Intervals can be added to, and removed from, the set while it remains normalized.  The endpoints of the set
+    are stored in sorted blocks of about a thousand intervals, and each modification locates the affected intervals
+    with binary searches and copies only the blocks which contain them.  Adding or discarding an interval therefore
+    takes logarithmic time, plus time proportional to the size of a block, rather than time proportional to the size
+    of the set.  Membership tests, :meth:`overlaps` and :func:`len` also use the blocks, however accessing the
+    intervals in any other way, including in set operations, concatenates the blocks, which takes linear time
+    once after each modification.  A MutableIntervalSet can be used wherever an :class:`IntervalSet` can,
+    however set operations return a new set rather than one of their operands.
+
+    .. versionadded:: 1.2.0
+
+    Parameters
+    ----------
+    data : array-like of :class:`pandas.Interval`, :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray` or IntervalSet
+        The intervals contained in the set.  They may overlap, and need not be sorted.
+    closed : {"left", "right"}, optional
+        If not specified then inferred from *data*, as per :class:`pandas.arrays.IntervalArray`.
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import piso
+
+    >>> interval_set = piso.MutableIntervalSet.from_arrays([0, 7], [4, 8])
+    >>> interval_set.add(pd.Interval(3, 5))
+    >>> interval_set.add(pd.Interval(8, 9))
+    >>> interval_set
+    <MutableIntervalSet>
+    [(0, 5], (7, 9]]
+    Length: 2, dtype: interval[int64, right]
+
+    >>> interval_set.discard(pd.Interval(1, 2))
+    >>> interval_set
+    <MutableIntervalSet>
+    [(0, 1], (2, 5], (7, 9]]
+    Length: 3, dtype: interval[int64, right]
+
+    >>> 2 in interval_set, 2.5 in interval_set
+    (False, True)
+
+    >>> interval_set.overlaps(pd.Interval(5, 7))
+    False
+    """
+
+    # The left endpoints, and the right endpoints, are lists of blocks of sortable values (see _sweep._sortable),
+    # with the last endpoint of each block kept in a list of keys for bisection.  The interval array is
+    # materialized from the blocks on demand, and cached until the next modification.
+
+    @property
+    def _array(self):
+        if self._cache is None:
+            self._cache = pd.arrays.IntervalArray.from_arrays(
+                _sweep._from_sortable(self._concatenate(self._lefts), self._dtype),
+                _sweep._from_sortable(self._concatenate(self._rights), self._dtype),
+                closed=self._closed,
+            )
+        return self._cache
+
+    @_array.setter
+    def _array(self, interval_array):
+        self._closed = interval_array.closed
+        self._dtype = interval_array.left.dtype
+        self._set_blocks(
+            _sweep._sortable(interval_array.left.values),
+            _sweep._sortable(interval_array.right.values),
+        )
+        self._cache = interval_array
+
+    def _set_blocks(self, lefts, rights):
+        self._empty = lefts[:0]
+        self._lefts, self._rights = _split_blocks(lefts), _split_blocks(rights)
+        self._left_keys = [block[-1] for block in self._lefts]
+        self._right_keys = [block[-1] for block in self._rights]
+
+    def _concatenate(self, blocks):
+        return np.concatenate(blocks) if blocks else self._empty
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def __len__(self):
+        return sum(map(len, self._lefts))
+
+    def _sortable_endpoints(self, *values):
+        # values as sortable scalars, promoting the endpoints of the set if their dtype cannot represent them
+        dtype = pd.Index(values).dtype
+        if self._lefts:
+            dtype = _sweep._common_dtype(self._dtype, dtype)
+            if dtype != self._dtype:
+                self._set_blocks(
+                    _sweep._to_sortable(self.left, dtype),
+                    _sweep._to_sortable(self.right, dtype),
+                )
+        else:
+            self._empty = _sweep._to_sortable(pd.Index([], dtype=dtype), dtype)
+        if dtype != self._dtype:
+            self._dtype = dtype
+            self._cache = None
+        return _sweep._to_sortable(list(values), dtype)
+
+    def _can_search(self, *values):
+        # whether values can be compared with the endpoints of the set, without promoting them
+        return _sweep._common_dtype(self._dtype, pd.Index(values).dtype) == self._dtype
+
+    def _position(self, blocks, keys, value, side):
+        # the position, as (block, offset), at which value would be inserted into the endpoints in blocks.  Only
+        # the position after the last endpoint is at the end of a block, so positions are ordered as tuples.
+        if not blocks:
+            return 0, 0
+        block = (bisect.bisect_left if side == "left" else bisect.bisect_right)(
+            keys, value
+        )
+        if block == len(blocks):
+            return block - 1, len(blocks[-1])
+        return block, int(np.searchsorted(blocks[block], value, side=side))
+
+    def _before(self, blocks, position):
+        # the endpoint in blocks preceding position
+        block, offset = position
+        if offset == 0:
+            return blocks[block - 1][-1]
+        return blocks[block][offset - 1]
+
+    def _at(self, blocks, position):
+        block, offset = position
+        return blocks[block][offset]
+
+    def _splice(self, start, stop, lefts, rights):
+        # replaces the intervals in positions start to stop with the intervals with endpoints lefts and rights.
+        # Only the blocks containing start and stop are copied, and a block left with fewer than half the usual
+        # number of intervals is merged with the next.
+        self._cache = None
+        if not self._lefts:
+            self._set_blocks(lefts, rights)
+            return
+        (first, start_offset), (last, stop_offset) = start, stop
+        lefts = np.concatenate(
+            [self._lefts[first][:start_offset], lefts, self._lefts[last][stop_offset:]]
+        )
+        rights = np.concatenate(
+            [
+                self._rights[first][:start_offset],
+                rights,
+                self._rights[last][stop_offset:],
+            ]
+        )
+        if len(lefts) < _BLOCK_SIZE // 2 and last + 1 < len(self._lefts):
+            last += 1
+            lefts = np.concatenate([lefts, self._lefts[last]])
+            rights = np.concatenate([rights, self._rights[last]])
+        left_blocks, right_blocks = _split_blocks(lefts), _split_blocks(rights)
+        self._lefts[first : last + 1] = left_blocks
+        self._rights[first : last + 1] = right_blocks
+        self._left_keys[first : last + 1] = [block[-1] for block in left_blocks]
+        self._right_keys[first : last + 1] = [block[-1] for block in right_blocks]
+
+    def _at_end(self, position):
+        return not self._lefts or position[1] == len(self._lefts[position[0]])
+
+    def __contains__(self, x):
+        if not self._can_search(x):
+            return super().__contains__(x)
+        (x,) = _sweep._to_sortable([x], self._dtype)
+        side = "left" if self.closed == "right" else "right"
+        position = self._position(self._rights, self._right_keys, x, side)
+        if self._at_end(position):
+            return False
+        left = self._at(self._lefts, position)
+        return bool(left < x if self.closed == "right" else left <= x)
+
+    def overlaps(self, interval):
+        self._validate_interval(interval)
+        if not self._can_search(interval.left, interval.right):
+            return super().overlaps(interval)
+        left, right = _sweep._to_sortable([interval.left, interval.right], self._dtype)
+        position = self._position(self._rights, self._right_keys, left, "right")
+        return not self._at_end(position) and bool(
+            self._at(self._lefts, position) < right
+        )
+
+    overlaps.__doc__ = IntervalSet.overlaps.__doc__
+
+    def add(self, interval):
+        """
+        Adds an interval to the set.
+
+        Intervals in the set which overlap, or are adjacent to, *interval* are merged with it.
+
+        Parameters
+        ----------
+        interval : :class:`pandas.Interval`
+            Must have the same *closed* value as the set.
+
+        Returns
+        -------
+        None
+        """
+        self._validate_interval(interval)
+        left, right = self._sortable_endpoints(interval.left, interval.right)
+        start = self._position(self._rights, self._right_keys, left, "left")
+        stop = self._position(self._lefts, self._left_keys, right, "right")
+        if start < stop:
+            left = min(left, self._at(self._lefts, start))
+            right = max(right, self._before(self._rights, stop))
+        self._splice(start, stop, np.array([left]), np.array([right]))
+
+    def discard(self, interval):
+        """
+        Removes an interval from the set.
+
+        Intervals in the set which overlap *interval* are truncated, or split, so that none of
+        *interval* remains.  It is not required for *interval* to be contained in the set.
+
+        Parameters
+        ----------
+        interval : :class:`pandas.Interval`
+            Must have the same *closed* value as the set.
+
+        Returns
+        -------
+        None
+        """
+        self._validate_interval(interval)
+        left, right = self._sortable_endpoints(interval.left, interval.right)
+        start = self._position(self._rights, self._right_keys, left, "right")
+        stop = self._position(self._lefts, self._left_keys, right, "left")
+        if not start < stop:
+            return
+        lefts, rights = [], []
+        first_left = self._at(self._lefts, start)
+        if first_left < left:
+            lefts.append(first_left)
+            rights.append(left)
+        last_right = self._before(self._rights, stop)
+        if last_right > right:
+            lefts.append(right)
+            rights.append(last_right)
+        self._splice(
+            start,
+            stop,
+            np.array(lefts, dtype=self._empty.dtype),
+            np.array(rights, dtype=self._empty.dtype),
+        )
+
+    def union_update(self, *interval_arrays):
+        """
+        Updates the set with the union of itself and *interval_arrays*.
+
+        Parameters
+        ----------
+        *interval_arrays : argument list of :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray` or IntervalSet
+            Must have the same *closed* value as the set.
+
+        Returns
+        -------
+        None
+        """
+        from piso import intervalarray
+
+        self._array = intervalarray.union(
+            self, *interval_arrays, return_type=pd.arrays.IntervalArray
+        )
+
+    def difference_update(self, *interval_arrays):
+        """
+        Updates the set with the set difference of itself and *interval_arrays*.
+
+        Parameters
+        ----------
+        *interval_arrays : argument list of :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray` or IntervalSet
+            Must have the same *closed* value as the set.
+
+        Returns
+        -------
+        None
+        """
+        from piso import intervalarray
+
+        self._array = intervalarray.difference(
+            self, *interval_arrays, return_type=pd.arrays.IntervalArray
+        )
+
+    def __repr__(self):
+        return repr(self._array).replace("<IntervalArray>", "<MutableIntervalSet>", 1)
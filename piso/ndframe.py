@@ -4,8 +4,58 @@ import numpy as np
 import pandas as pd
 
 import piso.docstrings.ndframe as docstrings
-from piso import intervalarray
+from piso import _sweep, intervalarray
 from piso._decorators import Appender
+from piso.util import _interval_x_to_endpoints, _thread_map
+
+
+def _get_indexer(index, x):
+    # positions of the intervals in index containing the points in x, or -1
+    # disjoint, sorted indexes are searched directly, avoiding construction of an interval tree
+    x = pd.Index(x)
+    same_domain = x.dtype == index.dtype.subtype or (
+        x.dtype.kind in "iuf" and index.dtype.subtype.kind in "iuf"
+    )
+    if (
+        same_domain
+        and index.is_non_overlapping_monotonic
+        and index.left.is_monotonic_increasing
+    ):
+        return _sweep._locate(
+            index.left.values, index.right.values, x.values, index.closed
+        )
+    return index.get_indexer(x)
+
+
+def _take_values(series, indexer):
+    # a take, where -1 in indexer produces a missing value
+    values = series.to_numpy() if isinstance(series.dtype, np.dtype) else series.array
+    return pd.api.extensions.take(values, indexer, allow_fill=True)
+
+
+def _take(frame_or_series, indexer, index):
+    # takes rows, where -1 in indexer produces a row of missing values, without copying frame_or_series
+    if isinstance(frame_or_series, pd.Series):
+        return pd.Series(
+            _take_values(frame_or_series, indexer),
+            index=index,
+            name=frame_or_series.name,
+        )
+    return _assemble_frame(
+        [frame_or_series], [indexer], [frame_or_series.columns], index
+    )
+
+
+def _assemble_frame(frames, indexers, columns, index):
+    # the columns of each frame, taken with the corresponding indexer, side by side
+    arrays = [
+        _take_values(series, indexer)
+        for frame, indexer in zip(frames, indexers)
+        for _, series in frame.items()
+    ]
+    result = pd.DataFrame(dict(enumerate(arrays)), index=index)
+    result.columns = columns[0].append(columns[1:])
+    return result
 
 
 @Appender(docstrings.lookup_docstring, join="\n", indents=1)
@@ -14,12 +64,8 @@ def lookup(frame_or_series, x):
         raise ValueError("DataFrame or Series must be indexed by an IntervalIndex")
     if not hasattr(x, "__len__"):
         x = np.array(x, ndmin=1)
-    indexer = frame_or_series.index.get_indexer(x)
-    result = frame_or_series.copy().iloc[indexer].set_axis(x)
-    set_nan = indexer == -1
-    if set_nan.any():
-        result.loc[set_nan] = np.nan
-    return result
+    indexer = _get_indexer(frame_or_series.index, x)
+    return _take(frame_or_series, indexer, pd.Index(x))
 
 
 def _assert_has_disjoint_interval_index(frame_or_series):
@@ -27,7 +73,16 @@ def _assert_has_disjoint_interval_index(frame_or_series):
         raise ValueError(
             "Dataframe, or Series, should have IntervalIndex only.  Found {type(frame_or_series.index)}."
         )
-    if frame_or_series.index.is_overlapping:
+    # IntervalIndex.is_overlapping constructs an interval tree, so is only used for degenerate intervals
+    index = frame_or_series.index
+    lefts, rights = index.left.values, index.right.values
+    if (lefts == rights).any():
+        overlapping = index.is_overlapping
+    else:
+        overlapping = not _sweep._is_disjoint(
+            lefts, rights, strict=index.closed == "both"
+        )
+    if overlapping:
         raise ValueError(
             "IntervalIndex of DataFrame, or Series, cannot contain overlapping intervals."
         )
@@ -44,35 +99,61 @@ def _get_valid_closed(indexes):
     return closed
 
 
-def _get_indexers(*dfs):
+def _get_indexers(*dfs, n_jobs=None):
     closed = _get_valid_closed([df.index for df in dfs])
-    breaks = itertools.chain(
-        itertools.chain.from_iterable(df.index.left.values for df in dfs),
-        itertools.chain.from_iterable(df.index.right.values for df in dfs),
+    lefts, rights = _interval_x_to_endpoints(*(df.index for df in dfs))
+    endpoints = lefts.append(rights)
+    _, first_positions = np.unique(
+        _sweep._sortable(endpoints.values), return_index=True
     )
-    tiling_index = pd.IntervalIndex.from_breaks(sorted(set(breaks)))
+    tiling_index = pd.IntervalIndex.from_breaks(endpoints.take(first_positions))
     lookups = tiling_index.left if closed == "left" else tiling_index.right
-    indexers = [df.index.get_indexer(lookups) for df in dfs]
+    lookups = _sweep._sortable(lookups.values)
+
+    # each index is non-overlapping, so can be searched once sorted.  Indexes are independent, so are
+    # searched in a pool of n_jobs threads, if n_jobs is specified.
+    lefts, rights = _sweep._sortable(lefts.values), _sweep._sortable(rights.values)
+    sizes = [len(df) for df in dfs]
+    offsets = np.cumsum(sizes) - sizes
+
+    def get_indexer(offset, size):
+        index_lefts = lefts[offset : offset + size]
+        order = np.argsort(index_lefts, kind="stable")
+        positions = _sweep._locate(
+            index_lefts[order],
+            rights[offset : offset + size][order],
+            lookups,
+            closed,
+        )
+        # positions of -1 select the appended -1
+        return np.append(order, -1)[positions]
+
+    indexers = _thread_map(get_indexer, offsets, sizes, n_jobs=n_jobs)
     return tiling_index, indexers
 
 
 def _handle_overlapping_columns(frames, suffixes):
-    col_counts = pd.Series(list(itertools.chain.from_iterable(frames))).value_counts()
+    # returns the columns of each frame, with suffixes applied to column names found in more than one frame
+    columns = [df.columns for df in frames]
+    col_counts = pd.Series(list(itertools.chain.from_iterable(columns))).value_counts()
     common_columns = col_counts[col_counts > 1].index
     if len(common_columns) > 0:
         if len(suffixes) != len(frames):
             raise ValueError(
                 "Overlapping column names found.  A suffix must be supplied for every join argument."
             )
-        frames = [
-            df.rename(columns=dict(zip(common_columns, common_columns + suffix)))
-            for df, suffix in zip(frames, suffixes)
+        renames = [
+            dict(zip(common_columns, common_columns + suffix)) for suffix in suffixes
         ]
-    return frames
+        columns = [
+            pd.Index([rename.get(col, col) for col in cols])
+            for cols, rename in zip(columns, renames)
+        ]
+    return columns
 
 
 @Appender(docstrings.join_docstring, join="\n", indents=1)
-def join(*frames_or_series, how="left", suffixes=None, sort=False):
+def join(*frames_or_series, how="left", suffixes=None, sort=False, n_jobs=None):
     if len(frames_or_series) < 2:
         raise ValueError("Join operation requires more than one operand.")
     for obj in frames_or_series:
@@ -88,32 +169,29 @@ def join(*frames_or_series, how="left", suffixes=None, sort=False):
     if suffixes is None:
         suffixes = []
     new_frames = [frameify(obj) for obj in frames_or_series]
-    return _join(*new_frames, how=how, suffixes=suffixes, sort=sort)
+    return _join(*new_frames, how=how, suffixes=suffixes, sort=sort, n_jobs=n_jobs)
 
 
-def _join(*frames, how, suffixes, sort):
+def _join(*frames, how, suffixes, sort, n_jobs=None):
 
-    tiling_index, indexers = _get_indexers(*frames)
+    tiling_index, indexers = _get_indexers(*frames, n_jobs=n_jobs)
+    stacked_indexers = np.stack(indexers) >= 0
 
     if how in ("left", "right"):
         i = 0 if how == "left" else -1
-        final_indexer = indexers[i] >= 0
+        final_indexer = stacked_indexers[i]
     else:
-        stacked_indexers = np.stack(indexers) >= 0
         log_func = np.any if how == "outer" else np.all
         final_indexer = log_func(stacked_indexers, axis=0)
-
-    def _reindex(df, indexer):
-        adjusted_indexer = final_indexer & (indexer >= 0)
-        return df.iloc[indexer[adjusted_indexer]].set_index(
-            tiling_index[adjusted_indexer]
-        )
-
-    new_frames = [_reindex(df, indexer) for df, indexer in zip(frames, indexers)]
-    new_frames = _handle_overlapping_columns(new_frames, suffixes)
-
-    if how == "right":
-        # hack for pandas not working with right joins on interval index (for unknown reasons)
-        columns = list(itertools.chain.from_iterable([df.columns for df in new_frames]))
-        return new_frames[-1].join(new_frames[:-1], how="left", sort=sort)[columns]
-    return pd.DataFrame.join(new_frames[0], new_frames[1:], how=how, sort=sort)
+    rows = np.flatnonzero(final_indexer)
+    if how == "outer" and not sort:
+        # rows are ordered by the first frame containing them, as per pandas.Index.union
+        rows = rows[np.argsort(stacked_indexers[:, rows].argmax(axis=0), kind="stable")]
+
+    columns = _handle_overlapping_columns(frames, suffixes)
+    return _assemble_frame(
+        frames,
+        [indexer[rows] for indexer in indexers],
+        columns,
+        tiling_index[rows],
+    )
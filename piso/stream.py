@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+
+import piso.docstrings.stream as docstrings
+from piso import intervalarray, ndframe
+from piso._decorators import Appender
+
+
+def _frameify(obj):
+    if isinstance(obj, pd.Series):
+        if obj.name is None:
+            raise ValueError("Series arguments to join must be named.")
+        obj = obj.to_frame()
+    return obj
+
+
+def _validate_chunk(chunk, bound):
+    # chunks must be sorted, and follow the previous chunks from the same iterable without overlap
+    ndframe._assert_has_disjoint_interval_index(chunk)
+    index = chunk.index
+    if not index.left.is_monotonic_increasing or (
+        len(index) > 0 and bound is not None and index[0].left < bound
+    ):
+        raise ValueError(
+            "Chunks must be ordered by interval start, and must not overlap intervals in previous chunks."
+        )
+
+
+def _split_at(frame, watermark):
+    # splits a sorted frame with disjoint intervals into the rows before, and after, the watermark
+    # an interval containing the watermark is divided between the two
+    index = frame.index
+    k = index.right.searchsorted(watermark, side="right")
+    if k == len(index) or not index.left[k] < watermark:
+        return frame.iloc[:k], frame.iloc[k:]
+    head, tail = frame.iloc[: k + 1].copy(), frame.iloc[k:].copy()
+    is_last = np.arange(k + 1) == k
+    head.index = pd.IntervalIndex.from_arrays(
+        index.left[: k + 1],
+        index.right[: k + 1].putmask(is_last, watermark),
+        closed=index.closed,
+    )
+    is_first = np.arange(len(tail)) == 0
+    tail.index = pd.IntervalIndex.from_arrays(
+        index.left[k:].putmask(is_first, watermark),
+        index.right[k:],
+        closed=index.closed,
+    )
+    return head, tail
+
+
+@Appender(docstrings.join_docstring, join="\n", indents=1)
+def join(*iterables, how="left", suffixes=None):
+    if len(iterables) < 2:
+        raise ValueError("Join operation requires more than one operand.")
+    if suffixes is None:
+        suffixes = []
+
+    iterators = [iter(iterable) for iterable in iterables]
+    buffers = [None] * len(iterators)
+    # the largest left endpoint seen in each iterable, below which no more intervals will arrive
+    frontiers = [None] * len(iterators)
+    # the largest right endpoint seen in each iterable
+    bounds = [None] * len(iterators)
+    exhausted = [False] * len(iterators)
+
+    def emit(frames):
+        if any(len(frame) > 0 for frame in frames):
+            result = ndframe._join(*frames, how=how, suffixes=suffixes, sort=True)
+            if len(result) > 0:
+                return result
+
+    while not all(exhausted):
+        active = [i for i, done in enumerate(exhausted) if not done]
+        unseen = [i for i in active if frontiers[i] is None]
+        i = unseen[0] if unseen else min(active, key=lambda i: frontiers[i])
+        chunk = next(iterators[i], None)
+        if chunk is None:
+            if buffers[i] is None:
+                raise ValueError("Every iterable must contain at least one chunk.")
+            exhausted[i] = True
+        else:
+            chunk = _frameify(chunk)
+            _validate_chunk(chunk, bounds[i])
+            if buffers[i] is None or len(buffers[i]) == 0:
+                buffers[i] = chunk
+            elif len(chunk) > 0:
+                buffers[i] = pd.concat([buffers[i], chunk])
+            if len(chunk) > 0:
+                frontiers[i] = chunk.index[-1].left
+                bounds[i] = chunk.index[-1].right
+        active = [i for i, done in enumerate(exhausted) if not done]
+        if not active or any(frontiers[i] is None for i in active):
+            continue
+        watermark = min(frontiers[i] for i in active)
+        heads, tails = zip(*(_split_at(buffer, watermark) for buffer in buffers))
+        buffers = list(tails)
+        result = emit(heads)
+        if result is not None:
+            yield result
+
+    result = emit(buffers)
+    if result is not None:
+        yield result
+
+
+@Appender(docstrings.union_docstring, join="\n", indents=1)
+def union(iterable):
+    tail = None
+    watermark = None
+    for chunk in iterable:
+        if len(chunk) == 0:
+            continue
+        if watermark is not None and chunk.left.min() < watermark:
+            raise ValueError(
+                "Chunks must be ordered by interval start.  Found a left endpoint less than that of a previous chunk."
+            )
+        operands = (chunk,) if tail is None else (tail, chunk)
+        tail = intervalarray.union(*operands)
+        watermark = chunk.left.max()
+        # intervals ending before the watermark cannot overlap, or be adjacent to, intervals in later chunks
+        finalized = tail.right.searchsorted(watermark, side="left")
+        if finalized > 0:
+            yield tail[:finalized]
+            tail = tail[finalized:]
+    if tail is not None:
+        yield tail
@@ -1,13 +1,19 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
 import staircase as sc
 
 from piso._exceptions import ClosedValueError, DegenerateIntervalError
 
 
 def _validate_intervals(interval_array):
-    if not all(interval_array.length):  # test for degenerate intervals
+    # test for degenerate intervals
+    if (interval_array.left == interval_array.right).any():
         raise DegenerateIntervalError(interval_array)
     if interval_array.closed not in ("left", "right"):
-        raise ClosedValueError(interval_array.closed)
+        raise ClosedValueError(interval_array)
 
 
 def _interval_x_to_stairs(interval_array):
@@ -20,11 +26,58 @@ def _interval_x_to_stairs(interval_array):
     )
 
 
+def _from_arrays(cls, left, right, closed):
+    # the results of operations are normalized, so IntervalSet (and its subclasses) are constructed without
+    # validating, sorting or normalizing them again
+    if hasattr(cls, "_from_normalized"):
+        return cls._from_normalized(
+            pd.arrays.IntervalArray.from_arrays(left, right, closed=closed)
+        )
+    return cls.from_arrays(left, right, closed=closed)
+
+
 def _boolean_stairs_to_interval_array(stairs, cls):
     if stairs.identical(0):
-        return cls([], closed=stairs.closed)
-    return cls.from_arrays(
+        return _from_arrays(cls, [], [], stairs.closed)
+    return _from_arrays(
+        cls,
         stairs.step_changes.index[::2],
         stairs.step_changes.index[1::2],
-        closed=stairs.closed,
+        stairs.closed,
     )
+
+
+def _interval_x_to_endpoints(*interval_arrays):
+    # concatenates the left endpoints, and the right endpoints, of all arrays
+    # empty arrays are dropped, where possible, so they do not interfere with the dtype of the result
+    non_empty = [arr for arr in interval_arrays if len(arr) > 0] or interval_arrays[:1]
+    first, *others = non_empty
+    lefts = first.left.append([arr.left for arr in others])
+    rights = first.right.append([arr.right for arr in others])
+    return lefts, rights
+
+
+def _endpoints_to_interval_array(lefts, rights, starts, ends, closed, cls):
+    # starts and ends are positions into lefts and rights respectively
+    if len(starts) == 0:
+        return _from_arrays(cls, [], [], closed)
+    return _from_arrays(cls, lefts.take(starts), rights.take(ends), closed)
+
+
+def _n_workers(n_jobs):
+    # n_jobs follows the joblib convention, where negative values count back from the number of available
+    # processors: -1 indicates all of them, -2 all but one, and so on
+    if n_jobs == 0:
+        raise ValueError("The n_jobs parameter must not be 0.")
+    if n_jobs < 0:
+        return max(os.cpu_count() + 1 + n_jobs, 1)
+    return n_jobs
+
+
+def _thread_map(func, *iterables, n_jobs=None):
+    # as per the builtin map, but evaluated in a pool of n_jobs threads if n_jobs is specified, and not 1.
+    # Intended for independent work which is dominated by NumPy sorting and searching, which release the GIL.
+    if n_jobs is None or n_jobs == 1:
+        return list(map(func, *iterables))
+    with ThreadPoolExecutor(max_workers=_n_workers(n_jobs)) as executor:
+        return list(executor.map(func, *iterables))
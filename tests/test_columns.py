@@ -0,0 +1,146 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import piso
+import piso.columns
+from piso._exceptions import DegenerateIntervalError
+
+
+def make_frame(seed, dates):
+    rng = np.random.default_rng(seed)
+    start = rng.integers(0, 100, 50)
+    df = pd.DataFrame(
+        {
+            "start": start,
+            "end": start + rng.integers(1, 20, 50),
+            "group": rng.choice(["a", "b", "c", None], 50),
+        }
+    )
+    if dates:
+        origin = pd.Timestamp("2021", tz="UTC")
+        for column in ("start", "end"):
+            df[column] = origin + pd.to_timedelta(df[column], unit="h")
+    return df
+
+
+def make_domain(domain, dates):
+    if domain is None or not dates:
+        return domain
+    origin = pd.Timestamp("2021", tz="UTC")
+    return tuple(origin + pd.Timedelta(hours=x) for x in domain)
+
+
+def to_interval_array(df):
+    return pd.arrays.IntervalArray.from_arrays(df["start"], df["end"])
+
+
+def assert_endpoints_equal(result, expected):
+    left, right = result
+    if len(expected) == 0:
+        # empty results of piso functions do not retain the dtype of the intervals
+        assert len(left) == len(right) == 0
+        return
+    pd.testing.assert_index_equal(pd.Index(left), pd.Index(expected.left))
+    pd.testing.assert_index_equal(pd.Index(right), pd.Index(expected.right))
+
+
+@pytest.mark.parametrize(
+    "name, kwargs",
+    [
+        ("union", {}),
+        ("intersection", {}),
+        ("intersection", {"min_overlaps": 3}),
+        ("complement", {}),
+        ("complement", {"domain": (-10, 50)}),
+    ],
+)
+@pytest.mark.parametrize("dates", [True, False])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_intervals_match_intervalarray(name, kwargs, dates, seed):
+    df = make_frame(seed, dates)
+    if "domain" in kwargs:
+        kwargs = {**kwargs, "domain": make_domain(kwargs["domain"], dates)}
+    result = getattr(piso.columns, name)("start", "end", data=df, **kwargs)
+    expected = getattr(piso, name)(to_interval_array(df), **kwargs)
+    assert_endpoints_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "name, kwargs",
+    [
+        ("union", {}),
+        ("intersection", {}),
+        ("intersection", {"min_overlaps": 2}),
+        ("complement", {}),
+        ("complement", {"domain": (-10, 50)}),
+    ],
+)
+@pytest.mark.parametrize("dates", [True, False])
+def test_intervals_groups(name, kwargs, dates):
+    df = make_frame(0, dates)
+    if "domain" in kwargs:
+        kwargs = {**kwargs, "domain": make_domain(kwargs["domain"], dates)}
+    left, right, labels = getattr(piso.columns, name)(
+        df["start"].array, df["end"].array, groups=df["group"], **kwargs
+    )
+    for label in ("a", "b", "c"):
+        expected = getattr(piso, name)(
+            to_interval_array(df[df["group"] == label]), **kwargs
+        )
+        selected = labels == label
+        assert_endpoints_equal((left[selected], right[selected]), expected)
+    assert set(labels) <= {"a", "b", "c"}
+
+
+@pytest.mark.parametrize(
+    "domain",
+    [None, (-10, 50), (20, 150)],
+)
+@pytest.mark.parametrize("how", ["fraction", "sum"])
+@pytest.mark.parametrize("dates", [True, False])
+def test_coverage(domain, how, dates):
+    df = make_frame(0, dates)
+    domain = make_domain(domain, dates)
+    result = piso.columns.coverage("start", "end", data=df, domain=domain, how=how)
+    expected = piso.coverage(to_interval_array(df), domain, how=how)
+    assert result == expected or np.isclose(result, expected)
+    grouped = piso.columns.coverage(
+        "start", "end", data=df, domain=domain, how=how, groups="group"
+    )
+    assert list(grouped.index) == ["a", "b", "c"]
+    for label in grouped.index:
+        expected = piso.coverage(
+            to_interval_array(df[df["group"] == label]), domain, how=how
+        )
+        assert grouped[label] == expected or np.isclose(grouped[label], expected)
+
+
+def test_timezone_preserved():
+    df = make_frame(0, True)
+    df["start"] = df["start"].dt.tz_convert("Europe/London")
+    df["end"] = df["end"].dt.tz_convert("Europe/London")
+    left, right = piso.columns.union("start", "end", data=df)
+    assert left.dtype == df["start"].dtype
+    assert right.dtype == df["end"].dtype
+
+
+def test_empty():
+    left, right = piso.columns.union([], [])
+    assert len(left) == len(right) == 0
+    left, right = piso.columns.complement([], [])
+    assert len(left) == len(right) == 0
+    assert piso.columns.coverage([], []) == 0
+
+
+def test_exceptions():
+    with pytest.raises(ValueError):
+        piso.columns.union([0, 1], [2])
+    with pytest.raises(DegenerateIntervalError):
+        piso.columns.union([0, 1], [2, 1])
+    with pytest.raises(ValueError):
+        piso.columns.union([0, 3], [2, 1])
+    with pytest.raises(ValueError):
+        piso.columns.union([0, 1], [2, 3], groups=["a"])
+    with pytest.raises(ValueError):
+        piso.columns.complement([0, 1], [2, 3], domain=[0, 4])
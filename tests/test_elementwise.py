@@ -0,0 +1,109 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import piso.elementwise
+import piso.interval
+from piso._exceptions import (
+    ClosedMismatchError,
+    ClosedValueError,
+    DegenerateIntervalError,
+)
+
+
+def make_pairs(closed):
+    # every arrangement of two intervals with endpoints drawn from 0..4
+    intervals = [
+        pd.Interval(left, right, closed=closed)
+        for left, right in itertools.combinations(range(5), 2)
+    ]
+    return list(itertools.product(intervals, intervals))
+
+
+def expected_result(func, pairs, closed):
+    intervals, row_ids = [], []
+    for row, (interval1, interval2) in enumerate(pairs):
+        result = func(interval1, interval2, squeeze=False)
+        intervals.extend(result)
+        row_ids.extend([row] * len(result))
+    return (
+        pd.arrays.IntervalArray(
+            intervals, closed=closed, dtype=f"interval[int64, {closed}]"
+        ),
+        np.array(row_ids, dtype=np.int64),
+    )
+
+
+@pytest.mark.parametrize(
+    "name", ["union", "intersection", "difference", "symmetric_difference"]
+)
+@pytest.mark.parametrize("closed", ["left", "right"])
+def test_matches_interval(name, closed):
+    pairs = make_pairs(closed)
+    arr1 = pd.arrays.IntervalArray([pair[0] for pair in pairs])
+    arr2 = pd.arrays.IntervalArray([pair[1] for pair in pairs])
+    intervals, row_ids = getattr(piso.elementwise, name)(arr1, arr2)
+    expected_intervals, expected_row_ids = expected_result(
+        getattr(piso.interval, name), pairs, closed
+    )
+    pd.testing.assert_extension_array_equal(intervals, expected_intervals)
+    np.testing.assert_array_equal(row_ids, expected_row_ids)
+
+
+def to_timestamps(interval_array):
+    start = pd.Timestamp("2021", tz="Australia/Sydney")
+    return pd.arrays.IntervalArray.from_arrays(
+        start + pd.to_timedelta(interval_array.left, unit="h"),
+        start + pd.to_timedelta(interval_array.right, unit="h"),
+        closed=interval_array.closed,
+    )
+
+
+@pytest.mark.parametrize(
+    "name", ["union", "intersection", "difference", "symmetric_difference"]
+)
+def test_timestamps(name):
+    arr1 = pd.arrays.IntervalArray.from_breaks([0, 2, 4, 6])
+    arr2 = pd.arrays.IntervalArray.from_breaks([1, 3, 4, 7])
+    func = getattr(piso.elementwise, name)
+    intervals, row_ids = func(to_timestamps(arr1), to_timestamps(arr2))
+    expected_intervals, expected_row_ids = func(arr1, arr2)
+    pd.testing.assert_extension_array_equal(
+        intervals, to_timestamps(expected_intervals)
+    )
+    np.testing.assert_array_equal(row_ids, expected_row_ids)
+
+
+def test_empty():
+    arr = pd.arrays.IntervalArray([], closed="left")
+    intervals, row_ids = piso.elementwise.union(arr, arr)
+    assert len(intervals) == 0
+    assert intervals.closed == "left"
+    assert len(row_ids) == 0
+
+
+def test_exception_closed_mismatch():
+    arr1 = pd.arrays.IntervalArray.from_tuples([(0, 1)], closed="left")
+    arr2 = pd.arrays.IntervalArray.from_tuples([(0, 1)], closed="right")
+    with pytest.raises(ClosedMismatchError):
+        piso.elementwise.union(arr1, arr2)
+
+
+def test_exception_closed_value():
+    arr = pd.arrays.IntervalArray.from_tuples([(0, 1)], closed="both")
+    with pytest.raises(ClosedValueError):
+        piso.elementwise.intersection(arr, arr)
+
+
+def test_exception_degenerate():
+    arr = pd.arrays.IntervalArray.from_tuples([(0, 1), (2, 2)])
+    with pytest.raises(DegenerateIntervalError):
+        piso.elementwise.difference(arr, arr)
+
+
+def test_exception_length():
+    arr = pd.arrays.IntervalArray.from_tuples([(0, 1), (2, 3)])
+    with pytest.raises(ValueError):
+        piso.elementwise.symmetric_difference(arr, arr[:1])
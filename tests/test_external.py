@@ -0,0 +1,196 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import piso
+import piso.external
+from piso._exceptions import DegenerateIntervalError
+
+# small enough to force many chunks, runs and blocks
+MEMORY = 64 * 200
+
+
+def make_frame(seed=0, n=1000):
+    rng = np.random.default_rng(seed)
+    start = rng.integers(10000, size=n)
+    return pd.DataFrame({"start": start, "end": start + rng.integers(1, 30, size=n)})
+
+
+def to_interval_array(frame, closed="right"):
+    return pd.arrays.IntervalArray.from_arrays(
+        frame["start"], frame["end"], closed=closed
+    )
+
+
+def make_sources(frame, source_type, tmp_path, name="intervals"):
+    if source_type == "csv":
+        path = tmp_path / f"{name}.csv"
+        frame.to_csv(path, index=False)
+        return path
+    if source_type == "npy":
+        path = tmp_path / f"{name}.npy"
+        np.save(path, frame[["start", "end"]].to_numpy())
+        return str(path)
+    if source_type == "npy_structured":
+        path = tmp_path / f"{name}.npy"
+        np.save(path, frame.to_records(index=False))
+        return str(path)
+    if source_type == "frames":
+        return [frame.iloc[i : i + 77] for i in range(0, len(frame), 77)]
+    return [to_interval_array(frame.iloc[i : i + 77]) for i in range(0, len(frame), 77)]
+
+
+source_types = ["csv", "npy", "npy_structured", "frames", "arrays"]
+
+
+@pytest.mark.parametrize("source_type", source_types)
+@pytest.mark.parametrize("closed", ["left", "right"])
+def test_union(tmp_path, source_type, closed):
+    frame = make_frame()
+    result = piso.external.union(
+        make_sources(frame, source_type, tmp_path), closed=closed, memory=MEMORY
+    )
+    expected = piso.union(to_interval_array(frame, closed))
+    pd._testing.assert_interval_array_equal(result, expected)
+
+
+def test_union_multiple_sources(tmp_path):
+    frame1, frame2 = make_frame(1), make_frame(2)
+    result = piso.external.union(
+        make_sources(frame1, "csv", tmp_path, "one"),
+        make_sources(frame2, "npy", tmp_path, "two"),
+        memory=MEMORY,
+    )
+    expected = piso.union(to_interval_array(frame1), to_interval_array(frame2))
+    pd._testing.assert_interval_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("min_overlaps", ["all", 2, 3])
+def test_intersection_multiple_sources(tmp_path, min_overlaps):
+    frames = [make_frame(seed, 3000) for seed in range(3)]
+    result = piso.external.intersection(
+        *[make_sources(frame, "frames", tmp_path) for frame in frames],
+        min_overlaps=min_overlaps,
+        memory=MEMORY,
+    )
+    expected = piso.intersection(
+        *[to_interval_array(frame) for frame in frames], min_overlaps=min_overlaps
+    )
+    pd._testing.assert_interval_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("min_overlaps", [2, 3])
+def test_intersection_single_source(tmp_path, min_overlaps):
+    frame = make_frame()
+    result = piso.external.intersection(
+        make_sources(frame, "csv", tmp_path), min_overlaps=min_overlaps, memory=MEMORY
+    )
+    expected = piso.intersection(to_interval_array(frame), min_overlaps=min_overlaps)
+    pd._testing.assert_interval_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("domain", [None, (-10, 5000), pd.Interval(5000, 20000)])
+def test_complement(tmp_path, domain):
+    frame = make_frame()
+    result = piso.external.complement(
+        make_sources(frame, "npy", tmp_path), domain=domain, memory=MEMORY
+    )
+    expected = piso.complement(to_interval_array(frame), domain=domain)
+    pd._testing.assert_interval_array_equal(result, expected, exact=False)
+
+
+@pytest.mark.parametrize("domain", [None, (-10, 5000), pd.Interval(5000, 20000)])
+@pytest.mark.parametrize("how", ["fraction", "sum"])
+def test_coverage(tmp_path, domain, how):
+    frame = make_frame()
+    result = piso.external.coverage(
+        make_sources(frame, "csv", tmp_path), domain=domain, how=how, memory=MEMORY
+    )
+    expected = piso.coverage(to_interval_array(frame), domain=domain, how=how)
+    assert result == pytest.approx(expected)
+
+
+def test_mixed_dtypes(tmp_path):
+    # integer starts and float ends, with a later chunk of float starts
+    frame = pd.DataFrame({"start": [0, 10], "end": [1.5, 11.25]})
+    later = pd.DataFrame({"start": [30.25, 40.0], "end": [30.5, 41.0]})
+    interval_array = pd.arrays.IntervalArray.from_arrays(
+        pd.concat([frame, later])["start"], pd.concat([frame, later])["end"]
+    )
+    result = piso.external.union([frame, later])
+    pd._testing.assert_interval_array_equal(result, piso.union(interval_array))
+    assert piso.external.coverage([frame, later], how="sum") == 4.0
+
+    result = piso.external.intersection([frame], [later], min_overlaps=1)
+    pd._testing.assert_interval_array_equal(result, piso.union(interval_array))
+
+
+def test_exception_dtype():
+    frame = pd.DataFrame({"start": [0, 10], "end": [1, 11]})
+    dates = frame.apply(lambda col: pd.Timestamp("2021") + pd.to_timedelta(col, "h"))
+    with pytest.raises(ValueError):
+        piso.external.union([frame, dates])
+
+
+def test_timestamps(tmp_path):
+    frame = make_frame()
+    dates = frame.apply(
+        lambda col: pd.Timestamp("2021", tz="UTC") + pd.to_timedelta(col, unit="h")
+    )
+    path = tmp_path / "dates.csv"
+    dates.to_csv(path, index=False)
+    read_kwargs = {"parse_dates": ["start", "end"]}
+    interval_array = to_interval_array(dates)
+
+    result = piso.external.union(path, memory=MEMORY, read_kwargs=read_kwargs)
+    pd._testing.assert_interval_array_equal(result, piso.union(interval_array))
+
+    result = piso.external.coverage(
+        path, how="sum", memory=MEMORY, read_kwargs=read_kwargs
+    )
+    assert result == piso.coverage(interval_array, how="sum")
+
+
+def test_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    frame = make_frame()
+    path = tmp_path / "intervals.parquet"
+    frame.to_parquet(path)
+    result = piso.external.union(path, memory=MEMORY)
+    pd._testing.assert_interval_array_equal(
+        result, piso.union(to_interval_array(frame))
+    )
+
+
+def test_temporary_files_removed(tmp_path):
+    piso.external.union(make_sources(make_frame(), "npy", tmp_path), temp_dir=tmp_path)
+    assert [path.name for path in tmp_path.iterdir()] == ["intervals.npy"]
+
+
+def test_exception_file_type(tmp_path):
+    with pytest.raises(ValueError):
+        piso.external.union(tmp_path / "intervals.txt")
+
+
+def test_exception_degenerate():
+    frame = pd.DataFrame({"start": [0, 2], "end": [1, 2]})
+    with pytest.raises(DegenerateIntervalError):
+        piso.external.union([frame])
+
+
+@pytest.mark.parametrize("closed", ["both", "neither", "invalid"])
+def test_exception_closed(closed):
+    with pytest.raises(ValueError, match="closed"):
+        piso.external.union([make_frame()], closed=closed)
+
+
+def test_empty_result():
+    frame = pd.DataFrame({"start": [0.0, 2.0], "end": [1.0, 3.0]})
+    result = piso.external.intersection([frame])
+    assert len(result) == 0
+    assert result.dtype == pd.IntervalDtype("float64", "right")
+
+
+def test_exception_no_intervals():
+    with pytest.raises(ValueError):
+        piso.external.union([])
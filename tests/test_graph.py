@@ -291,6 +291,87 @@ def test_adjacency_matrix_edges_exception(closed, how):
         )
 
 
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right", "both", "neither"],
+)
+@pytest.mark.parametrize(
+    "edges",
+    ["intersect", "disjoint"],
+)
+@pytest.mark.parametrize(
+    "date_type",
+    ["timestamp", "timedelta", None],
+)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_adjacency_matrix_edge_list_matches_matrix(closed, edges, date_type, seed):
+    # includes degenerate intervals, and intervals which share endpoints
+    rng = np.random.default_rng(seed)
+    lefts = rng.integers(0, 30, 25)
+    rights = lefts + rng.integers(0, 5, 25)
+    interval_array = pd.arrays.IntervalArray.from_arrays(lefts, rights, closed=closed)
+    if date_type:
+        interval_array = map_to_dates(interval_array, date_type)
+
+    matrix = piso_graph.adjacency_matrix(
+        interval_array, edges=edges, include_index=False
+    )
+    rows, cols = piso_graph.adjacency_matrix(
+        interval_array, edges=edges, include_index=False, result="edges"
+    )
+    expected_rows, expected_cols = np.nonzero(matrix)
+    np.testing.assert_array_equal(rows, expected_rows)
+    np.testing.assert_array_equal(cols, expected_cols)
+
+
+@pytest.mark.parametrize(
+    "interval_index",
+    [True, False],
+)
+@pytest.mark.parametrize(
+    "how",
+    ["supplied", "accessor", "package"],
+)
+def test_adjacency_matrix_edge_list_frame(interval_index, how):
+    interval_array = pd.arrays.IntervalArray.from_tuples(
+        [(0, 4), (3, 6), (5, 7), (8, 9), (9, 10)],
+        closed="both",
+    )
+    if interval_index:
+        interval_array = pd.IntervalIndex(interval_array)
+    result = perform_op(
+        interval_array,
+        how=how,
+        function=piso_graph.adjacency_matrix,
+        result="edges",
+    )
+    expected = pd.DataFrame(
+        {
+            "source": interval_array.take([0, 1, 1, 2, 3, 4]),
+            "target": interval_array.take([1, 0, 2, 1, 4, 3]),
+        }
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_adjacency_matrix_edge_list_frame_interval_set():
+    interval_set = piso.IntervalSet.from_arrays([0, 3, 8], [2, 6, 9])
+    result = piso.adjacency_matrix(interval_set, edges="disjoint", result="edges")
+    expected = pd.DataFrame(
+        {
+            "source": interval_set.array.take([0, 0, 1, 1, 2, 2]),
+            "target": interval_set.array.take([1, 2, 0, 2, 0, 1]),
+        }
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_adjacency_matrix_result_exception():
+    interval_array = pd.arrays.IntervalArray.from_tuples([(0, 4), (3, 6)])
+    with pytest.raises(ValueError):
+        piso_graph.adjacency_matrix(interval_array, result="not_an_option")
+
+
 # ---------------- SET OF SETS --------------------
 
 
@@ -499,6 +580,69 @@ def test_adjacency_matrix_set_of_sets_disjoint_2(
         assert np.array_equal(result, expected)
 
 
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right", "both", "neither"],
+)
+@pytest.mark.parametrize(
+    "edges",
+    ["intersect", "disjoint"],
+)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_adjacency_matrix_set_of_sets_matches_pairwise(closed, edges, seed):
+    # includes degenerate intervals, intervals which share endpoints, and an empty set
+    rng = np.random.default_rng(seed)
+    interval_arrays = []
+    for size in (3, 0, 1, 4, 2, 3):
+        lefts = rng.integers(0, 40, size)
+        rights = lefts + rng.integers(0, 5, size)
+        interval_arrays.append(
+            pd.arrays.IntervalArray.from_arrays(lefts, rights, closed=closed)
+        )
+    result = piso_graph.adjacency_matrix(
+        *interval_arrays, edges=edges, include_index=False
+    )
+
+    expected = np.zeros((len(interval_arrays), len(interval_arrays)), dtype=bool)
+    for i, ia1 in enumerate(interval_arrays):
+        for j, ia2 in enumerate(interval_arrays):
+            pairwise = piso_graph._adj_mat_intersection(
+                np.concatenate([ia1.left, ia2.left]),
+                np.concatenate([ia1.right, ia2.right]),
+                closed,
+                fill_diagonal=False,
+            )
+            expected[i, j] = pairwise[: len(ia1), len(ia1) :].any()
+    if edges == "disjoint":
+        expected = ~expected
+    np.fill_diagonal(expected, False)
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right", "both", "neither"],
+)
+def test_set_adjacency_chunks(closed):
+    # more than 64 sets, so the bitmasks span several words, and chunks much smaller than the number of intervals
+    rng = np.random.default_rng(0)
+    n_sets = 70
+    set_ids = rng.integers(0, n_sets, 400)
+    lefts = rng.integers(0, 2000, 400)
+    rights = lefts + rng.integers(0, 20, 400)
+    result = piso._sweep._set_adjacency(
+        lefts, rights, set_ids, n_sets, closed, chunk_size=7
+    )
+
+    pairwise = piso_graph._adj_mat_intersection(
+        lefts, rights, closed, fill_diagonal=False
+    )
+    expected = np.zeros((n_sets, n_sets), dtype=bool)
+    rows, cols = np.nonzero(pairwise)
+    expected[set_ids[rows], set_ids[cols]] = True
+    np.testing.assert_array_equal(result, expected)
+
+
 @pytest.mark.parametrize(
     "closed",
     ["left", "right", "both", "neither"],
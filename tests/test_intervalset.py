@@ -0,0 +1,257 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import piso
+from piso._exceptions import (
+    ClosedMismatchError,
+    ClosedValueError,
+    DegenerateIntervalError,
+)
+
+
+def make_ia(closed):
+    return pd.arrays.IntervalArray.from_tuples(
+        [(7, 8), (0, 4), (2, 5), (8, 9), (10, 12)],
+        closed=closed,
+    )
+
+
+def assert_interval_set_equal(interval_set, tuples, closed):
+    assert isinstance(interval_set, piso.IntervalSet)
+    pd._testing.assert_interval_array_equal(
+        interval_set.array,
+        pd.arrays.IntervalArray.from_tuples(tuples, closed=closed),
+        exact=False,
+    )
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "interval_index",
+    [True, False],
+)
+def test_construction_normalizes(closed, interval_index):
+    ia = make_ia(closed)
+    if interval_index:
+        ia = pd.IntervalIndex(ia)
+    result = piso.IntervalSet(ia)
+    assert_interval_set_equal(result, [(0, 5), (7, 9), (10, 12)], closed)
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+def test_from_arrays(closed):
+    result = piso.IntervalSet.from_arrays([3, 0], [4, 1], closed=closed)
+    assert_interval_set_equal(result, [(0, 1), (3, 4)], closed)
+
+
+def test_construction_empty():
+    result = piso.IntervalSet([], closed="left")
+    assert len(result) == 0
+    assert result.closed == "left"
+
+
+def test_construction_degenerate_exception():
+    with pytest.raises(DegenerateIntervalError):
+        piso.IntervalSet(pd.arrays.IntervalArray.from_tuples([(0, 1), (2, 2)]))
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["both", "neither"],
+)
+def test_construction_closed_exception(closed):
+    with pytest.raises(ClosedValueError):
+        piso.IntervalSet(make_ia(closed))
+
+
+def test_getitem():
+    interval_set = piso.IntervalSet(make_ia("right"))
+    assert interval_set[1] == pd.Interval(7, 9)
+    assert_interval_set_equal(interval_set[1:], [(7, 9), (10, 12)], "right")
+    assert_interval_set_equal(interval_set[interval_set.length > 2], [(0, 5)], "right")
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "function, expected",
+    [
+        (piso.union, [(0, 5), (7, 12)]),
+        (piso.intersection, [(3, 4), (8, 9), (10, 11)]),
+        (piso.difference, [(0, 3), (4, 5), (7, 8), (11, 12)]),
+        (piso.symmetric_difference, [(0, 3), (4, 5), (7, 8), (9, 10), (11, 12)]),
+    ],
+)
+def test_set_operations_return_interval_set(closed, function, expected):
+    interval_set = piso.IntervalSet(make_ia(closed))
+    other = pd.arrays.IntervalArray.from_tuples([(3, 4), (8, 11)], closed=closed)
+    result = function(interval_set, other)
+    assert_interval_set_equal(result, expected, closed)
+
+
+@pytest.mark.parametrize(
+    "function",
+    [
+        piso.union,
+        piso.intersection,
+        piso.difference,
+        piso.symmetric_difference,
+        piso.complement,
+    ],
+)
+def test_set_operations_skip_normalization(monkeypatch, function):
+    interval_set = piso.IntervalSet(make_ia("right"))
+    other = piso.IntervalSet.from_arrays([3, 8], [4, 11])
+
+    def fail(interval_array):
+        raise AssertionError("results should not be normalized again")
+
+    monkeypatch.setattr(piso.intervalset, "_normalize", fail)
+    monkeypatch.setattr(piso.intervalset, "_validate_intervals", fail)
+    operands = (interval_set,) if function is piso.complement else (interval_set, other)
+    result = function(*operands)
+    assert isinstance(result, piso.IntervalSet)
+    monkeypatch.undo()
+    assert result == piso.IntervalSet(result.array)
+
+
+@pytest.mark.parametrize(
+    "return_type",
+    [pd.arrays.IntervalArray, pd.IntervalIndex],
+)
+def test_union_return_type(return_type):
+    interval_set = piso.IntervalSet(make_ia("right"))
+    result = piso.union(interval_set, return_type=return_type)
+    assert isinstance(result, return_type)
+    assert piso.union(interval_set) is interval_set
+
+
+def test_interval_set_operands():
+    interval_set = piso.IntervalSet(make_ia("left"))
+    result = piso.intersection(
+        make_ia("left"), interval_set, return_type=piso.IntervalSet
+    )
+    assert result == interval_set
+    assert piso.isdisjoint(interval_set)
+    assert piso.issuperset(interval_set, make_ia("left"))
+    assert piso.coverage(interval_set) == 0.75
+    assert_interval_set_equal(piso.complement(interval_set), [(5, 7), (9, 10)], "left")
+    np.testing.assert_array_equal(
+        piso.contains(interval_set, [1, 6], include_index=False),
+        np.array([[True, False], [False, False], [False, False]]),
+    )
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+def test_contains_and_overlaps(closed):
+    interval_set = piso.IntervalSet(make_ia(closed))
+    array = interval_set.array
+    for x in np.arange(-1, 14, 0.5):
+        assert (x in interval_set) == array.contains(x).any()
+    for left, right in [(-2, -1), (-1, 0), (4, 7), (5, 7), (6, 10), (12, 13), (1, 2)]:
+        interval = pd.Interval(left, right, closed=closed)
+        assert interval_set.overlaps(interval) == array.overlaps(interval).any()
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "block_size",
+    [2, 5, 1000],
+)
+def test_mutable_add_discard(monkeypatch, closed, block_size):
+    monkeypatch.setattr(piso.intervalset, "_BLOCK_SIZE", block_size)
+    rng = np.random.default_rng(0)
+    interval_set = piso.MutableIntervalSet([], closed=closed)
+    expected = pd.arrays.IntervalArray([], closed=closed)
+    for _ in range(400):
+        left = rng.integers(200)
+        interval = pd.Interval(left, left + rng.integers(1, 10), closed=closed)
+        operand = pd.arrays.IntervalArray([interval])
+        if rng.random() < 0.6:
+            interval_set.add(interval)
+            expected = piso.union(expected, operand)
+        else:
+            interval_set.discard(interval)
+            expected = piso.difference(expected, operand)
+        assert len(interval_set) == len(expected)
+        x = rng.integers(-1, 210) + rng.choice([0, 0.5])
+        assert (x in interval_set) == expected.contains(x).any()
+        assert interval_set.overlaps(interval) == expected.overlaps(interval).any()
+        if rng.random() < 0.2:
+            pd._testing.assert_interval_array_equal(
+                interval_set.array, expected, exact=False
+            )
+    pd._testing.assert_interval_array_equal(interval_set.array, expected, exact=False)
+
+
+def test_mutable_add_promotes_dtype():
+    interval_set = piso.MutableIntervalSet.from_arrays([0, 7], [4, 8])
+    assert 2.5 in interval_set
+    assert not interval_set.overlaps(pd.Interval(4, 4.5))
+    interval_set.add(pd.Interval(4.5, 5.5))
+    assert_interval_set_equal(interval_set, [(0, 4), (4.5, 5.5), (7, 8)], "right")
+    assert interval_set.dtype == pd.IntervalDtype("float64", "right")
+
+
+def test_mutable_timestamps():
+    dates = pd.date_range("2021", periods=5, freq="D", tz="UTC")
+    interval_set = piso.MutableIntervalSet([], closed="left")
+    interval_set.add(pd.Interval(dates[0], dates[2], closed="left"))
+    interval_set.add(pd.Interval(dates[3], dates[4], closed="left"))
+    interval_set.discard(pd.Interval(dates[1], dates[3], closed="left"))
+    expected = pd.arrays.IntervalArray.from_arrays(
+        dates[[0, 3]], dates[[1, 4]], closed="left"
+    )
+    pd._testing.assert_interval_array_equal(interval_set.array, expected)
+    assert dates[0] in interval_set
+    assert dates[1] not in interval_set
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+def test_mutable_update(closed):
+    interval_set = piso.MutableIntervalSet(make_ia(closed))
+    interval_set.union_update(
+        pd.arrays.IntervalArray.from_tuples([(3, 4), (8, 11)], closed=closed)
+    )
+    assert isinstance(interval_set, piso.MutableIntervalSet)
+    assert_interval_set_equal(interval_set, [(0, 5), (7, 12)], closed)
+    interval_set.difference_update(
+        pd.arrays.IntervalArray.from_tuples([(1, 2)], closed=closed),
+        piso.IntervalSet.from_arrays([6], [8], closed=closed),
+    )
+    assert_interval_set_equal(interval_set, [(0, 1), (2, 5), (8, 12)], closed)
+
+
+def test_mutable_set_operations_return_copy():
+    interval_set = piso.MutableIntervalSet(make_ia("right"))
+    result = piso.union(interval_set)
+    assert isinstance(result, piso.MutableIntervalSet)
+    assert result is not interval_set
+    result.add(pd.Interval(20, 21))
+    assert len(interval_set) == 3
+
+
+def test_mutable_add_exception():
+    interval_set = piso.MutableIntervalSet(make_ia("right"))
+    with pytest.raises(ClosedMismatchError):
+        interval_set.add(pd.Interval(0, 1, closed="left"))
+    with pytest.raises(DegenerateIntervalError):
+        interval_set.discard(pd.Interval(1, 1))
@@ -3,6 +3,7 @@ import operator
 import numpy as np
 import pandas as pd
 import pytest
+import staircase as sc
 
 import piso
 import piso.intervalarray as piso_intervalarray
@@ -484,6 +485,157 @@ def test_difference_empty_array(closed, interval_index, return_type, how):
     )
 
 
+def make_random_ia(rng, closed, disjoint):
+    if disjoint:
+        breaks = np.sort(rng.choice(1000, 100, replace=False))
+        lefts, rights = breaks[::2], breaks[1::2]
+    else:
+        lefts = rng.integers(0, 1000, 50)
+        rights = lefts + rng.integers(1, 50, 50)
+    return pd.arrays.IntervalArray.from_arrays(lefts, rights, closed=closed)
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "disjoint",
+    [True, False],
+)
+@pytest.mark.parametrize(
+    "function, stairs_func",
+    [
+        (piso_intervalarray.union, lambda s1, s2: s1.make_boolean()),
+        (piso_intervalarray.intersection, lambda s1, s2: s1 >= 4),
+        (piso_intervalarray.symmetric_difference, lambda s1, s2: s1 == 1),
+        (piso_intervalarray.difference, lambda s1, s2: s2 & ~(s1 - s2)),
+    ],
+)
+@pytest.mark.parametrize(
+    "seed",
+    [0, 1],
+)
+def test_set_operations_match_stairs(closed, disjoint, function, stairs_func, seed):
+    rng = np.random.default_rng(seed)
+    arrays = [make_random_ia(rng, closed, disjoint) for _ in range(4)]
+    result = function(*arrays)
+    stairs = [piso.util._interval_x_to_stairs(arr).make_boolean() for arr in arrays]
+    expected = piso.util._boolean_stairs_to_interval_array(
+        stairs_func(sc.sum(stairs), stairs[0]),
+        pd.arrays.IntervalArray,
+    )
+    assert_interval_array_equal(
+        result,
+        expected,
+        interval_index=False,
+    )
+
+
+@pytest.mark.parametrize(
+    "function, kwargs",
+    [
+        (piso_intervalarray.union, {}),
+        (piso_intervalarray.intersection, {}),
+        (piso_intervalarray.intersection, {"min_overlaps": 2}),
+        (piso_intervalarray.symmetric_difference, {}),
+        (piso_intervalarray.difference, {}),
+    ],
+)
+@pytest.mark.parametrize(
+    "dates",
+    [True, False],
+)
+def test_set_operations_n_jobs(function, kwargs, dates):
+    rng = np.random.default_rng(0)
+    arrays = [
+        make_random_ia(rng, "right", disjoint) for disjoint in (False, False, True)
+    ]
+    if dates:
+        start = pd.Timestamp("2021", tz="UTC")
+        arrays = [
+            arr.from_arrays(
+                start + pd.to_timedelta(arr.left, unit="h"),
+                start + pd.to_timedelta(arr.right, unit="h"),
+            )
+            for arr in arrays
+        ]
+    arrays[1] = piso.IntervalSet(arrays[1])
+    result = function(*arrays, n_jobs=3, **kwargs)
+    expected = function(*arrays, **kwargs)
+    assert type(result) is type(expected)
+    assert_interval_array_equal(result, expected, interval_index=False)
+
+
+@pytest.mark.parametrize(
+    "n_jobs, expected",
+    [(1, 1), (3, 3), (-1, 4), (-2, 3), (-4, 1), (-10, 1)],
+)
+def test_n_workers(monkeypatch, n_jobs, expected):
+    monkeypatch.setattr(piso.util.os, "cpu_count", lambda: 4)
+    assert piso.util._n_workers(n_jobs) == expected
+
+
+def test_n_jobs_exception():
+    arrays = [make_ia1(False, "right"), make_ia2(False, "right")]
+    with pytest.raises(ValueError, match="n_jobs"):
+        piso_intervalarray.union(*arrays, n_jobs=0)
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "seed",
+    [0, 1, 2, 3],
+)
+def test_isdisjoint_matches_stairs(closed, seed):
+    rng = np.random.default_rng(seed)
+    # the operands are disjoint when seed is 0
+    lefts = rng.choice(2000, 60, replace=False) * 10
+    rights = lefts + rng.integers(1, 10 + 100 * seed, 60)
+    arrays = [
+        pd.arrays.IntervalArray.from_arrays(
+            lefts[i : i + 20], rights[i : i + 20], closed=closed
+        )
+        for i in (0, 20, 40)
+    ]
+    result = piso.isdisjoint(*arrays)
+    stairs = [piso.util._interval_x_to_stairs(arr).make_boolean() for arr in arrays]
+    assert result == (sc.sum(stairs).max() <= 1)
+
+
+@pytest.mark.parametrize(
+    "collision, expected_blocks",
+    [(None, 5), (13, 4), (2, 1)],
+)
+def test_operands_disjoint_blocks(monkeypatch, collision, expected_blocks):
+    # operands interleave, so that each block of 4 intervals of the first contains intervals of the second
+    lefts = np.arange(20) * 10
+    rights = lefts + 4
+    other_lefts, other_rights = lefts + 5, rights + 5
+    if collision is not None:
+        other_lefts[collision] -= 2
+    calls = []
+    original = piso._sweep._is_disjoint
+
+    def is_disjoint(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(piso._sweep, "_is_disjoint", is_disjoint)
+    result = piso._sweep._operands_disjoint(
+        np.concatenate([lefts, other_lefts]),
+        np.concatenate([rights, other_rights]),
+        [20, 20],
+        [True, False],
+        block_size=4,
+    )
+    assert result == (collision is None)
+    assert len(calls) == expected_blocks
+
+
 def map_to_dates(interval_array, date_type):
     def make_date(x):
         ts = pd.Timestamp(f"2021-10-{x}")
@@ -615,3 +767,76 @@ def test_issubset(interval_index, ia_makers, squeeze, expected, closed, how):
     )
     equal_op = np.array_equal if isinstance(expected, np.ndarray) else operator.eq
     assert equal_op(result, expected)
+
+
+@pytest.mark.parametrize(
+    "function",
+    [piso_intervalarray.issuperset, piso_intervalarray.issubset],
+)
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "how",
+    ["supplied", "accessor", "package"],
+)
+def test_is_super_or_subset_groups(function, closed, how):
+    ia = pd.arrays.IntervalArray.from_tuples(
+        [(0, 4), (2, 5), (4, 7), (8, 11), (3, 4), (2, 4), (0, 4), (5, 6), (6, 7)],
+        closed=closed,
+    )
+    groups = ["c", "c", "c", "c", "b", "b", "a", "a", "a"]
+    reference = make_ia1(False, closed)
+    result = perform_op(reference, ia, how=how, function=function, groups=groups)
+    expected = pd.Series(
+        function(reference, ia[6:], ia[4:6], ia[:4], squeeze=False),
+        index=["a", "b", "c"],
+    )
+    pd.testing.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "seed",
+    [0, 1],
+)
+def test_is_super_or_subset_match_stairs(closed, seed):
+    rng = np.random.default_rng(seed)
+    reference = make_random_ia(rng, closed, disjoint=False)
+    candidates = []
+    for i in range(50):
+        lefts = rng.integers(0, 1000, rng.integers(0, 4))
+        rights = lefts + rng.integers(1, 50, len(lefts))
+        if i % 2:
+            # drop some of the reference, so that the candidate may or may not be a superset
+            keep = rng.random(len(reference)) < 0.95
+            lefts = np.append(lefts, reference.left[keep])
+            rights = np.append(rights, reference.right[keep])
+        candidates.append(
+            pd.arrays.IntervalArray.from_arrays(lefts, rights, closed=closed)
+        )
+    stairs = piso.util._interval_x_to_stairs(reference).make_boolean()
+    candidate_stairs = [
+        piso.util._interval_x_to_stairs(arr).make_boolean() if len(arr) else sc.Stairs()
+        for arr in candidates
+    ]
+    np.testing.assert_array_equal(
+        piso.issuperset(reference, *candidates),
+        [bool(stairs.ge(other)) for other in candidate_stairs],
+    )
+    np.testing.assert_array_equal(
+        piso.issubset(reference, *candidates),
+        [bool(stairs.le(other)) for other in candidate_stairs],
+    )
+
+
+def test_is_super_or_subset_groups_exception():
+    ia = make_ia1(False, "right")
+    with pytest.raises(ValueError):
+        piso.issuperset(ia, ia, ia, groups=[0] * len(ia))
+    with pytest.raises(ValueError):
+        piso.issubset(ia, ia, groups=[0])
@@ -104,6 +104,32 @@ def test_lookup_series(x, closed, date_type, a_col):
     )
 
 
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right", "both", "neither"],
+)
+@pytest.mark.parametrize(
+    "monotonic",
+    [True, False],
+)
+def test_lookup_matches_get_indexer(closed, monotonic):
+    rng = np.random.default_rng(0)
+    breaks = np.sort(rng.choice(100, 20, replace=False))
+    index = pd.IntervalIndex.from_arrays(breaks[::2], breaks[1::2], closed=closed)
+    if not monotonic:
+        index = index[::-1]
+    df = pd.DataFrame(
+        {"A": np.arange(10), "B": pd.date_range("2021", periods=10, tz="UTC")},
+        index=index,
+    )
+    x = np.append(breaks, rng.uniform(-5, 105, 20))
+    result = piso.lookup(df, x)
+    indexer = index.get_indexer(x)
+    expected = df.iloc[np.maximum(indexer, 0)].set_axis(x)
+    expected.loc[indexer == -1] = np.nan
+    pd.testing.assert_frame_equal(result, expected)
+
+
 def test_lookup_exception():
     df = pd.DataFrame([1, 2, 3])
     with pytest.raises(ValueError):
@@ -465,6 +491,65 @@ def test_join_series_rsuffix(closed, date_type, how):
     pd.testing.assert_frame_equal(result, expected, check_dtype=False, check_like=True)
 
 
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "how",
+    ["left", "right", "inner", "outer"],
+)
+def test_join_unsorted_index(closed, how):
+    ndframe = make_ndframe(True, closed, None)
+    ndframe2 = make_ndframe2(True, closed, None)
+    result = piso.join(ndframe.iloc[::-1], ndframe2.iloc[::-1], how=how)
+    expected = piso.join(ndframe, ndframe2, how=how)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "sort",
+    [True, False],
+)
+def test_join_outer_three_frames(sort):
+    df1 = pd.DataFrame({"A": [1, 2]}, index=pd.IntervalIndex.from_breaks([4, 5, 6]))
+    df2 = pd.DataFrame({"B": [3, 4]}, index=pd.IntervalIndex.from_breaks([0, 1, 2]))
+    df3 = pd.DataFrame({"C": [5]}, index=pd.IntervalIndex.from_breaks([1, 4]))
+    result = piso.join(df1, df2, df3, how="outer", sort=sort)
+    expected = pd.DataFrame(
+        {
+            "A": [np.nan, np.nan, np.nan, 1, 2],
+            "B": [3, 4, np.nan, np.nan, np.nan],
+            "C": [np.nan, 5, 5, np.nan, np.nan],
+        },
+        index=pd.IntervalIndex.from_breaks([0, 1, 2, 4, 5, 6]),
+    )
+    if not sort:
+        expected = expected.iloc[[3, 4, 0, 1, 2]]
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "how",
+    ["left", "right", "inner", "outer"],
+)
+def test_join_n_jobs(how):
+    ndframe = make_ndframe(True, "right", None)
+    ndframe2 = make_ndframe2(True, "right", None)
+    result = piso.join(
+        ndframe.iloc[::-1],
+        ndframe2,
+        ndframe,
+        how=how,
+        suffixes=["_1", "_2", "_3"],
+        n_jobs=2,
+    )
+    expected = piso.join(
+        ndframe.iloc[::-1], ndframe2, ndframe, how=how, suffixes=["_1", "_2", "_3"]
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
 # ---------- join exceptions ---------------------------------
 
 
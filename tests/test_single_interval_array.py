@@ -163,6 +163,36 @@ def test_union(closed, interval_index, return_type, method):
     )
 
 
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "date_type",
+    ["timestamp", "timedelta", None],
+)
+@pytest.mark.parametrize(
+    "seed",
+    [0, 1, 2],
+)
+def test_union_matches_stairs(closed, date_type, seed):
+    rng = np.random.default_rng(seed)
+    lefts = rng.integers(0, 1000, 500)
+    rights = lefts + rng.integers(1, 10, 500)
+    interval_array = pd.arrays.IntervalArray.from_arrays(lefts, rights, closed=closed)
+    interval_array = map_to_dates(interval_array, date_type)
+    result = piso_intervalarray.union(interval_array)
+    expected = piso.util._boolean_stairs_to_interval_array(
+        piso.util._interval_x_to_stairs(interval_array).make_boolean(),
+        pd.arrays.IntervalArray,
+    )
+    assert_interval_array_equal(
+        result,
+        expected,
+        interval_index=False,
+    )
+
+
 @pytest.mark.parametrize(
     "closed",
     ["left", "right"],
@@ -510,6 +540,8 @@ def map_to_dates(obj, date_type):
         ([(1, 2), (3, 4), (5, 6)], True),
         ([(1, 3), (2, 4), (5, 6)], False),
         ([(1, 4), (2, 3), (5, 6)], False),
+        ([(3, 4), (1, 2)], True),
+        ([(5, 6), (2, 4), (1, 3)], False),
     ],
 )
 @pytest.mark.parametrize(
@@ -552,6 +584,8 @@ def test_isdisjoint_left_right_neither(
         ([(1, 2), (3, 4), (5, 6)], True),
         ([(1, 3), (2, 4), (5, 6)], False),
         ([(1, 4), (2, 3), (5, 6)], False),
+        ([(3, 4), (1, 2)], True),
+        ([(2, 3), (1, 2)], False),
     ],
 )
 @pytest.mark.parametrize(
@@ -656,6 +690,90 @@ def test_coverage_bins(interval_index, domain_interval_index, closed, method, ho
     pd.testing.assert_series_equal(result, expected)
 
 
+@pytest.mark.parametrize(
+    "how",
+    ["fraction", "sum"],
+)
+@pytest.mark.parametrize(
+    "seed",
+    [0, 1],
+)
+def test_coverage_bins_matches_stairs(how, seed):
+    rng = np.random.default_rng(seed)
+    lefts = rng.uniform(0, 100, 50)
+    ia = pd.arrays.IntervalArray.from_arrays(lefts, lefts + rng.uniform(0, 10, 50))
+    breaks = np.sort(rng.choice(np.arange(-10, 120, 0.5), 40, replace=False))
+    domain = pd.IntervalIndex.from_arrays(breaks[::2], breaks[1::2])
+    result = piso_intervalarray.coverage(ia, domain, bins=True, how=how)
+    sliced = piso.util._interval_x_to_stairs(ia).make_boolean().slice(domain)
+    expected = sliced.mean() if how == "fraction" else sliced.integral()
+    pd.testing.assert_series_equal(result, expected, check_names=False)
+
+
+@pytest.mark.parametrize(
+    "bins",
+    [True, False],
+)
+def test_coverage_n_jobs(bins):
+    rng = np.random.default_rng(0)
+    lefts = rng.uniform(0, 100, 50)
+    ia = pd.arrays.IntervalArray.from_arrays(lefts, lefts + rng.uniform(0, 10, 50))
+    domain = pd.IntervalIndex.from_breaks(np.arange(-10, 120, 13))
+    result = piso_intervalarray.coverage(ia, domain, bins=bins, n_jobs=2)
+    expected = piso_intervalarray.coverage(ia, domain, bins=bins)
+    if bins:
+        pd.testing.assert_series_equal(result, expected)
+    else:
+        assert result == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "interval_index",
+    [True, False],
+)
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "method",
+    ["supplied", "accessor", "package"],
+)
+@pytest.mark.parametrize(
+    "how",
+    ["fraction", "sum"],
+)
+def test_coverage_overlapping_bins(interval_index, closed, method, how):
+    domain = pd.arrays.IntervalArray.from_tuples(
+        [(3, 7), (0, 2), (1, 8), (3, 7), (12, 14)],
+        closed=closed,
+    )
+    ia = make_ia1(interval_index, closed)
+    result = perform_op(
+        ia,
+        method=method,
+        function=piso_intervalarray.coverage,
+        domain=domain,
+        bins="overlapping",
+        how=how,
+    )
+    values = [piso_intervalarray.coverage(ia, interval, how=how) for interval in domain]
+    expected = pd.Series(values, index=pd.IntervalIndex(domain), dtype=float)
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_coverage_bins_timestamps():
+    ia = map_to_dates(make_ia1(False, "right"), "timestamp")
+    domain = map_to_dates(
+        pd.arrays.IntervalArray.from_tuples([(1, 3), (4, 8), (9, 11)]), "timestamp"
+    )
+    result = piso_intervalarray.coverage(ia, domain, bins=True, how="sum")
+    expected = pd.Series(
+        pd.to_timedelta([2, 3, 1], unit="D"), index=pd.IntervalIndex(domain)
+    )
+    pd.testing.assert_series_equal(result, expected)
+
+
 @pytest.mark.parametrize(
     "interval_index",
     [True, False],
@@ -715,7 +833,11 @@ def test_coverage_exception(interval_index, closed, method):
     "method",
     ["supplied", "accessor", "package"],
 )
-def test_coverage_exception2(interval_index, closed, method):
+@pytest.mark.parametrize(
+    "bins",
+    [True, "overlapping"],
+)
+def test_coverage_exception2(interval_index, closed, method, bins):
     domain = (1, 2)
     with pytest.raises(ValueError):
         ia = make_ia1(interval_index, closed)
@@ -724,7 +846,7 @@ def test_coverage_exception2(interval_index, closed, method):
             method=method,
             function=piso_intervalarray.coverage,
             domain=domain,
-            bins=True,
+            bins=bins,
         )
 
 
@@ -933,6 +1055,90 @@ def test_contains_non_cartesian(
         assert (result == expected_result).all()
 
 
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right", "both", "neither"],
+)
+@pytest.mark.parametrize("result_type", ["points", "intervals"])
+@pytest.mark.parametrize("how", ["any", "all"])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_contains_non_cartesian_matches_cartesian(closed, result_type, how, seed):
+    # includes degenerate intervals, and duplicated points on interval endpoints
+    rng = np.random.default_rng(seed)
+    lefts = rng.integers(0, 30, 20)
+    rights = lefts + rng.integers(0, 4, 20)
+    ia = pd.arrays.IntervalArray.from_arrays(lefts, rights, closed=closed)
+    x = rng.integers(0, 35, 15)
+    result = piso_intervalarray.contains(
+        ia, x, include_index=False, result=result_type, how=how
+    )
+    cartesian = piso_intervalarray.contains(ia, x, include_index=False)
+    axis = 0 if result_type == "points" else 1
+    logical_func = np.all if how == "all" else np.any
+    np.testing.assert_array_equal(result, logical_func(cartesian, axis=axis))
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right", "both", "neither"],
+)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_contains_sparse_matches_cartesian(closed, seed):
+    rng = np.random.default_rng(seed)
+    lefts = rng.integers(0, 30, 20)
+    rights = lefts + rng.integers(0, 4, 20)
+    ia = pd.arrays.IntervalArray.from_arrays(lefts, rights, closed=closed)
+    x = rng.integers(0, 35, 15)
+    interval_positions, point_positions = piso_intervalarray.contains(
+        ia, x, include_index=False, result="sparse"
+    )
+    cartesian = piso_intervalarray.contains(ia, x, include_index=False)
+    assert (np.diff(interval_positions) >= 0).all()
+    assert sorted(zip(interval_positions, point_positions)) == sorted(
+        zip(*np.nonzero(cartesian))
+    )
+
+
+@pytest.mark.parametrize(
+    "interval_index",
+    [True, False],
+)
+@pytest.mark.parametrize(
+    "method",
+    ["supplied", "accessor", "package"],
+)
+def test_contains_sparse(interval_index, method):
+    ia = make_ia2(interval_index, "right")
+    result = perform_op(
+        ia,
+        [2, 4, 5],
+        method=method,
+        function=piso_intervalarray.contains,
+        result="sparse",
+    )
+    expected = pd.DataFrame(
+        {
+            "interval": pd.arrays.IntervalArray.from_tuples(
+                [(0, 4), (0, 4), (2, 5), (2, 5), (3, 6), (3, 6)]
+            ),
+            "point": [2, 4, 4, 5, 4, 5],
+        }
+    )
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_contains_sparse_interval_set():
+    interval_set = piso.IntervalSet.from_arrays([0, 3], [2, 6])
+    result = piso.contains(interval_set, [1, 4], result="sparse")
+    expected = pd.DataFrame(
+        {
+            "interval": pd.arrays.IntervalArray.from_tuples([(0, 2), (3, 6)]),
+            "point": [1, 4],
+        }
+    )
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
 @pytest.mark.parametrize(
     "interval_index",
     [True, False],
@@ -982,6 +1188,41 @@ def test_split(interval_index, x, expected_tuples, closed, method, date_type):
     )
 
 
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right", "both", "neither"],
+)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_split_random(closed, seed):
+    rng = np.random.default_rng(seed)
+    lefts = rng.integers(0, 30, 20)
+    rights = lefts + rng.integers(0, 6, 20)
+    ia = pd.arrays.IntervalArray.from_arrays(lefts, rights, closed=closed)
+    x = rng.integers(0, 35, 10)
+
+    expected_tuples = []
+    for left, right in zip(lefts, rights):
+        breaks = [left] + sorted({p for p in x if left < p < right}) + [right]
+        expected_tuples.extend(zip(breaks[:-1], breaks[1:]))
+    expected = make_ia_from_tuples(False, expected_tuples, closed)
+
+    result = piso_intervalarray.split(ia, x)
+    assert_interval_array_equal(result, expected, interval_index=False)
+
+
+def test_split_tz_aware():
+    ia = pd.arrays.IntervalArray.from_arrays(
+        pd.DatetimeIndex(["2021-10-01", "2021-10-03"], tz="UTC"),
+        pd.DatetimeIndex(["2021-10-04", "2021-10-05"], tz="UTC"),
+    )
+    result = piso_intervalarray.split(ia, pd.Timestamp("2021-10-02", tz="UTC"))
+    expected = pd.arrays.IntervalArray.from_arrays(
+        pd.DatetimeIndex(["2021-10-01", "2021-10-02", "2021-10-03"], tz="UTC"),
+        pd.DatetimeIndex(["2021-10-02", "2021-10-04", "2021-10-05"], tz="UTC"),
+    )
+    pd._testing.assert_interval_array_equal(result, expected)
+
+
 @pytest.mark.parametrize(
     "interval_index",
     [True, False],
@@ -1026,3 +1267,146 @@ def test_bridge(interval_index, threshold, expected_tuples, closed, method, date
         expected,
         interval_index,
     )
+
+
+@pytest.mark.parametrize(
+    "interval_index",
+    [True, False],
+)
+@pytest.mark.parametrize(
+    "threshold, expected_a, expected_b",
+    [
+        (1, [(0, 4), (7, 8), (10, 12)], [(1, 5), (9, 10)]),
+        ({"a": 2, "b": 0}, [(0, 4), (7, 12)], [(1, 2), (3, 5), (9, 10)]),
+        ({"a": 0, "b": 5}, [(0, 4), (7, 8), (10, 12)], [(1, 10)]),
+    ],
+)
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "method",
+    ["supplied", "accessor", "package"],
+)
+@pytest.mark.parametrize(
+    "date_type",
+    ["timestamp", "timedelta", None],
+)
+def test_bridge_groups(
+    interval_index, threshold, expected_a, expected_b, closed, method, date_type
+):
+    ia = make_ia_from_tuples(
+        interval_index,
+        [(9, 10), (0, 4), (3, 5), (7, 8), (1, 2), (10, 12)],
+        closed,
+    )
+    ia = map_to_dates(ia, date_type)
+    groups = ["b", "a", "b", "a", "b", "a"]
+
+    expected = make_ia_from_tuples(False, expected_a + expected_b, closed)
+    expected = map_to_dates(expected, date_type)
+    if date_type is not None:
+
+        def to_timedelta(value):
+            return map_to_dates([value + 1], "timedelta")[0]
+
+        if isinstance(threshold, dict):
+            threshold = {key: to_timedelta(value) for key, value in threshold.items()}
+        else:
+            threshold = to_timedelta(threshold)
+
+    result = perform_op(
+        ia,
+        threshold,
+        method=method,
+        function=piso_intervalarray.bridge,
+        groups=groups,
+    )
+    assert list(result.index) == ["a"] * len(expected_a) + ["b"] * len(expected_b)
+    assert_interval_array_equal(result.array, expected, interval_index=False)
+
+
+def test_bridge_groups_exception():
+    ia = make_ia1(False, "right")
+    with pytest.raises(ValueError):
+        piso_intervalarray.bridge(ia, 1, groups=[0])
+    with pytest.raises(ValueError):
+        piso_intervalarray.bridge(ia, {0: 1}, groups=[0, 0, 0, 1, 1, 1])
+
+
+@pytest.mark.parametrize(
+    "function, kwargs",
+    [
+        (piso_intervalarray.union, {}),
+        (piso_intervalarray.intersection, {}),
+        (piso_intervalarray.intersection, {"min_overlaps": 2}),
+        (piso_intervalarray.complement, {}),
+        (piso_intervalarray.complement, {"domain": "tuple"}),
+        (piso_intervalarray.complement, {"domain": "array"}),
+        (piso_intervalarray.coverage, {}),
+        (piso_intervalarray.coverage, {"domain": "array"}),
+        (piso_intervalarray.coverage, {"domain": "tuple", "how": "sum"}),
+    ],
+)
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "method",
+    ["supplied", "accessor", "package"],
+)
+@pytest.mark.parametrize(
+    "date_type",
+    ["timestamp", None],
+)
+@pytest.mark.parametrize(
+    "seed",
+    [0, 1],
+)
+def test_groups_matches_per_group(function, kwargs, closed, method, date_type, seed):
+    rng = np.random.default_rng(seed)
+    lefts = rng.integers(0, 100, 40)
+    ia = pd.arrays.IntervalArray.from_arrays(
+        lefts, lefts + rng.integers(1, 20, 40), closed=closed
+    )
+    ia = map_to_dates(ia, date_type)
+    groups = rng.choice(["a", "b", "c", None], 40)
+    domain = kwargs.get("domain")
+    if domain == "tuple":
+        domain = tuple(map_to_dates([10, 90], date_type))
+    elif domain == "array":
+        domain = make_ia_from_tuples(False, [(0, 30), (20, 40), (60, 120)], closed)
+        domain = map_to_dates(domain, date_type)
+    kwargs = {**kwargs, "domain": domain} if "domain" in kwargs else kwargs
+
+    result = perform_op(ia, method=method, function=function, groups=groups, **kwargs)
+    labels = sorted(set(groups) - {None})
+    for label in labels:
+        expected = function(ia[groups == label], **kwargs)
+        if function is piso_intervalarray.coverage:
+            assert result[label] == expected or np.isclose(result[label], expected)
+        else:
+            assert_interval_array_equal(
+                result[result.index == label].array,
+                expected,
+                interval_index=False,
+            )
+    if function is piso_intervalarray.coverage:
+        assert list(result.index) == labels
+    else:
+        assert set(result.index) <= set(labels)
+
+
+def test_groups_exception():
+    ia = make_ia1(False, "right")
+    groups = [0, 0, 0, 1, 1, 1]
+    with pytest.raises(ValueError):
+        piso_intervalarray.union(ia, groups=[0])
+    with pytest.raises(ValueError):
+        piso_intervalarray.union(ia, ia, groups=groups)
+    with pytest.raises(ValueError):
+        piso_intervalarray.intersection(ia, groups=groups, n_jobs=2)
+    with pytest.raises(ValueError):
+        piso_intervalarray.coverage(ia, ia, bins=True, groups=groups)
@@ -0,0 +1,162 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import piso
+import piso.stream
+
+
+def make_frame(rng, n, name, closed, dates):
+    breaks = np.sort(rng.choice(200, size=n + 1, replace=False))
+    keep = rng.random(n) < 0.6
+    index = pd.IntervalIndex.from_breaks(breaks, closed=closed)[keep]
+    if dates:
+        index = pd.IntervalIndex.from_arrays(
+            pd.Timestamp("2021") + pd.to_timedelta(index.left, unit="h"),
+            pd.Timestamp("2021") + pd.to_timedelta(index.right, unit="h"),
+            closed=closed,
+        )
+    return pd.DataFrame(
+        {name: rng.integers(100, size=len(index)), "shared": rng.random(len(index))},
+        index=index,
+    )
+
+
+def chunked(frame, size):
+    return (frame.iloc[i : i + size] for i in range(0, max(len(frame), 1), size))
+
+
+@pytest.mark.parametrize("how", ["left", "right", "inner", "outer"])
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("dates", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_join_matches_join(how, closed, dates, chunk_size):
+    rng = np.random.default_rng(chunk_size)
+    frames = [
+        make_frame(rng, n, name, closed, dates)
+        for n, name in zip([30, 20, 40], ["A", "B", "C"])
+    ]
+    suffixes = ["_1", "_2", "_3"]
+    result = pd.concat(
+        piso.stream.join(
+            *(chunked(frame, chunk_size) for frame in frames),
+            how=how,
+            suffixes=suffixes,
+        )
+    )
+    expected = piso.join(*frames, how=how, suffixes=suffixes, sort=True)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_join_series():
+    df = pd.DataFrame(
+        {"A": [4, 3]},
+        index=pd.IntervalIndex.from_tuples([(1, 3), (5, 7)]),
+    )
+    s = pd.Series(
+        [True, False],
+        index=pd.IntervalIndex.from_tuples([(2, 4), (5, 6)]),
+        name="C",
+    )
+    result = pd.concat(piso.stream.join(chunked(df, 1), chunked(s, 1), how="inner"))
+    expected = pd.DataFrame(
+        {"A": [4, 3], "C": [True, False]},
+        index=pd.IntervalIndex.from_tuples([(2, 3), (5, 6)]),
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_join_is_lazy():
+    consumed = []
+
+    def chunks(name, breaks):
+        for left, right in zip(breaks[:-1], breaks[1:]):
+            consumed.append((name, left))
+            yield pd.DataFrame(
+                {name: [left]}, index=pd.IntervalIndex.from_tuples([(left, right)])
+            )
+
+    stream = piso.stream.join(chunks("A", range(100)), chunks("B", range(100)))
+    result = next(stream)
+    assert len(consumed) < 10
+    assert result.index[0] == pd.Interval(0, 1)
+
+
+def test_join_exception_unordered():
+    df = pd.DataFrame({"A": [1, 2]}, index=pd.IntervalIndex.from_breaks([0, 1, 2]))
+    with pytest.raises(ValueError):
+        list(piso.stream.join([df.iloc[1:], df.iloc[:1]], [df]))
+
+
+def test_join_exception_empty_iterable():
+    df = pd.DataFrame({"A": [1, 2]}, index=pd.IntervalIndex.from_breaks([0, 1, 2]))
+    with pytest.raises(ValueError):
+        list(piso.stream.join([df], []))
+
+
+def test_join_exception_one_operand():
+    df = pd.DataFrame({"A": [1, 2]}, index=pd.IntervalIndex.from_breaks([0, 1, 2]))
+    with pytest.raises(ValueError):
+        list(piso.stream.join([df]))
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+@pytest.mark.parametrize("dates", [False, True])
+def test_union_matches_union(closed, chunk_size, dates):
+    rng = np.random.default_rng(chunk_size)
+    lefts = np.sort(rng.integers(1000, size=300))
+    index = pd.IntervalIndex.from_arrays(
+        lefts, lefts + rng.integers(1, 10, size=300), closed=closed
+    )
+    if dates:
+        index = pd.IntervalIndex.from_arrays(
+            pd.Timestamp("2021", tz="UTC") + pd.to_timedelta(index.left, unit="h"),
+            pd.Timestamp("2021", tz="UTC") + pd.to_timedelta(index.right, unit="h"),
+            closed=closed,
+        )
+    # intervals within a chunk need not be sorted
+    chunks = [index[i : i + chunk_size][::-1] for i in range(0, len(index), chunk_size)]
+    results = list(piso.stream.union(chunks))
+    assert all(isinstance(result, pd.IntervalIndex) for result in results)
+    pd.testing.assert_index_equal(
+        results[0].append(results[1:]), piso.union(index), exact=False
+    )
+
+
+def test_union_interval_set():
+    chunks = [
+        piso.IntervalSet.from_arrays([0, 2], [1, 3]),
+        pd.arrays.IntervalArray.from_tuples([(3, 4), (6, 7)]),
+    ]
+    results = list(piso.stream.union(chunks))
+    assert results == [
+        piso.IntervalSet.from_arrays([0], [1]),
+        piso.IntervalSet.from_arrays([2], [4]),
+        piso.IntervalSet.from_arrays([6], [7]),
+    ]
+
+
+def test_union_is_lazy():
+    def chunks():
+        for left in itertools.count(step=2):
+            yield pd.arrays.IntervalArray.from_tuples([(left, left + 1)])
+
+    stream = piso.stream.union(chunks())
+    assert next(stream)[0] == pd.Interval(0, 1)
+    assert next(stream)[0] == pd.Interval(2, 3)
+
+
+def test_union_empty():
+    assert list(piso.stream.union([])) == []
+
+
+def test_union_exception_unordered():
+    chunks = [
+        pd.arrays.IntervalArray.from_tuples([(3, 4)]),
+        pd.arrays.IntervalArray.from_tuples([(1, 2)]),
+    ]
+    with pytest.raises(ValueError):
+        list(piso.stream.union(chunks))